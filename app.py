@@ -1,92 +1,167 @@
 import sys
 import os
-from flask import Flask, request, render_template, jsonify
-from io import BytesIO
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Image
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.pagesizes import A4
-import base64
-
-# URL extraction libs
-from newspaper import Article
-import requests
-from bs4 import BeautifulSoup
+import hmac
+import time
+from flask import Flask, Response, g, request, render_template, jsonify, stream_with_context
 
 # Ensure project root is in path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from src.inference.predictor import FakeNewsPredictor
 from src.api.analytics import get_sentiment, get_domain_trust, get_readability_stats
-from src.api.batch import process_batch_items
+from src.api.batch import process_batch_items, stream_batch_results
+from src.api.url_extractor import URLExtractor
+from src.api.result_cache import PredictionCache
+from src.api.jobs import JobStore, JobRunner, JOB_WORKERS, JOB_MAX_ITEMS, FINISHED
+from src.preprocessing.analysis_document import AnalysisDocument
+from src.api.reports import build_report, build_batch_report, spooled_pdf, REPORT_MAX_ITEMS
+from src.api.diagnostics import SlowRequestLog, round_timings, truncate_input
+from src.api.stats import ServedStats, StatsUnavailable, STATS_MAX_AGE
+from src.utils.metrics import stage, record_request, render_metrics, track_timings
+from src.utils.deadline import Deadline
 
 app = Flask(__name__)
 predictor = FakeNewsPredictor()
+url_extractor = URLExtractor()
+result_cache = PredictionCache(predictor.model_dir, loaded_version=predictor.artifact_version)
+# Evaluation/EDA stats of the loaded model, read once from its snapshot
+served_stats = ServedStats(predictor.model_dir, predictor.artifact_version)
+
+# Upper bound for /batch-predict; scoring is vectorized, so this is about
+# request size rather than model cost.
+BATCH_MAX_ITEMS = int(os.environ.get("BATCH_MAX_ITEMS", "5000"))
+
+# Background batch jobs. The job workers are started once per server, by
+# gunicorn's master (gunicorn.conf.py) or the development server below,
+# never by importing this module.
+job_store = JobStore()
+
+# Requests over SLOW_REQUEST_MS, readable at /admin/slow-requests
+slow_requests = SlowRequestLog()
+# Required (X-Admin-Token header) for /admin endpoints; without it they
+# only answer local requests
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN")
+
+# ---------------- METRICS ----------------
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+    g.timings = track_timings()
+
+
+@app.after_request
+def record_request_latency(response):
+    start = g.get("request_start")
+    if start is not None:
+        elapsed = time.perf_counter() - start
+        record_request(request.endpoint, request.method, response.status_code, elapsed)
+        slow_requests.record(
+            request.endpoint, response.status_code, elapsed * 1000,
+            g.timings, g.get("diagnostics")
+        )
+    return response
+
+
+def with_timings(response):
+    """
+    Copy of a response dict with the current request's stage timings (ms).
+    """
+    timings = round_timings(g.timings)
+    timings["total"] = round((time.perf_counter() - g.request_start) * 1000, 2)
+    return dict(response, timings=timings)
+
+
+@app.route("/metrics")
+def metrics():
+    body, content_type = render_metrics()
+    return Response(body, content_type=content_type)
+
+
+# ---------------- ADMIN ----------------
+def admin_allowed():
+    if ADMIN_TOKEN:
+        return hmac.compare_digest(request.headers.get("X-Admin-Token", ""), ADMIN_TOKEN)
+    return request.remote_addr in ("127.0.0.1", "::1")
+
+
+@app.route("/admin/slow-requests")
+def slow_request_log():
+    if not admin_allowed():
+        return jsonify({"error": "Forbidden."}), 403
+
+    return jsonify({
+        "pid": os.getpid(),
+        "threshold_ms": slow_requests.threshold_ms,
+        "recorded": slow_requests.recorded,
+        "entries": slow_requests.entries(request.args.get("limit", type=int))
+    })
+
 
 # ---------------- HEALTH / INFO ----------------
 @app.route("/health")
 def health():
     return jsonify({"status": "healthy", "version": "2.0.0", "engine": "ML-Logic-Hybrid"})
 
+def stats_response(section_name):
+    """
+    One snapshot section as a cacheable response: 304 when the client's
+    If-None-Match still matches, 503 when the served model has no stats.
+    """
+    try:
+        section = served_stats.section(section_name)
+    except StatsUnavailable as e:
+        response = jsonify({"error": str(e), "model_version": served_stats.model_version})
+        response.status_code = 503
+        response.cache_control.no_store = True
+        return response
+
+    payload = dict(section["stats"])
+    payload.update(model_version=served_stats.model_version, generated_at=section["generated_at"])
+
+    response = jsonify(payload)
+    response.set_etag(served_stats.etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = STATS_MAX_AGE
+    return response.make_conditional(request)
+
+
 @app.route("/model-stats")
 def model_stats():
-    # Mocking extraction from EDA/Model evaluation
-    return jsonify({
-        "accuracy": 0.942,
-        "precision": 0.935,
-        "recall": 0.921,
-        "f1": 0.928,
-        "last_trained": "2026-01-24",
-        "sample_size": 64236,
-        "confusion_matrix": {
-            "tp": 29840, "fp": 2100,
-            "fn": 2340, "tn": 29956
-        }
-    })
+    # Metrics from the evaluation step, for the model currently loaded
+    return stats_response("model")
+
 
 @app.route("/eda-stats")
 def eda_stats():
-    # Integrated data distribution stats from notebooks
-    return jsonify({
-        "label_distribution": {"Fake": 32000, "Real": 32236},
-        "top_keywords": [
-            {"text": "Breaking", "value": 120},
-            {"text": "Official", "value": 85},
-            {"text": "Source", "value": 70},
-            {"text": "Watch", "value": 95},
-            {"text": "News", "value": 200}
-        ],
-        "sentiment_avg": 0.05,
-        "avg_word_count": 450
-    })
+    # Dataset stats from the EDA step of the same training run
+    return stats_response("eda")
 
 
 # ---------------- ROBUST URL EXTRACTION ----------------
-def extract_text_from_url(url):
-    # 1️⃣ Try newspaper3k
-    try:
-        article = Article(url)
-        article.download()
-        article.parse()
-        text = article.text.strip()
-        if len(text) > 200:
-            return text
-    except Exception as e:
-        print("Newspaper failed:", e)
+def extract_text_from_url(url, deadline=None):
+    # One pooled download shared by newspaper3k and the BeautifulSoup
+    # fallback; repeat URLs are answered from the content cache.
+    timeout = deadline.timeout(url_extractor.timeout) if deadline else None
+    with stage("url_extraction"):
+        return url_extractor.extract(url, timeout=timeout)
 
-    # 2️⃣ Fallback: BeautifulSoup
-    try:
-        headers = {"User-Agent": "Mozilla/5.0"}
-        resp = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(resp.text, "html.parser")
 
-        paragraphs = [p.get_text(" ", strip=True) for p in soup.find_all("p")]
-        text = " ".join(paragraphs).strip()
+def optional_sentiment(doc, deadline):
+    if deadline is None or deadline.allows("sentiment"):
+        sentiment_score, sentiment_label = get_sentiment(doc)
+        return {"score": sentiment_score, "label": sentiment_label}
+    return {"score": None, "label": "Skipped"}
 
-        if len(text) > 200:
-            return text
-    except Exception as e:
-        print("BeautifulSoup failed:", e)
 
-    return ""
+def optional_display_translation(text, target_lang, deadline):
+    translator = predictor.translator
+    if not translator.needs_target_translation(text, target_lang):
+        return text
+    if deadline is not None and not deadline.allows("display_translation"):
+        return text
+
+    timeout = deadline.timeout(translator.timeout) if deadline else None
+    with stage("display_translation"):
+        return translator.translate_to_target(text, target_lang, timeout=timeout)
 
 
 # ---------------- HOME ----------------
@@ -102,26 +177,53 @@ def predict_api():
     text = data.get("text", "").strip()
     is_url = data.get("is_url", False)
     target_lang = data.get("target_lang", "en") # 'en', 'hi', or 'te'
+    # adds per-stage timings (ms) to the response
+    debug = bool(data.get("debug")) or request.args.get("debug") in ("1", "true")
+
+    # latency budget from the request start; optional stages are dropped
+    # (and listed in degraded_stages) once it runs low
+    try:
+        deadline = Deadline.from_request(
+            data.get("budget_ms", request.args.get("budget_ms")), start=g.request_start
+        )
+    except (TypeError, ValueError):
+        return jsonify({"error": "budget_ms must be a number."}), 400
+
+    # kept with the request if it ends up in the slow request log
+    g.diagnostics = diagnostics = {
+        "input": truncate_input(text),
+        "is_url": is_url,
+        "target_lang": target_lang
+    }
+
+    # Repeat submissions of the same text/URL against the same model
+    cache_key = result_cache.key(text, is_url, target_lang) if text else None
+    cached = result_cache.get(cache_key) if cache_key else None
+    if cached is not None:
+        diagnostics.update(cache="HIT", mode=cached.get("mode"), prediction=cached.get("prediction"))
+        return jsonify(with_timings(cached) if debug else cached), 200, {"X-Cache": "HIT"}
 
     try:
         # -------- URL INPUT --------
         if is_url:
-            extracted_text = extract_text_from_url(text)
+            extracted_text = extract_text_from_url(text, deadline)
 
             if not extracted_text:
                 return jsonify({
                     "error": "Unable to extract readable content from this URL."
                 }), 400
 
-            result = predictor.predict(extracted_text)
+            # one shared document: tokens/counts are computed once
+            doc = AnalysisDocument(extracted_text)
+            result = predictor.predict(doc, deadline)
 
             # Enrich results with added features
-            sentiment_score, sentiment_label = get_sentiment(extracted_text)
+            sentiment = optional_sentiment(doc, deadline)
             trust_score, trust_label = get_domain_trust(text) # Use original URL for trust check
-            stats = get_readability_stats(extracted_text)
+            stats = get_readability_stats(doc)
 
             # translate extracted text to target language if needed
-            display_text = predictor.translator.translate_to_target(extracted_text, target_lang)
+            display_text = optional_display_translation(extracted_text, target_lang, deadline)
 
             response = {
                 "prediction": result.get("prediction"),
@@ -131,9 +233,10 @@ def predict_api():
                 "risk_level": result.get("risk_level"),
                 "explanation": result.get("explanation"),
                 "keywords": result.get("keywords"),
+                "translation_status": result.get("translation_status"),
                 "extracted_text": display_text,
                 "original_extraction": extracted_text,
-                "sentiment": {"score": sentiment_score, "label": sentiment_label},
+                "sentiment": sentiment,
                 "trust": {"score": trust_score, "label": trust_label},
                 "stats": stats
             }
@@ -145,14 +248,15 @@ def predict_api():
                     "error": "Text too short to analyze."
                 }), 400
 
-            result = predictor.predict(text)
+            doc = AnalysisDocument(text)
+            result = predictor.predict(doc, deadline)
 
             # Enrich results with added features
-            sentiment_score, sentiment_label = get_sentiment(text)
-            stats = get_readability_stats(text)
+            sentiment = optional_sentiment(doc, deadline)
+            stats = get_readability_stats(doc)
             
             # translate input text back to target language if it was originally translated
-            display_text = predictor.translator.translate_to_target(text, target_lang)
+            display_text = optional_display_translation(text, target_lang, deadline)
 
             response = {
                 "prediction": result.get("prediction"),
@@ -162,16 +266,33 @@ def predict_api():
                 "risk_level": result.get("risk_level"),
                 "explanation": result.get("explanation"),
                 "keywords": result.get("keywords"),
+                "translation_status": result.get("translation_status"),
                 "extracted_text": display_text,
-                "sentiment": {"score": sentiment_score, "label": sentiment_label},
+                "sentiment": sentiment,
                 "trust": {"score": 100, "label": "N/A (Direct Text)"}, # No domain to check
                 "stats": stats
             }
 
-        return jsonify(response)
+        degraded_stages = deadline.degraded if deadline else []
+        response["degraded_stages"] = degraded_stages
+
+        diagnostics.update(
+            cache="MISS",
+            mode=result.get("mode"),
+            prediction=result.get("prediction"),
+            decision_path=result.get("explanation"),
+            translation_status=result.get("translation_status"),
+            degraded_stages=degraded_stages
+        )
+
+        # only complete results are reused
+        if not degraded_stages:
+            result_cache.set(cache_key, response)
+        return jsonify(with_timings(response) if debug else response), 200, {"X-Cache": "MISS"}
 
     except Exception as e:
         print("PREDICT ERROR:", e)
+        diagnostics["error"] = repr(e)
         return jsonify({
             "error": "Failed to analyze the provided input."
         }), 500
@@ -185,61 +306,142 @@ def batch_predict():
     
     if not items:
         return jsonify({"error": "No items provided for batch analysis."}), 400
-        
-    # Limit batch size for demo performance
-    if len(items) > 10:
-        return jsonify({"error": "Batch size too large. Limit is 10 items."}), 400
-        
-    result = process_batch_items(predictor, None, items)
+
+    if not isinstance(items, list) or not all(isinstance(i, str) for i in items):
+        return jsonify({"error": "Items must be a list of strings."}), 400
+
+    if len(items) > BATCH_MAX_ITEMS:
+        return jsonify({"error": f"Batch size too large. Limit is {BATCH_MAX_ITEMS} items."}), 400
+
+    g.diagnostics = {"items": len(items)}
+    result = process_batch_items(predictor, None, items, url_extractor=url_extractor)
     return jsonify(result)
 
 
+@app.route("/batch-predict/stream", methods=["POST"])
+def batch_predict_stream():
+    # the body is read lazily while results are written, so the upload
+    # size is unbounded and never held in memory
+    results = stream_batch_results(predictor, request.stream, url_extractor=url_extractor)
+    return Response(stream_with_context(results), mimetype="application/x-ndjson")
+
+
+# ---------------- BATCH JOBS API ----------------
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    data = request.get_json(silent=True) or {}
+    items = data.get("items", [])
+
+    if not items:
+        return jsonify({"error": "No items provided for batch analysis."}), 400
+
+    if not isinstance(items, list) or not all(isinstance(i, str) for i in items):
+        return jsonify({"error": "Items must be a list of strings."}), 400
+
+    if len(items) > JOB_MAX_ITEMS:
+        return jsonify({"error": f"Batch size too large. Limit is {JOB_MAX_ITEMS} items."}), 400
+
+    job_id = job_store.create(items)
+    return jsonify(job_store.get(job_id)), 202
+
+
+@app.route("/jobs/<job_id>")
+def job_status(job_id):
+    job = job_store.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found."}), 404
+    return jsonify(job)
+
+
+@app.route("/jobs/<job_id>/results")
+def job_results(job_id):
+    job = job_store.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found."}), 404
+
+    offset = max(request.args.get("offset", 0, type=int), 0)
+    limit = min(max(request.args.get("limit", 100, type=int), 1), 1000)
+    results = job_store.results(job_id, offset=offset, limit=limit)
+
+    # where the next page starts; None once every result has been returned
+    next_offset = results[-1]["index"] + 1 if results else offset
+    if next_offset >= job["total_items"] or (not results and job["status"] in FINISHED):
+        next_offset = None
+
+    return jsonify({
+        "job_id": job_id,
+        "status": job["status"],
+        "offset": offset,
+        "results": results,
+        "next_offset": next_offset
+    })
+
+
+@app.route("/jobs/<job_id>/cancel", methods=["POST"])
+def cancel_job(job_id):
+    if job_store.get(job_id) is None:
+        return jsonify({"error": "Job not found."}), 404
+    job_store.cancel(job_id)
+    return jsonify(job_store.get(job_id))
+
+
 # ---------------- PDF DOWNLOAD ----------------
 @app.route("/download-pdf", methods=["POST"])
 def download_pdf():
+    # "chart" may be a client-rendered base64 image or "server"
     data = request.get_json()
 
-    prediction = data.get("prediction")
-    confidence = round(data.get("confidence", 0) * 100)
-    mode = data.get("mode")
-    reason = data.get("reason")
-    risk_level = data.get("risk_level", "N/A")
-    chart_base64 = data.get("chart")
-
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4)
-    styles = getSampleStyleSheet()
-    content = []
-
-    content.append(Paragraph("<b>Fake News Detection Report</b>", styles["Title"]))
-    content.append(Paragraph(f"<b>Prediction:</b> {prediction}", styles["Normal"]))
-    content.append(Paragraph(f"<b>Confidence:</b> {confidence} %", styles["Normal"]))
-    content.append(Paragraph(f"<b>Risk Level:</b> {risk_level}", styles["Normal"]))
-    
-    # Add Sentiment and Stats to PDF
-    sentiment = data.get("sentiment", {})
-    stats = data.get("stats", {})
-    content.append(Paragraph(f"<b>Sentiment:</b> {sentiment.get('label', 'N/A')} (Score: {sentiment.get('score', 0)})", styles["Normal"]))
-    content.append(Paragraph(f"<b>Word Count:</b> {stats.get('word_count', 0)}", styles["Normal"]))
-    
-    content.append(Paragraph(f"<b>Mode:</b> {mode}", styles["Normal"]))
-    content.append(Paragraph(f"<b>Reason:</b> {reason}", styles["Normal"]))
+    with stage("pdf_build"):
+        chunks, size = spooled_pdf(build_report, data)
 
-    if chart_base64:
-        chart_bytes = base64.b64decode(chart_base64.split(",")[1])
-        chart_buffer = BytesIO(chart_bytes)
-        img = Image(chart_buffer, width=400, height=300)
-        content.append(img)
+    return Response(chunks, mimetype="application/pdf", headers={
+        "Content-Length": str(size),
+        "Content-Disposition": "attachment; filename=fake_news_report.pdf"
+    })
 
-    doc.build(content)
-    buffer.seek(0)
 
-    return buffer.getvalue(), 200, {
-        "Content-Type": "application/pdf",
-        "Content-Disposition": "attachment; filename=fake_news_report.pdf"
-    }
+@app.route("/download-pdf/batch", methods=["POST"])
+def download_batch_pdf():
+    """
+    One multi-page report for a whole batch: either {"results": [...]} as
+    returned by /batch-predict, or {"job_id": "..."} for a batch job.
+    """
+    data = request.get_json(silent=True) or {}
+    job_id = data.get("job_id")
+
+    if job_id:
+        job = job_store.get(job_id)
+        if job is None:
+            return jsonify({"error": "Job not found."}), 404
+        if job["processed"] > REPORT_MAX_ITEMS:
+            return jsonify({"error": f"Report too large. Limit is {REPORT_MAX_ITEMS} items."}), 400
+        results = []
+        while True:
+            page = job_store.results(job_id, offset=len(results), limit=1000)
+            if not page:
+                break
+            results.extend(page)
+        title = f"Batch Job {job_id}"
+        filename = f"batch_job_{job_id}.pdf"
+    else:
+        results = data.get("results")
+        if not isinstance(results, list) or not all(isinstance(r, dict) for r in results):
+            return jsonify({"error": "Provide a job_id or a list of results."}), 400
+        if len(results) > REPORT_MAX_ITEMS:
+            return jsonify({"error": f"Report too large. Limit is {REPORT_MAX_ITEMS} items."}), 400
+        title = "Batch Analysis Report"
+        filename = "batch_report.pdf"
+
+    with stage("pdf_build"):
+        chunks, size = spooled_pdf(build_batch_report, results, title=title)
+
+    return Response(chunks, mimetype="application/pdf", headers={
+        "Content-Length": str(size),
+        "Content-Disposition": f"attachment; filename={filename}"
+    })
 
 
 # ---------------- RUN APP ----------------
 if __name__ == "__main__":
+    job_runner = JobRunner(workers=JOB_WORKERS).start()
     app.run()
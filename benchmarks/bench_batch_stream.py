@@ -0,0 +1,132 @@
+"""
+/batch-predict/stream under a large chunked NDJSON upload.
+
+Starts the app under gunicorn (as in the Procfile), uploads n_items texts
+with chunked transfer encoding while reading the NDJSON response on another
+thread, and reports time to the first result line, total time and the
+worker's peak RSS. Run it with growing sizes to check that server memory
+stays flat as the upload grows. The Flask development server can't
+interleave a chunked upload with a streamed response, hence gunicorn.
+Linux only (/proc/<pid>/status).
+
+    python benchmarks/bench_batch_stream.py [n_items ...]
+"""
+import http.client
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+
+from standin_server import PARAGRAPHS
+
+HOST = "127.0.0.1"
+PORT = 5077
+
+
+def start_server():
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-w", "1", "-b", f"{HOST}:{PORT}",
+         "--timeout", "600", "app:app"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        # no job workers: the master's only child is the app worker
+        env=dict(os.environ, JOB_WORKERS="0",
+                 JOB_STORE_PATH=os.path.join(tempfile.gettempdir(), "bench_batch_stream_jobs.sqlite"))
+    )
+
+
+def worker_pid(master_pid):
+    with open(f"/proc/{master_pid}/task/{master_pid}/children") as f:
+        return int(f.read().split()[0])
+
+
+def peak_rss_mb(pid):
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def wait_until_up(timeout=120):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        conn = http.client.HTTPConnection(HOST, PORT, timeout=1)
+        try:
+            conn.request("GET", "/health")
+            conn.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+        finally:
+            # one sync worker: don't leave it waiting on a keep-alive connection
+            conn.close()
+    raise RuntimeError("server did not start")
+
+
+def body_lines(n_items):
+    for i in range(n_items):
+        text = " ".join(PARAGRAPHS[(i + k) % len(PARAGRAPHS)] for k in range(4))
+        yield (json.dumps({"id": i, "text": f"{text} (report {i})"}) + "\n").encode()
+
+
+def run(n_items):
+    conn = http.client.HTTPConnection(HOST, PORT)
+    conn.putrequest("POST", "/batch-predict/stream")
+    conn.putheader("Content-Type", "application/x-ndjson")
+    conn.putheader("Transfer-Encoding", "chunked")
+    conn.endheaders()
+    # getresponse() on the reader thread may detach the socket from conn,
+    # after which conn.send() would silently reconnect; keep our own handle
+    sock = conn.sock
+
+    start = time.perf_counter()
+    first = []
+    count = [0]
+
+    def read():
+        response = conn.getresponse()
+        for line in response:
+            if not first:
+                first.append(time.perf_counter() - start)
+            json.loads(line)
+            count[0] += 1
+
+    reader = threading.Thread(target=read)
+    reader.start()
+
+    for line in body_lines(n_items):
+        sock.sendall(b"%x\r\n%s\r\n" % (len(line), line))
+    sock.sendall(b"0\r\n\r\n")
+    upload_time = time.perf_counter() - start
+
+    reader.join()
+    total = time.perf_counter() - start
+    assert count[0] == n_items, count[0]
+    return first[0], upload_time, total
+
+
+def main(sizes):
+    server = start_server()
+    try:
+        wait_until_up()
+        worker = worker_pid(server.pid)
+        for n_items in sizes:
+            first, upload, total = run(n_items)
+            print(
+                f"{n_items:>7} items: first result {first * 1000:7.1f} ms, "
+                f"upload done {upload:6.2f}s, all results {total:6.2f}s "
+                f"({n_items / total:7.0f} items/s), server peak RSS {peak_rss_mb(worker):6.1f} MB"
+            )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [2000, 20000])
@@ -0,0 +1,72 @@
+"""
+Batch URL analysis against local stand-in news sites: sequential
+extraction (one URL after another) vs URLExtractor.extract_many, followed
+by vectorized scoring of the extracted texts.
+
+    python benchmarks/bench_batch_urls.py [n_urls] [n_hosts] [delay_seconds]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.api.url_extractor import URLExtractor, URL_PER_HOST_LIMIT
+from src.api.batch import process_batch_items
+from src.inference.predictor import FakeNewsPredictor
+from src.utils.cache import build_cache
+
+from standin_server import StandInServer
+
+
+def fresh_extractor():
+    # in-process cache only, so every run really downloads
+    return URLExtractor(cache=build_cache("bench_urls"))
+
+
+def main(n_urls=200, n_hosts=4, delay=0.05):
+    servers = [StandInServer(delay=delay).start() for _ in range(n_hosts)]
+    try:
+        urls = [
+            f"{servers[i % n_hosts].base_url}/article/{i}" for i in range(n_urls)
+        ]
+        # a few failures to check partial results
+        urls += [f"{servers[0].base_url}/missing/{i}" for i in range(3)]
+
+        extractor = fresh_extractor()
+        start = time.perf_counter()
+        sequential = [extractor.extract_with_error(u) for u in urls]
+        sequential_time = time.perf_counter() - start
+
+        extractor = fresh_extractor()
+        start = time.perf_counter()
+        concurrent = extractor.extract_many(urls)
+        concurrent_time = time.perf_counter() - start
+
+        assert [t for t, _ in sequential] == [t for t, _ in concurrent]
+        failures = sum(1 for _, err in concurrent if err)
+
+        predictor = FakeNewsPredictor()
+        start = time.perf_counter()
+        batch = process_batch_items(predictor, None, urls, url_extractor=fresh_extractor())
+        batch_time = time.perf_counter() - start
+        scored = sum(1 for r in batch["results"] if "prediction" in r)
+
+        print(f"URLs: {len(urls)} over {n_hosts} hosts, {delay * 1000:.0f} ms per response")
+        print(f"Sequential extraction : {sequential_time:.2f}s")
+        print(f"extract_many          : {concurrent_time:.2f}s ({sequential_time / concurrent_time:.1f}x)")
+        print(f"Failed URLs           : {failures}")
+        print(f"Max in flight per host: {max(s.max_in_flight for s in servers)} (limit {URL_PER_HOST_LIMIT})")
+        print(f"Full batch (fetch + score {scored} texts): {batch_time:.2f}s")
+    finally:
+        for server in servers:
+            server.stop()
+
+
+if __name__ == "__main__":
+    args = [float(a) for a in sys.argv[1:]]
+    main(
+        n_urls=int(args[0]) if len(args) > 0 else 200,
+        n_hosts=int(args[1]) if len(args) > 1 else 4,
+        delay=args[2] if len(args) > 2 else 0.05
+    )
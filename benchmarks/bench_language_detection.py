@@ -0,0 +1,92 @@
+"""
+Compares LanguageDetector (script pre-classifier + seeded langdetect) with
+the previous detector (plain langdetect.detect on the whole text) on mixed
+Hindi / Telugu / English samples of short and article length.
+
+    python benchmarks/bench_language_detection.py
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from langdetect import detect
+
+from src.preprocessing.language_detector import LanguageDetector
+
+SAMPLES = {
+    "en": [
+        "The state government has announced a new education policy for schools and colleges.",
+        "Heavy rain is expected in the coastal districts over the next two days, the weather office said.",
+        "The minister said the budget would include more money for hospitals and rural roads.",
+    ],
+    "hi": [
+        "राज्य सरकार ने स्कूलों और कॉलेजों के लिए नई शिक्षा नीति की घोषणा की है।",
+        "मौसम विभाग ने कहा कि अगले दो दिनों में तटीय जिलों में भारी बारिश की संभावना है।",
+        "मंत्री ने कहा कि बजट में अस्पतालों और ग्रामीण सड़कों के लिए अधिक धन शामिल होगा।",
+    ],
+    "te": [
+        "రాష్ట్ర ప్రభుత్వం పాఠశాలలు మరియు కళాశాలల కోసం కొత్త విద్యా విధానాన్ని ప్రకటించింది.",
+        "రాబోయే రెండు రోజుల్లో తీర ప్రాంత జిల్లాల్లో భారీ వర్షాలు కురిసే అవకాశం ఉందని వాతావరణ శాఖ తెలిపింది.",
+        "బడ్జెట్‌లో ఆసుపత్రులు మరియు గ్రామీణ రహదారుల కోసం ఎక్కువ నిధులు ఉంటాయని మంత్రి చెప్పారు.",
+    ],
+    # Hindi text with English words mixed in, as forwarded messages often are
+    "hi-mixed": [
+        "सरकार ने नई education policy की घोषणा की, सभी schools में लागू होगी।",
+        "Breaking: मौसम विभाग ने कहा कि भारी बारिश होगी, सभी लोग सावधान रहें।",
+    ],
+}
+
+
+def build_corpus(repeats=(1, 20)):
+    corpus = []
+    for label, texts in SAMPLES.items():
+        for n in repeats:
+            for text in texts:
+                corpus.append((label, " ".join([text] * n)))
+    return corpus
+
+
+def old_detect(text):
+    try:
+        return detect(text)
+    except Exception:
+        return "unknown"
+
+
+def time_it(fn, texts, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        out = [fn(t) for t in texts]
+    return (time.perf_counter() - start) / (rounds * len(texts)), out
+
+
+def main(rounds=5):
+    corpus = build_corpus()
+    texts = [t for _, t in corpus]
+
+    detector = LanguageDetector()
+    old_detect(texts[0])  # load langdetect profiles before timing
+
+    old_time, old_langs = time_it(old_detect, texts, rounds)
+    new_time, new_langs = time_it(detector.detect_language, texts, rounds)
+
+    start = time.perf_counter()
+    batch_langs = detector.detect_languages(texts)
+    batch_time = (time.perf_counter() - start) / len(texts)
+
+    print(f"{'sample':<10} {'chars':>6} {'langdetect':>11} {'detector':>9}")
+    for (label, text), old, new in zip(corpus, old_langs, new_langs):
+        print(f"{label:<10} {len(text):>6} {old:>11} {new:>9}")
+
+    agree = sum(o == n for o, n in zip(old_langs, new_langs))
+    print(f"\nAgreement with langdetect: {agree}/{len(texts)}")
+    print(f"langdetect.detect : {old_time * 1000:.3f} ms/text")
+    print(f"LanguageDetector  : {new_time * 1000:.3f} ms/text ({old_time / new_time:.1f}x)")
+    print(f"detect_languages  : {batch_time * 1000:.3f} ms/text")
+    assert batch_langs == new_langs
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Startup time and per-worker memory of the two model formats:
+
+  pickle   - unpickle logistic_model.pkl + tfidf_vectorizer.pkl and fold them
+  compiled - memory-map artifacts/models/compiled (see src/inference/linear_scorer.py)
+
+Several worker processes load the model at the same time; after all of them
+have loaded and scored, each reports its load time and how much its RSS /
+PSS grew (PSS splits shared pages between the processes mapping them, so it
+shows what the model costs per worker). Linux only (/proc/self/smaps_rollup).
+
+    python -m src.inference.linear_scorer        # export the compiled format first
+    python benchmarks/bench_model_loading.py [n_workers]
+"""
+import importlib
+import multiprocessing as mp
+import os
+import pickle
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+
+MODEL_DIR = os.path.join(ROOT, "artifacts", "models")
+
+SAMPLE = "The government announced a new education policy for schools across the state"
+
+
+def memory_kb():
+    values = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].rstrip(":") in ("Rss", "Pss"):
+                values[parts[0].rstrip(":")] = int(parts[1])
+    return values
+
+
+def load(mode):
+    from src.inference.linear_scorer import LinearScorer, COMPILED_DIR_NAME
+
+    if mode == "compiled":
+        return LinearScorer.load(os.path.join(MODEL_DIR, COMPILED_DIR_NAME), mmap=True)
+
+    with open(os.path.join(MODEL_DIR, "logistic_model.pkl"), "rb") as f:
+        model = pickle.load(f)
+    with open(os.path.join(MODEL_DIR, "tfidf_vectorizer.pkl"), "rb") as f:
+        vectorizer = pickle.load(f)
+    return LinearScorer.from_sklearn(vectorizer, model)
+
+
+def worker(mode, barrier, results):
+    # baseline: imports aren't part of the model cost
+    import numpy as np
+    for module in ("sklearn.feature_extraction.text", "sklearn.linear_model", "src.inference.linear_scorer"):
+        importlib.import_module(module)
+
+    before = memory_kb()
+    start = time.perf_counter()
+    scorer = load(mode)
+    load_time = time.perf_counter() - start
+
+    # touch every page of the model as real traffic eventually would
+    scorer.score([SAMPLE])
+    float(scorer.weights.sum() + scorer.idf.sum())
+    if hasattr(scorer.vocabulary, "sorted_terms"):
+        int(scorer.vocabulary.sorted_terms.view(np.uint32).sum())
+
+    barrier.wait()
+    after = memory_kb()
+    results.put((load_time, after["Rss"] - before["Rss"], after["Pss"] - before["Pss"]))
+    barrier.wait()
+
+
+def run(mode, n_workers):
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(n_workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(mode, barrier, results)) for _ in range(n_workers)]
+    for p in procs:
+        p.start()
+    rows = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+
+    avg = [sum(r[i] for r in rows) / len(rows) for i in range(3)]
+    print(f"{mode:<9} load {avg[0] * 1000:8.1f} ms   RSS +{avg[1] / 1024:6.2f} MB   PSS +{avg[2] / 1024:6.2f} MB  (per worker, {n_workers} workers)")
+
+
+def main(n_workers=4):
+    for mode in ("pickle", "compiled"):
+        run(mode, n_workers)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 4)
@@ -0,0 +1,390 @@
+"""
+Replays a request corpus against app.app, through the Flask test client
+and/or a local gunicorn, with translation and article downloads served by
+deterministic local stand-ins (see replay_app.py). Reports throughput and
+p50/p95/p99 latency per endpoint and per endpoint and decision mode.
+
+The generated corpus mixes English, Hindi and Telugu texts (with all three
+display languages), rule and short-message triggers, URLs on stand-in
+news sites and /batch-predict calls. --corpus adds JSONL files: lines with
+a "path" are sent as they are ({"method", "path", "json"}); any other
+object is sent to /predict with its "text" (or "title" and "body", as in
+the backlog's requests.jsonl).
+
+--save-baseline stores the results in benchmarks/baselines/; later runs
+with the same settings are compared with it and exit with status 1 when
+a latency percentile, the throughput or the error count regressed by
+more than --tolerance. Baselines are machine specific and not committed.
+
+    python benchmarks/bench_replay.py [--target client|gunicorn|both]
+        [--requests 600] [--concurrency 4] [--workers 2] [--corpus FILE ...]
+        [--site-delay 0.05] [--translation-delay 0.02] [--save-baseline] [--tolerance 0.25]
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.abspath(os.path.join(BENCH_DIR, ".."))
+BASELINE_DIR = os.path.join(BENCH_DIR, "baselines")
+sys.path.append(ROOT)
+
+from bench_language_detection import SAMPLES
+from standin_server import PARAGRAPHS, StandInServer
+
+HOST = "127.0.0.1"
+PORT = 5078
+
+# Share of each kind of request in the generated corpus
+MIX = {
+    "en": 0.30,
+    "hi": 0.15,
+    "te": 0.15,
+    "url": 0.15,
+    "rule": 0.05,
+    "short": 0.05,
+    "batch": 0.10,
+    "health": 0.05,
+}
+BATCH_SIZE = 20
+
+# Groups with fewer samples are reported but not compared with the baseline
+MIN_SAMPLES = 20
+# Latency differences below this (ms) are never regressions; keeps
+# sub-millisecond endpoints from failing on noise
+SLACK_MS = 2.0
+
+
+# ---------------- CORPUS ----------------
+def _english_text(rng, n):
+    paragraphs = rng.sample(PARAGRAPHS, rng.randint(2, len(PARAGRAPHS)))
+    return f"{' '.join(paragraphs)} (report {n})"
+
+
+def _native_text(rng, lang, n):
+    return f"{' '.join(rng.choice(SAMPLES[lang]) for _ in range(rng.randint(1, 4)))} ({n})"
+
+
+def _predict(text, target_lang="en", is_url=False):
+    return {"method": "POST", "path": "/predict",
+            "json": {"text": text, "target_lang": target_lang, "is_url": is_url}}
+
+
+def generate_corpus(n_requests, site_urls, seed=0):
+    """
+    n_requests request specs drawn from MIX. URLs point at the stand-in
+    sites; article numbers repeat now and then, like shared links do.
+    """
+    rng = random.Random(seed)
+    kinds = list(MIX)
+    weights = [MIX[k] for k in kinds]
+    corpus = []
+
+    for n in range(n_requests):
+        kind = rng.choices(kinds, weights)[0]
+        target_lang = rng.choice(["en", "en", "hi", "te"])
+
+        if kind == "en":
+            corpus.append(_predict(_english_text(rng, n), target_lang))
+        elif kind in ("hi", "te"):
+            corpus.append(_predict(_native_text(rng, kind, n), target_lang))
+        elif kind == "url":
+            url = f"{rng.choice(site_urls)}/article/{rng.randint(0, n_requests // 2)}"
+            corpus.append(_predict(url, target_lang, is_url=True))
+        elif kind == "rule":
+            corpus.append(_predict(f"Breaking: free money for everyone who shares this message today ({n})"))
+        elif kind == "short":
+            corpus.append(_predict(f"shocking secret revealed {n}"))
+        elif kind == "batch":
+            items = [
+                f"{rng.choice(site_urls)}/article/{rng.randint(0, n_requests)}" if rng.random() < 0.2
+                else _english_text(rng, f"{n}.{i}")
+                for i in range(BATCH_SIZE)
+            ]
+            corpus.append({"method": "POST", "path": "/batch-predict", "json": {"items": items}})
+        else:
+            corpus.append({"method": "GET", "path": "/health"})
+
+    return corpus
+
+
+def load_corpus(path):
+    corpus = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if "path" in entry:
+                corpus.append({"method": entry.get("method", "POST"), "path": entry["path"],
+                               "json": entry.get("json")})
+            else:
+                text = entry.get("text") or " ".join(
+                    str(entry[k]) for k in ("title", "body") if entry.get(k)
+                )
+                corpus.append(_predict(text))
+    return corpus
+
+
+# ---------------- TARGETS ----------------
+class ClientTarget:
+    """
+    In-process Flask test client, one per thread.
+    """
+
+    name = "client"
+
+    def __init__(self):
+        import replay_app
+        self.app = replay_app.app
+        self._local = threading.local()
+
+    def send(self, spec):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.open(spec["path"], method=spec["method"], json=spec.get("json"))
+        return response.status_code, response.get_data()
+
+    def close(self):
+        pass
+
+
+def server_env():
+    # gunicorn.conf.py starts JOB_WORKERS job workers in the master, which
+    # never imports replay_app, so its defaults have to be set here
+    return dict(
+        os.environ, JOB_WORKERS="0",
+        JOB_STORE_PATH=os.path.join(tempfile.gettempdir(), "replay_bench_jobs.sqlite")
+    )
+
+
+class GunicornTarget:
+    """
+    replay_app under gunicorn (sync workers, as in the Procfile), one
+    keep-alive connection per client thread.
+    """
+
+    name = "gunicorn"
+
+    def __init__(self, workers):
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-w", str(workers), "-b", f"{HOST}:{PORT}",
+             "--timeout", "120", "--pythonpath", BENCH_DIR, "replay_app:app"],
+            cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=server_env()
+        )
+        self._local = threading.local()
+        self._connections = []
+        self._wait_until_up()
+
+    def _wait_until_up(self, timeout=120):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            conn = http.client.HTTPConnection(HOST, PORT, timeout=1)
+            try:
+                conn.request("GET", "/health")
+                conn.getresponse().read()
+                return
+            except OSError:
+                time.sleep(0.2)
+            finally:
+                conn.close()
+        self.close()
+        raise RuntimeError("gunicorn did not start")
+
+    def send(self, spec):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPConnection(HOST, PORT, timeout=120)
+            self._connections.append(conn)
+
+        body = json.dumps(spec["json"]).encode("utf-8") if spec.get("json") is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        conn.request(spec["method"], spec["path"], body=body, headers=headers)
+        response = conn.getresponse()
+        return response.status, response.read()
+
+    def close(self):
+        for conn in self._connections:
+            conn.close()
+        self.process.terminate()
+        self.process.wait()
+
+
+# ---------------- REPLAY ----------------
+def _mode(spec, body):
+    if spec["path"] != "/predict":
+        return None
+    try:
+        return json.loads(body).get("mode") or "error"
+    except ValueError:
+        return "error"
+
+
+def replay(target, corpus, concurrency):
+    """
+    Sends every request of corpus with concurrency client threads.
+    Returns ([(endpoint, mode, status, seconds), ...], wall_seconds).
+    """
+    def run(spec):
+        start = time.perf_counter()
+        try:
+            status, body = target.send(spec)
+        except (OSError, http.client.HTTPException):
+            status, body = 599, b""
+        elapsed = time.perf_counter() - start
+        return f"{spec['method']} {spec['path']}", _mode(spec, body), status, elapsed
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = list(pool.map(run, corpus))
+    return samples, time.perf_counter() - start
+
+
+def percentile(sorted_values, p):
+    # nearest rank
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+
+def summarize(samples, wall):
+    groups = defaultdict(list)
+    errors = defaultdict(int)
+    for endpoint, mode, status, seconds in samples:
+        keys = [endpoint] + ([f"{endpoint} [{mode}]"] if mode else [])
+        for key in keys:
+            groups[key].append(seconds * 1000)
+            if status >= 500:
+                errors[key] += 1
+
+    summary = {}
+    for key, values in sorted(groups.items()):
+        values.sort()
+        summary[key] = {
+            "count": len(values),
+            "errors": errors[key],
+            "rps": round(len(values) / wall, 2),
+            "p50": round(percentile(values, 50), 2),
+            "p95": round(percentile(values, 95), 2),
+            "p99": round(percentile(values, 99), 2),
+        }
+    return {"requests": len(samples), "wall_seconds": round(wall, 3),
+            "throughput": round(len(samples) / wall, 2), "groups": summary}
+
+
+def print_summary(target_name, summary):
+    print(f"\n{target_name}: {summary['requests']} requests in {summary['wall_seconds']:.2f}s "
+          f"({summary['throughput']:.1f} req/s)")
+    print(f"{'group':<42} {'count':>6} {'err':>4} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for key, g in summary["groups"].items():
+        print(f"{key:<42} {g['count']:>6} {g['errors']:>4} {g['rps']:>8.1f} "
+              f"{g['p50']:>9.2f} {g['p95']:>9.2f} {g['p99']:>9.2f}")
+
+
+# ---------------- BASELINES ----------------
+def baseline_path(target_name):
+    return os.path.join(BASELINE_DIR, f"replay_{target_name}.json")
+
+
+def compare(summary, baseline, tolerance):
+    """
+    Regressions of summary against baseline, as readable strings.
+    """
+    regressions = []
+    if summary["throughput"] < baseline["throughput"] * (1 - tolerance):
+        regressions.append(f"throughput {summary['throughput']} < baseline {baseline['throughput']}")
+
+    for key, g in summary["groups"].items():
+        base = baseline["groups"].get(key)
+        if base is None or min(g["count"], base["count"]) < MIN_SAMPLES:
+            continue
+        for p in ("p50", "p95", "p99"):
+            limit = base[p] * (1 + tolerance) + SLACK_MS
+            if g[p] > limit:
+                regressions.append(f"{key} {p} {g[p]} ms > {limit:.2f} ms (baseline {base[p]} ms)")
+        if g["errors"] > base["errors"]:
+            regressions.append(f"{key} errors {g['errors']} > baseline {base['errors']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay request corpora against the app")
+    parser.add_argument("--target", choices=["client", "gunicorn", "both"], default="both")
+    parser.add_argument("--requests", type=int, default=600, help="generated requests (0 = none)")
+    parser.add_argument("--corpus", action="append", default=[], help="extra JSONL corpus")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn workers")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests first")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--site-delay", type=float, default=0.05, help="stand-in site response delay (s)")
+    parser.add_argument("--translation-delay", type=float, default=0.02, help="stand-in translation delay (s)")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    # read by replay_app, in this process and in gunicorn's
+    os.environ["REPLAY_TRANSLATION_DELAY"] = str(args.translation_delay)
+    servers = [StandInServer(delay=args.site_delay).start() for _ in range(2)]
+    settings = {
+        k: getattr(args, k)
+        for k in ("requests", "corpus", "concurrency", "workers", "seed", "site_delay", "translation_delay")
+    }
+    failed = False
+
+    try:
+        corpus = generate_corpus(args.requests, [s.base_url for s in servers], seed=args.seed)
+        for path in args.corpus:
+            corpus.extend(load_corpus(path))
+        # same order for every target and run
+        random.Random(args.seed).shuffle(corpus)
+        warmup = generate_corpus(args.warmup, [s.base_url for s in servers], seed=args.seed + 1)
+
+        names = ["client", "gunicorn"] if args.target == "both" else [args.target]
+        for name in names:
+            target = ClientTarget() if name == "client" else GunicornTarget(args.workers)
+            try:
+                replay(target, warmup, args.concurrency)
+                samples, wall = replay(target, corpus, args.concurrency)
+            finally:
+                target.close()
+
+            summary = dict(summarize(samples, wall), settings=settings)
+            print_summary(name, summary)
+
+            path = baseline_path(name)
+            if args.save_baseline:
+                os.makedirs(BASELINE_DIR, exist_ok=True)
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(summary, f, indent=2)
+                print(f"Baseline saved to {path}")
+            elif os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    baseline = json.load(f)
+                if baseline.get("settings") != settings:
+                    print(f"Baseline {path} was recorded with other settings, not compared")
+                    continue
+                regressions = compare(summary, baseline, args.tolerance)
+                for line in regressions:
+                    print(f"REGRESSION: {line}")
+                if regressions:
+                    failed = True
+                else:
+                    print(f"No regressions against {path} (tolerance {args.tolerance:.0%})")
+    finally:
+        for server in servers:
+            server.stop()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
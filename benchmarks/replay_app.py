@@ -0,0 +1,58 @@
+"""
+app.app with the network-bound stages replaced by deterministic local
+stand-ins, for benchmarks/bench_replay.py. Translation answers from a
+fixed table after REPLAY_TRANSLATION_DELAY seconds; article downloads go
+to standin_server.StandInServer, whose URLs the replay corpus uses. Caches
+are in-process only and no job workers are started, so every run starts
+cold and leaves nothing behind.
+
+Importable in-process, or served with
+
+    gunicorn --pythonpath benchmarks replay_app:app
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+
+BENCH_ENV = {
+    "RESULT_CACHE_PATH": "",
+    "TRANSLATION_CACHE_PATH": "",
+    "URL_CACHE_PATH": "",
+    "JOB_WORKERS": "0",
+    "JOB_STORE_PATH": os.path.join(tempfile.gettempdir(), "replay_bench_jobs.sqlite"),
+}
+for name, value in BENCH_ENV.items():
+    os.environ.setdefault(name, value)
+
+import app as app_module  # noqa: E402
+
+from standin_server import PARAGRAPHS  # noqa: E402
+
+TRANSLATION_DELAY = float(os.environ.get("REPLAY_TRANSLATION_DELAY", "0.02"))
+
+
+class StandInTranslator:
+    """
+    Same interface as deep_translator.GoogleTranslator.translate. English
+    output is one of the stand-in paragraphs, picked by a hash of the
+    input, so a Hindi or Telugu text always scores the same way.
+    """
+
+    def __init__(self, target_lang):
+        self.target_lang = target_lang
+
+    def translate(self, text):
+        time.sleep(TRANSLATION_DELAY)
+        if self.target_lang != "en":
+            return f"[{self.target_lang}] {text}"
+        digest = int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+        return " ".join(PARAGRAPHS[(digest + i) % len(PARAGRAPHS)] for i in range(3))
+
+
+app_module.predictor.translator._get_translator = StandInTranslator
+app = app_module.app
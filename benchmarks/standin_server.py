@@ -0,0 +1,102 @@
+"""
+Local HTTP stand-in for news sites, used as a benchmark fixture.
+
+Serves deterministic article pages at /article/<n> after a fixed delay,
+answers conditional requests with 304, and returns 404 for /missing/<n>.
+Each server listens on its own port, so several of them look like several
+hosts to per-host concurrency limits.
+"""
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+PARAGRAPHS = [
+    "The state government announced a new education policy for schools and colleges on Monday.",
+    "Officials said the budget for hospitals and rural roads would be increased this year.",
+    "The weather office warned of heavy rain in the coastal districts over the next two days.",
+    "Opposition leaders questioned the timing of the announcement ahead of the elections.",
+    "Experts said the scheme could benefit millions of students if implemented properly.",
+]
+
+
+def article_html(n):
+    body = "".join(
+        f"<p>{PARAGRAPHS[(n + i) % len(PARAGRAPHS)]} (report {n}, part {i})</p>"
+        for i in range(8)
+    )
+    return (
+        f"<html><head><title>Article {n}</title></head>"
+        f"<body><article><h1>Article {n}</h1>{body}</article></body></html>"
+    )
+
+
+class StandInServer:
+    def __init__(self, delay=0.05, host="127.0.0.1"):
+        self.delay = delay
+        self.requests = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                    server._in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server._in_flight)
+                try:
+                    time.sleep(server.delay)
+                    self._respond()
+                finally:
+                    with server._lock:
+                        server._in_flight -= 1
+
+            def _respond(self):
+                parts = self.path.strip("/").split("/")
+                if len(parts) != 2 or parts[0] != "article" or not parts[1].isdigit():
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                etag = f'"article-{parts[1]}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                body = article_html(int(parts[1])).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, 0), Handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://{host}:{self.httpd.server_port}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
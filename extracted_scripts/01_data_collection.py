@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 import os
+import sys
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -19,6 +20,10 @@ PROCESSED_DATA_PATH = os.path.join(project_root, "data", "processed")
 
 os.makedirs(PROCESSED_DATA_PATH, exist_ok=True)
 
+sys.path.append(project_root)
+
+from src.data.data_loader import DataLoader
+
 print("RAW DATA PATH:", RAW_DATA_PATH)
 print("PROCESSED DATA PATH:", PROCESSED_DATA_PATH)
 
@@ -81,8 +86,9 @@ plt.show()
 # --------------------------------------------------
 # SAVE OUTPUT
 # --------------------------------------------------
-combined_path = os.path.join(PROCESSED_DATA_PATH, "combined_raw_data.csv")
-df_combined.to_csv(combined_path, index=False)
+# typed Parquet, a row group per source (EXPORT_CSV=1 adds a .csv copy)
+combined_path = os.path.join(PROCESSED_DATA_PATH, "combined_raw_data.parquet")
+DataLoader().save_parquet(df_combined, combined_path)
 
 print("Saved combined dataset to:", combined_path)
 print("Total Samples:", df_combined.shape[0])
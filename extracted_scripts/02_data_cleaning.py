@@ -1,11 +1,6 @@
-import pandas as pd
-import numpy as np
-import re
-import string
 import os
+import sys
 import nltk
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
 
 # --------------------------------------------------
 # PATH HANDLING (PIPELINE SAFE)
@@ -14,23 +9,28 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(script_dir, ".."))
 
 PROCESSED_DATA_PATH = os.path.join(project_root, "data", "processed")
+
+sys.path.append(project_root)
+
+from src.data.data_loader import DataLoader
+from src.preprocessing.text_normalizer import clean_texts
+
 print("PROCESSED DATA PATH:", PROCESSED_DATA_PATH)
 
 # --------------------------------------------------
 # NLTK SETUP
 # --------------------------------------------------
+# corpora the text normalizer reads (stop words, WordNet lemmas)
 nltk.download("stopwords")
 nltk.download("wordnet")
 nltk.download("omw-1.4")
 
-stop_words = set(stopwords.words("english"))
-lemmatizer = WordNetLemmatizer()
-
 # --------------------------------------------------
 # LOAD DATA
 # --------------------------------------------------
-input_path = os.path.join(PROCESSED_DATA_PATH, "combined_raw_data.csv")
-df = pd.read_csv(input_path)
+loader = DataLoader()
+input_path = os.path.join(PROCESSED_DATA_PATH, "combined_raw_data.parquet")
+df = loader.load_parquet(input_path)
 
 print("\n========== DATA CLEANING REPORT ==========")
 
@@ -40,24 +40,12 @@ print("Total rows:", df.shape[0])
 print("Total columns:", df.shape[1])
 print("Missing values:\n", df.isnull().sum())
 
-# --------------------------------------------------
-# TEXT CLEANING FUNCTION
-# --------------------------------------------------
-def clean_text(text):
-    text = str(text).lower()
-    text = re.sub(r"http\S+", "", text)
-    text = re.sub(r"@\w+", "", text)
-    text = re.sub(r"#\w+", "", text)
-    text = re.sub(r"\d+", "", text)
-    text = text.translate(str.maketrans("", "", string.punctuation))
-    tokens = text.split()
-    tokens = [lemmatizer.lemmatize(word) for word in tokens if word not in stop_words]
-    return " ".join(tokens)
-
 # --------------------------------------------------
 # APPLY CLEANING
 # --------------------------------------------------
-df["clean_text"] = df["text"].apply(clean_text)
+# shared engine (src/preprocessing/text_normalizer.py): chunks of the
+# column across CLEANING_WORKERS processes, lemmas cached per token
+df["clean_text"] = clean_texts(df["text"])
 
 # Remove duplicates
 rows_before_duplicates = df.shape[0]
@@ -86,8 +74,8 @@ print(f"Total rows cleaned: {rows_before_duplicates - df.shape[0]} ({cleaned_per
 # --------------------------------------------------
 # SAVE CLEANED DATA
 # --------------------------------------------------
-cleaned_path = os.path.join(PROCESSED_DATA_PATH, "cleaned_data.csv")
-df.to_csv(cleaned_path, index=False)
+cleaned_path = os.path.join(PROCESSED_DATA_PATH, "cleaned_data.parquet")
+loader.save_parquet(df, cleaned_path)
 
 print("\nSaved cleaned data to:", cleaned_path)
 
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 import os
+import sys
 
 # --------------------------------------------------
 # PATH HANDLING (PIPELINE SAFE)
@@ -11,29 +12,44 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(script_dir, ".."))
 
 PROCESSED_DATA_PATH = os.path.join(project_root, "data", "processed")
+REPORT_PATH = os.path.join(project_root, "artifacts", "reports", "data_quality_report.txt")
+
+sys.path.append(project_root)
+
+from src.data.data_loader import DataLoader
 
 print("PROCESSED DATA PATH:", PROCESSED_DATA_PATH)
 
 # --------------------------------------------------
 # LOAD DATA
 # --------------------------------------------------
-data_path = os.path.join(PROCESSED_DATA_PATH, "combined_raw_data.csv")
-df_raw = pd.read_csv(data_path)
+data_path = os.path.join(PROCESSED_DATA_PATH, "combined_raw_data.parquet")
+df_raw = DataLoader().load_parquet(data_path)
+
+report_lines = []
+
+
+def report(*values):
+    # printed, and kept for the report file
+    text = " ".join(str(value) for value in values)
+    print(text)
+    report_lines.append(text)
 
-print("\n========== DATA QUALITY REPORT ==========")
+
+report("\n========== DATA QUALITY REPORT ==========")
 
 # --------------------------------------------------
 # BASIC INFO
 # --------------------------------------------------
-print("\n--- BASIC INFORMATION ---")
-print("Shape:", df_raw.shape)
-print("\nData Types:")
-print(df_raw.dtypes)
+report("\n--- BASIC INFORMATION ---")
+report("Shape:", df_raw.shape)
+report("\nData Types:")
+report(df_raw.dtypes)
 
 # --------------------------------------------------
 # MISSING VALUES
 # --------------------------------------------------
-print("\n--- MISSING VALUES ---")
+report("\n--- MISSING VALUES ---")
 missing = df_raw.isnull().sum()
 missing_percent = (missing / len(df_raw)) * 100
 
@@ -42,41 +58,49 @@ missing_df = pd.DataFrame({
     "Missing_Percentage": missing_percent.round(2)
 })
 
-print(missing_df[missing_df["Missing_Count"] > 0])
+report(missing_df[missing_df["Missing_Count"] > 0])
 
 # --------------------------------------------------
 # DUPLICATES
 # --------------------------------------------------
-print("\n--- DUPLICATE CHECK ---")
+report("\n--- DUPLICATE CHECK ---")
 duplicate_rows = df_raw.duplicated().sum()
-print("Duplicate rows:", duplicate_rows)
+report("Duplicate rows:", duplicate_rows)
 
 # --------------------------------------------------
 # LABEL DISTRIBUTION
 # --------------------------------------------------
-print("\n--- LABEL DISTRIBUTION ---")
-print(df_raw["label"].value_counts(dropna=False))
+report("\n--- LABEL DISTRIBUTION ---")
+report(df_raw["label"].value_counts(dropna=False))
 
 # --------------------------------------------------
 # TEXT LENGTH ANALYSIS (SAFE & FUTURE-PROOF)
 # --------------------------------------------------
-print("\n--- TEXT LENGTH STATS ---")
+report("\n--- TEXT LENGTH STATS ---")
 
 # Defensive text handling (CRITICAL FIX)
 df_raw["text"] = df_raw["text"].fillna("").astype(str)
 
 df_raw["text_length"] = df_raw["text"].apply(len)
 
-print(df_raw["text_length"].describe())
+report(df_raw["text_length"].describe())
 
 # --------------------------------------------------
 # QUALITY SUMMARY
 # --------------------------------------------------
-print("\n========== QUALITY SUMMARY ==========")
-print(f"Total Rows        : {df_raw.shape[0]}")
-print(f"Total Columns     : {df_raw.shape[1]}")
-print(f"Rows with Nulls   : {(df_raw.isnull().any(axis=1)).sum()}")
-print(f"Duplicate Rows    : {duplicate_rows}")
+report("\n========== QUALITY SUMMARY ==========")
+report(f"Total Rows        : {df_raw.shape[0]}")
+report(f"Total Columns     : {df_raw.shape[1]}")
+report(f"Rows with Nulls   : {(df_raw.isnull().any(axis=1)).sum()}")
+report(f"Duplicate Rows    : {duplicate_rows}")
+
+report("\nSample records:")
+report(df_raw.head())
 
-print("\nSample records:")
-print(df_raw.head())
+# --------------------------------------------------
+# SAVE REPORT
+# --------------------------------------------------
+os.makedirs(os.path.dirname(REPORT_PATH), exist_ok=True)
+with open(REPORT_PATH, "w", encoding="utf-8") as f:
+    f.write("\n".join(report_lines) + "\n")
+print("\nData quality report saved to:", REPORT_PATH)
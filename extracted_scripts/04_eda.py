@@ -1,5 +1,6 @@
 import pandas as pd
 import os
+import sys
 
 # --------------------------------------------------
 # PATH HANDLING
@@ -7,14 +8,20 @@ import os
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(script_dir, ".."))
 PROCESSED_DATA_PATH = os.path.join(project_root, "data", "processed")
+MODEL_DIR = os.path.join(project_root, "models")
+
+sys.path.append(project_root)
+
+from src.data.data_loader import DataLoader
+from src.models.stats_snapshot import eda_stats, write_eda_stats
 
 print("PROCESSED DATA PATH:", PROCESSED_DATA_PATH)
 
 # --------------------------------------------------
 # LOAD DATA
 # --------------------------------------------------
-data_path = os.path.join(PROCESSED_DATA_PATH, "cleaned_data.csv")
-df = pd.read_csv(data_path)
+data_path = os.path.join(PROCESSED_DATA_PATH, "cleaned_data.parquet")
+df = DataLoader().load_parquet(data_path, columns=["clean_text", "label", "source"])
 
 print("\n========== EDA REPORT ==========")
 
@@ -36,9 +43,6 @@ print(df["label"].value_counts())
 # --------------------------------------------------
 print("\n--- TEXT LENGTH ANALYSIS ---")
 
-# Defensive normalization (THIS PREVENTS ALL FUTURE ERRORS)
-df["clean_text"] = df["clean_text"].fillna("").astype(str)
-
 df["text_length"] = df["clean_text"].apply(len)
 
 print(df["text_length"].describe())
@@ -54,3 +58,11 @@ print(df["source"].value_counts())
 # --------------------------------------------------
 print("\nSample records:")
 print(df.head())
+
+# --------------------------------------------------
+# STATS SNAPSHOT (SERVED BY /eda-stats)
+# --------------------------------------------------
+# Stored next to the model; 07 adds them to the snapshot when it
+# evaluates (and seals) the model trained on this data.
+write_eda_stats(MODEL_DIR, eda_stats(df))
+print("\nEDA stats written to", MODEL_DIR)
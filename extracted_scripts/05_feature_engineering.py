@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 import os
+import sys
 from sklearn.feature_extraction.text import TfidfVectorizer
 import joblib
 
@@ -17,14 +18,19 @@ MODEL_DIR = os.path.join(project_root, "models")
 
 os.makedirs(MODEL_DIR, exist_ok=True)
 
+sys.path.append(project_root)
+
+from src.data.data_loader import DataLoader
+from src.features.feature_store import FeatureStore
+
 print("PROCESSED DATA PATH:", PROCESSED_DATA_PATH)
 print("MODEL DIR:", MODEL_DIR)
 
 # --------------------------------------------------
 # LOAD DATA
 # --------------------------------------------------
-data_path = os.path.join(PROCESSED_DATA_PATH, "cleaned_data.csv")
-df = pd.read_csv(data_path)
+data_path = os.path.join(PROCESSED_DATA_PATH, "cleaned_data.parquet")
+df = DataLoader().load_parquet(data_path, columns=["clean_text", "label"])
 
 print("\n========== FEATURE ENGINEERING ==========")
 print("Input data shape:", df.shape)
@@ -32,8 +38,8 @@ print("Input data shape:", df.shape)
 # --------------------------------------------------
 # FEATURES & TARGET (SAFE)
 # --------------------------------------------------
-# Ensure no NaN values for TF-IDF
-X = df["clean_text"].fillna("").astype(str)
+# clean_text is a typed string column: no NaN round-trip as with CSV
+X = df["clean_text"]
 y = df["label"]
 
 # Remove empty documents (important)
@@ -55,7 +61,8 @@ vectorizer = TfidfVectorizer(
     stop_words="english"
 )
 
-X_tfidf = vectorizer.fit_transform(X)
+# the matrix is cached in the feature store, so 06 doesn't transform again
+X_tfidf = FeatureStore().transform(X, vectorizer, fit=True)
 
 print("TF-IDF shape:", X_tfidf.shape)
 
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 import os
+import sys
 import joblib
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LogisticRegression
@@ -17,14 +18,19 @@ MODEL_DIR = os.path.join(project_root, "models")
 
 os.makedirs(MODEL_DIR, exist_ok=True)
 
+sys.path.append(project_root)
+
+from src.data.data_loader import DataLoader
+from src.features.feature_store import FeatureStore
+
 print("PROCESSED DATA PATH:", PROCESSED_DATA_PATH)
 print("MODEL DIR:", MODEL_DIR)
 
 # --------------------------------------------------
 # LOAD DATA
 # --------------------------------------------------
-data_path = os.path.join(PROCESSED_DATA_PATH, "cleaned_data.csv")
-df = pd.read_csv(data_path)
+data_path = os.path.join(PROCESSED_DATA_PATH, "cleaned_data.parquet")
+df = DataLoader().load_parquet(data_path, columns=["clean_text", "label"])
 
 print("\n========== MODEL TRAINING ==========")
 print("Input data shape:", df.shape)
@@ -38,7 +44,7 @@ vectorizer = joblib.load(vectorizer_path)
 # --------------------------------------------------
 # FEATURES & TARGET
 # --------------------------------------------------
-X = df["clean_text"].fillna("").astype(str)
+X = df["clean_text"]
 y = df["label"]
 
 # Remove empty texts
@@ -46,8 +52,9 @@ mask = X.str.strip() != ""
 X = X[mask]
 y = y[mask]
 
-# Vectorize
-X_tfidf = vectorizer.transform(X)
+# Vectorize (reuses 05's matrix from the feature store when unchanged)
+store = FeatureStore()
+X_tfidf = store.transform(X, vectorizer)
 
 print("TF-IDF shape:", X_tfidf.shape)
 
@@ -68,8 +75,9 @@ print("Test size :", X_test.shape[0])
 # --------------------------------------------------
 # SAVE SPLITS (FOR NEXT STEPS)
 # --------------------------------------------------
-joblib.dump(X_train, os.path.join(PROCESSED_DATA_PATH, "X_train.pkl"))
-joblib.dump(X_test, os.path.join(PROCESSED_DATA_PATH, "X_test.pkl"))
+# feature matrices as memory-mappable CSR arrays, shared by later steps
+store.save("X_train", X_train)
+store.save("X_test", X_test)
 joblib.dump(y_train, os.path.join(PROCESSED_DATA_PATH, "y_train.pkl"))
 joblib.dump(y_test, os.path.join(PROCESSED_DATA_PATH, "y_test.pkl"))
 
@@ -2,6 +2,8 @@ import pandas as pd
 import numpy as np
 import os
 import joblib
+import sys
+import time
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 
 # --------------------------------------------------
@@ -10,6 +12,11 @@ from sklearn.metrics import accuracy_score, classification_report, confusion_mat
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(script_dir, ".."))
 
+sys.path.append(project_root)
+
+from src.features.feature_store import FeatureStore
+from src.models.stats_snapshot import evaluation_stats, load_eda_stats, section_entry, write_sections
+
 PROCESSED_DATA_PATH = os.path.join(project_root, "data", "processed")
 MODEL_DIR = os.path.join(project_root, "models")
 
@@ -27,7 +34,9 @@ print("\n========== MODEL EVALUATION ==========")
 # --------------------------------------------------
 # LOAD TEST DATA
 # --------------------------------------------------
-X_test = joblib.load(os.path.join(PROCESSED_DATA_PATH, "X_test.pkl"))
+X_test = FeatureStore().load("X_test")
+if X_test is None:
+    raise FileNotFoundError("X_test not found in the feature store, run 06_model_training.py first")
 y_test = joblib.load(os.path.join(PROCESSED_DATA_PATH, "y_test.pkl"))
 
 print("Test data shape:", X_test.shape)
@@ -49,4 +58,20 @@ print(classification_report(y_test, y_pred))
 print("\nConfusion Matrix:")
 print(confusion_matrix(y_test, y_pred))
 
+# --------------------------------------------------
+# STATS SNAPSHOT (SERVED BY /model-stats)
+# --------------------------------------------------
+model_stats = evaluation_stats(y_test, y_pred)
+model_stats["last_trained"] = time.strftime("%Y-%m-%d", time.localtime(os.path.getmtime(model_path)))
+
+sections = {"model": section_entry(model_stats)}
+# dataset stats of 04_eda.py, if it ran
+eda = load_eda_stats(MODEL_DIR)
+if eda is not None:
+    sections["eda"] = eda
+
+# seals the snapshot with the version of the artifacts evaluated here
+snapshot = write_sections(MODEL_DIR, sections, seal=True)
+print("\nStats snapshot written for model version:", snapshot["model_version"])
+
 print("\nModel evaluation completed successfully")
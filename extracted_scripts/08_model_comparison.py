@@ -1,11 +1,35 @@
-import pickle
 import pandas as pd
+import os
+import sys
 
-from sklearn.linear_model import LogisticRegression
-from sklearn.naive_bayes import MultinomialNB
-from sklearn.svm import LinearSVC
-from sklearn.ensemble import RandomForestClassifier
+# --------------------------------------------------
+# PATH HANDLING (PIPELINE SAFE)
+# --------------------------------------------------
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, ".."))
 
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+REPORT_DIR = os.path.join(project_root, "artifacts", "reports")
+RESULTS_PATH = os.path.join(REPORT_DIR, "training_comparison.csv")
+REPORT_PATH = os.path.join(REPORT_DIR, "model_comparison_report.md")
 
+sys.path.append(project_root)
 
+from src.models.model_comparison import ModelComparator
+
+print("\n========== MODEL COMPARISON ==========")
+
+# --------------------------------------------------
+# LOAD RESULTS OF 09 (no models are trained here)
+# --------------------------------------------------
+if not os.path.exists(RESULTS_PATH):
+    raise FileNotFoundError("training_comparison.csv not found, run 09_model_training_comparison.py first")
+results_df = pd.read_csv(RESULTS_PATH)
+
+print(results_df.sort_values(by="F1 Score", ascending=False))
+
+# --------------------------------------------------
+# COMPARISON REPORT
+# --------------------------------------------------
+ModelComparator().generate_report(results_df, output_path=REPORT_PATH)
+
+print("\nModel comparison completed successfully")
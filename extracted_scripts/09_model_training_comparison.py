@@ -1,11 +1,12 @@
 import pandas as pd
 import numpy as np
 import os
+import sys
 import joblib
 from sklearn.linear_model import LogisticRegression
 from sklearn.naive_bayes import MultinomialNB
 from sklearn.svm import LinearSVC
-from sklearn.metrics import accuracy_score
+from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
 
 # --------------------------------------------------
 # PATH HANDLING (PIPELINE SAFE)
@@ -15,6 +16,11 @@ project_root = os.path.abspath(os.path.join(script_dir, ".."))
 
 PROCESSED_DATA_PATH = os.path.join(project_root, "data", "processed")
 MODEL_DIR = os.path.join(project_root, "models")
+RESULTS_PATH = os.path.join(project_root, "artifacts", "reports", "training_comparison.csv")
+
+sys.path.append(project_root)
+
+from src.features.feature_store import FeatureStore
 
 print("PROCESSED DATA PATH:", PROCESSED_DATA_PATH)
 print("MODEL DIR:", MODEL_DIR)
@@ -24,8 +30,11 @@ print("\n========== MODEL TRAINING COMPARISON ==========")
 # --------------------------------------------------
 # LOAD TRAIN / TEST DATA
 # --------------------------------------------------
-X_train = joblib.load(os.path.join(PROCESSED_DATA_PATH, "X_train.pkl"))
-X_test = joblib.load(os.path.join(PROCESSED_DATA_PATH, "X_test.pkl"))
+store = FeatureStore()
+X_train = store.load("X_train")
+X_test = store.load("X_test")
+if X_train is None or X_test is None:
+    raise FileNotFoundError("Feature matrices not found in the feature store, run 06_model_training.py first")
 y_train = joblib.load(os.path.join(PROCESSED_DATA_PATH, "y_train.pkl"))
 y_test = joblib.load(os.path.join(PROCESSED_DATA_PATH, "y_test.pkl"))
 
@@ -52,13 +61,23 @@ for name, model in models.items():
     preds = model.predict(X_test)
     acc = accuracy_score(y_test, preds)
     print(f"{name} Accuracy: {acc:.4f}")
-    results.append((name, acc))
+    results.append((
+        name, acc,
+        precision_score(y_test, preds, zero_division=0),
+        recall_score(y_test, preds, zero_division=0),
+        f1_score(y_test, preds, zero_division=0)
+    ))
 
 # --------------------------------------------------
 # SUMMARY
 # --------------------------------------------------
-results_df = pd.DataFrame(results, columns=["Model", "Accuracy"])
+results_df = pd.DataFrame(results, columns=["Model", "Accuracy", "Precision", "Recall", "F1 Score"])
 print("\n========== COMPARISON SUMMARY ==========")
 print(results_df.sort_values(by="Accuracy", ascending=False))
 
+# read by 08_model_comparison.py
+os.makedirs(os.path.dirname(RESULTS_PATH), exist_ok=True)
+results_df.to_csv(RESULTS_PATH, index=False)
+print("\nResults saved to:", RESULTS_PATH)
+
 print("\nModel training comparison completed successfully")
@@ -4,6 +4,7 @@ warnings.filterwarnings('ignore')
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
 import seaborn as sns
 import sys
 import os
@@ -13,8 +14,10 @@ sns.set(style="whitegrid")
 
 
 class EDADashboard:
-    def __init__(self, df):
+    def __init__(self, df, pdf=None):
         self.df = df
+        # PdfPages every plot is also saved to
+        self.pdf = pdf
 
         # Fix column names if missing
         if hasattr(self.df, "columns") and (
@@ -31,6 +34,12 @@ class EDADashboard:
             include=['object', 'category']
         ).columns.tolist()
 
+    def _show(self):
+        if self.pdf is not None:
+            self.pdf.savefig()
+        plt.show()
+        plt.close()
+
     def generate_summary(self):
         print("\n--- DATA SUMMARY ---")
         print("\nHead:")
@@ -67,7 +76,7 @@ class EDADashboard:
             plt.title(f"Boxplot of {col}")
 
             plt.tight_layout()
-            plt.show()
+            self._show()
 
             try:
                 print(f"{col} → Skew: {self.df[col].skew():.2f}, "
@@ -88,7 +97,7 @@ class EDADashboard:
         plt.figure(figsize=(10, 8))
         sns.heatmap(corr, cmap='coolwarm', annot=False)
         plt.title("Correlation Matrix")
-        plt.show()
+        self._show()
 
         print(f"\nHigh correlations (> {threshold}):")
         pairs = corr.unstack()
@@ -126,12 +135,17 @@ class EDADashboard:
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(script_dir, ".."))
 PROCESSED_DATA_PATH = os.path.join(project_root, "data", "processed")
+REPORT_PATH = os.path.join(project_root, "artifacts", "reports", "eda_dashboard.pdf")
 
-print("\nAttempting to load cleaned_data.csv for EDA...")
-cleaned_path = os.path.join(PROCESSED_DATA_PATH, "cleaned_data.csv")
+sys.path.append(project_root)
+
+from src.data.data_loader import DataLoader
+
+print("\nAttempting to load cleaned_data.parquet for EDA...")
+cleaned_path = os.path.join(PROCESSED_DATA_PATH, "cleaned_data.parquet")
 
 if os.path.exists(cleaned_path):
-    df = pd.read_csv(cleaned_path)
+    df = DataLoader().load_parquet(cleaned_path)
     print("Data loaded:", df.shape)
 
     if "clean_text" in df.columns:
@@ -149,16 +163,20 @@ if os.path.exists(cleaned_path):
         print("Added text-based numeric features")
 
 else:
-    raise FileNotFoundError("cleaned_data.csv not found")
+    raise FileNotFoundError("cleaned_data.parquet not found")
 
 # --------------------------------------------------
 # RUN DASHBOARD
 # --------------------------------------------------
-dashboard = EDADashboard(df)
-
-dashboard.generate_summary()
-dashboard.analyze_distributions()
-dashboard.analyze_correlations()
+os.makedirs(os.path.dirname(REPORT_PATH), exist_ok=True)
+# no creation date, so an unchanged dashboard gives an identical file
+with PdfPages(REPORT_PATH, metadata={"CreationDate": None}) as pdf:
+    dashboard = EDADashboard(df, pdf=pdf)
+
+    dashboard.generate_summary()
+    dashboard.analyze_distributions()
+    dashboard.analyze_correlations()
+print("\nDashboard plots saved to:", REPORT_PATH)
 
 df_enhanced = dashboard.create_features()
 
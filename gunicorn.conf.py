@@ -0,0 +1,26 @@
+# Loaded automatically by `gunicorn app:app` (see Procfile).
+import glob
+import os
+
+from src.utils.metrics import MULTIPROC_DIR, mark_process_dead
+
+
+def on_starting(server):
+    # samples left over from a previous run would be added to this one's
+    if MULTIPROC_DIR:
+        os.makedirs(MULTIPROC_DIR, exist_ok=True)
+        for path in glob.glob(os.path.join(MULTIPROC_DIR, "*.db")):
+            os.remove(path)
+
+
+def when_ready(server):
+    # the master starts the one job worker pool of this server; workers
+    # (and anything else importing app.py) start none. The pool exits with
+    # the master.
+    from src.api.jobs import JobRunner, JOB_WORKERS
+
+    server.job_runner = JobRunner(workers=JOB_WORKERS).start()
+
+
+def child_exit(server, worker):
+    mark_process_dead(worker.pid)
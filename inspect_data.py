@@ -2,6 +2,8 @@ import pandas as pd
 import os
 import sys
 
+from src.features.feature_store import FeatureStore
+
 def inspect_file(path):
     print(f"--- Inspecting {os.path.basename(path)} ---")
     if not os.path.exists(path):
@@ -9,8 +11,12 @@ def inspect_file(path):
         return
 
     try:
-        if path.endswith('.pkl'):
+        if os.path.isdir(path):
+            data = FeatureStore(os.path.dirname(path)).load(os.path.basename(path))
+        elif path.endswith('.pkl'):
             data = pd.read_pickle(path)
+        elif path.endswith('.parquet'):
+            data = pd.read_parquet(path)
         else:
             data = pd.read_csv(path)
             
@@ -31,5 +37,5 @@ def inspect_file(path):
         print(f"Error reading file: {e}")
     print("\n")
 
-inspect_file(r"c:\project\fake_news_detection_media_integrity\data\processed\cleaned_data.csv")
-inspect_file(r"c:\project\fake_news_detection_media_integrity\data\processed\X_train.pkl")
+inspect_file(r"c:\project\fake_news_detection_media_integrity\data\processed\cleaned_data.parquet")
+inspect_file(r"c:\project\fake_news_detection_media_integrity\data\processed\features\X_train")
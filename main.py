@@ -2,6 +2,9 @@ import os
 import sys
 import time
 
+from src.pipeline.runner import PipelineRunner, FAILED, BLOCKED
+from src.pipeline.steps import PIPELINE_STEPS
+
 
 def run_command(command, step_name):
     print("\n" + "=" * 60)
@@ -28,23 +31,14 @@ def main():
     print("*" * 60)
     print(f"Project Root: {BASE_DIR}")
 
-    steps = [
-        ("01 Data Collection", "python extracted_scripts/01_data_collection.py"),
-        ("02 Data Cleaning", "python extracted_scripts/02_data_cleaning.py"),
-        ("03 Data Quality Report", "python extracted_scripts/03_data_quality_report.py"),
-        ("04 EDA", "python extracted_scripts/04_eda.py"),
-        ("05 Feature Engineering", "python extracted_scripts/05_feature_engineering.py"),
-        ("06 Model Training", "python extracted_scripts/06_model_training.py"),
-        ("07 Model Evaluation", "python extracted_scripts/07_model_evaluation.py"),
-        ("08 Model Comparison", "python extracted_scripts/08_model_comparison.py"),
-        ("09 Training Comparison", "python extracted_scripts/09_model_training_comparison.py"),
-        ("10 EDA Dashboard", "python extracted_scripts/10_eda_dashboard.py"),
-    ]
-
     pipeline_start = time.time()
 
-    for name, cmd in steps:
-        run_command(cmd, name)
+    # Steps run in dependency order, independent ones in parallel; steps
+    # whose inputs and code are unchanged since their last run are skipped
+    outcomes = PipelineRunner(PIPELINE_STEPS).run()
+    if any(outcome in (FAILED, BLOCKED) for outcome in outcomes.values()):
+        print("\n[ERROR] Pipeline failed")
+        sys.exit(1)
 
     print("\n" + "=" * 60)
     print("PREDICTION (USER INPUT)")
@@ -1,11 +1,16 @@
 import pandas as pd
 import numpy as np
 import os
+import sys
 import pickle
+import joblib
 import matplotlib.pyplot as plt
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.model_selection import train_test_split
 
+sys.path.append("..")
+from src.features.feature_store import FeatureStore
+
 # Mock display for script environment
 def display(obj):
     print(obj)
@@ -14,15 +19,14 @@ print("Starting verification...")
 
 # Load Data
 try:
-    df = pd.read_csv("../data/processed/cleaned_data.csv")
+    df = pd.read_parquet("../data/processed/cleaned_data.parquet", columns=["clean_text", "label"])
     print("Before Feature Engineering - Shape:", df.shape)
     print(df.head())
 except FileNotFoundError:
-    print("Error: ../data/processed/cleaned_data.csv not found.")
+    print("Error: ../data/processed/cleaned_data.parquet not found.")
     exit(1)
 
 # Clean Data
-df["clean_text"] = df["clean_text"].fillna("").astype(str)
 df = df[df["clean_text"].str.strip() != ""]
 
 # X/y
@@ -36,7 +40,15 @@ tfidf = TfidfVectorizer(
     stop_words="english"
 )
 
-X_tfidf = tfidf.fit_transform(X_text)
+# Step 05's fitted vectorizer has these settings, and its matrix for this
+# corpus is in the feature store: reuse both instead of refitting
+store = FeatureStore("../data/processed/features")
+if os.path.exists("../models/tfidf_vectorizer.pkl"):
+    fitted = joblib.load("../models/tfidf_vectorizer.pkl")
+    if fitted.get_params() == tfidf.get_params():
+        tfidf = fitted
+
+X_tfidf = store.transform(X_text, tfidf, fit=not hasattr(tfidf, "vocabulary_"))
 print("After Feature Engineering - Shape:", X_tfidf.shape)
 
 # Sample of engineered features
@@ -57,10 +69,8 @@ print("Test size:", X_test.shape)
 
 # Save Matrices
 os.makedirs("../data/processed", exist_ok=True)
-with open("../data/processed/X_train.pkl", "wb") as f:
-    pickle.dump(X_train, f)
-with open("../data/processed/X_test.pkl", "wb") as f:
-    pickle.dump(X_test, f)
+store.save("X_train", X_train)
+store.save("X_test", X_test)
 with open("../data/processed/y_train.pkl", "wb") as f:
     pickle.dump(y_train, f)
 with open("../data/processed/y_test.pkl", "wb") as f:
@@ -1,11 +1,8 @@
 import os
 import sys
-import re
-import string
 import nltk
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
 from src.inference.predictor import FakeNewsPredictor
+from src.preprocessing.text_normalizer import clean_text
 
 # --------------------------------------------------
 # NLTK SETUP (SAFE)
@@ -14,22 +11,8 @@ nltk.download("stopwords", quiet=True)
 nltk.download("wordnet", quiet=True)
 nltk.download("omw-1.4", quiet=True)
 
-stop_words = set(stopwords.words("english"))
-lemmatizer = WordNetLemmatizer()
-
-# --------------------------------------------------
-# TEXT CLEANING (SAME AS TRAINING)
-# --------------------------------------------------
-def clean_text(text):
-    text = str(text).lower()
-    text = re.sub(r"http\S+", "", text)
-    text = re.sub(r"@\w+", "", text)
-    text = re.sub(r"#\w+", "", text)
-    text = re.sub(r"\d+", "", text)
-    text = text.translate(str.maketrans("", "", string.punctuation))
-    tokens = text.split()
-    tokens = [lemmatizer.lemmatize(w) for w in tokens if w not in stop_words]
-    return " ".join(tokens)
+# clean_text is the training-time cleaning (02_data_cleaning.py), shared
+# through src/preprocessing/text_normalizer.py
 
 # --------------------------------------------------
 # RESULT DISPLAY
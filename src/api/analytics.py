@@ -1,12 +1,16 @@
 import re
-from textblob import TextBlob
 from urllib.parse import urlparse
 
+from src.preprocessing.analysis_document import AnalysisDocument
+from src.utils.metrics import stage
+
+@stage("sentiment")
 def get_sentiment(text):
     """
     Returns sentiment polarity and a human-readable label.
+    Accepts a string or an AnalysisDocument (reuses its TextBlob).
     """
-    analysis = TextBlob(text)
+    analysis = AnalysisDocument.of(text).blob
     polarity = analysis.sentiment.polarity
     
     if polarity > 0.1:
@@ -16,6 +20,7 @@ def get_sentiment(text):
     else:
         return polarity, "Neutral"
 
+@stage("domain_trust")
 def get_domain_trust(url):
     """
     Very basic domain trust scoring logic based on known patterns.
@@ -42,15 +47,15 @@ def get_domain_trust(url):
         
     return 60, "Moderate (Standard Web Resource)"
 
+@stage("readability")
 def get_readability_stats(text):
     """
     Calculates basic text stats for the dashboard.
+    Accepts a string or an AnalysisDocument (reuses its tokens).
     """
-    words = text.split()
-    word_count = len(words)
-    avg_word_len = sum(len(w) for w in words) / word_count if word_count > 0 else 0
-    
+    doc = AnalysisDocument.of(text)
+
     return {
-        "word_count": word_count,
-        "avg_word_length": round(avg_word_len, 2)
+        "word_count": doc.word_count,
+        "avg_word_length": round(doc.avg_word_length, 2)
     }
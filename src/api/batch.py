@@ -1,29 +1,195 @@
+import json
+import os
 import time
 
-def process_batch_items(predictor, analytics_engine, items):
+# Items scored per vectorized call on /batch-predict/stream
+STREAM_CHUNK_SIZE = int(os.environ.get("STREAM_CHUNK_SIZE", "32"))
+# Longest accepted NDJSON input line
+STREAM_MAX_LINE_BYTES = int(os.environ.get("STREAM_MAX_LINE_BYTES", str(1024 * 1024)))
+
+def _summarize_result(item, item_type, result):
+    """
+    Keeps the fields the batch view needs from a full predict() result.
+    """
+    return {
+        "item": item[:50] + "..." if len(item) > 50 else item,
+        "type": item_type,
+        "prediction": result.get("prediction"),
+        "confidence": result.get("confidence"),
+        "mode": result.get("mode"),
+        "reason": result.get("reason"),
+        "risk_level": result.get("risk_level"),
+        "keywords": result.get("keywords"),
+        "translation_status": result.get("translation_status"),
+        "timestamp": time.strftime("%H:%M:%S")
+    }
+
+def _error_result(item, item_type, error):
+    return {
+        "item": item[:50] + "..." if len(item) > 50 else item,
+        "type": item_type,
+        "error": error,
+        "timestamp": time.strftime("%H:%M:%S")
+    }
+
+def _process_items(predictor, items, url_extractor=None):
+    """
+    Scores a list of items (URLs or Text) and returns one summarized result
+    (or per-item error) for each, in the same order.
+    """
+    results = [None] * len(items)
+
+    item_types = ["URL" if item.startswith('http') else "Text" for item in items]
+
+    url_positions = [i for i, t in enumerate(item_types) if t == "URL"]
+    extracted = {}
+    if url_positions and url_extractor is not None:
+        fetched = url_extractor.extract_many([items[i] for i in url_positions])
+        extracted = dict(zip(url_positions, fetched))
+
+    texts = []
+    positions = []
+
+    for i, (item, item_type) in enumerate(zip(items, item_types)):
+        if item_type == "URL":
+            if url_extractor is None:
+                results[i] = _error_result(item, item_type, "URL extraction is not available.")
+                continue
+            text, error = extracted[i]
+            if error:
+                results[i] = _error_result(item, item_type, error)
+                continue
+        else:
+            text = item.strip()
+            if not text:
+                results[i] = _error_result(item, item_type, "Empty text.")
+                continue
+
+        texts.append(text)
+        positions.append((i, item, item_type))
+
+    if texts:
+        predictions = predictor.predict_batch(texts)
+        for (i, item, item_type), result in zip(positions, predictions):
+            results[i] = _summarize_result(item, item_type, result)
+
+    return results
+
+def process_batch_items(predictor, analytics_engine, items, url_extractor=None):
     """
     Processes a list of items (URLs or Text) and returns aggregated results.
+
+    URL items are fetched concurrently through url_extractor.extract_many()
+    (when given); failed URLs come back as per-item errors. All texts are
+    then scored together through predictor.predict_batch(), so the ML stage
+    costs one vectorizer/model call for the whole batch.
     """
-    results = []
     start_time = time.time()
-    
-    for item in items:
-        item_type = "URL" if item.startswith('http') else "Text"
-        
-        # This is a simplified simulation of the predictor/analytics flow
-        # In a real app, we'd call the predictor.predict() and analytics functions
-        # For now, we reuse the logic from predict_api to return a list
-        results.append({
-            "item": item[:50] + "..." if len(item) > 50 else item,
-            "type": item_type,
-            "timestamp": time.strftime("%H:%M:%S")
-        })
-        
+
+    results = _process_items(predictor, items, url_extractor=url_extractor)
+
     execution_time = round(time.time() - start_time, 2)
-    
+
     return {
         "batch_id": int(time.time()),
         "total_items": len(items),
         "results": results,
         "execution_time": execution_time
     }
+
+# ---------------- NDJSON STREAMING ----------------
+def _read_lines(stream, max_line_bytes):
+    """
+    Yields the lines of a binary stream one at a time. Lines longer than
+    max_line_bytes are consumed without being kept and yielded as None.
+    """
+    while True:
+        line = stream.readline(max_line_bytes + 1)
+        if not line:
+            return
+        if len(line) > max_line_bytes and not line.endswith(b"\n"):
+            # drain the rest of the oversized line
+            while line and not line.endswith(b"\n"):
+                line = stream.readline(max_line_bytes + 1)
+            yield None
+            continue
+        yield line
+
+def _parse_stream_line(line):
+    """
+    Returns (id, item, error) for one NDJSON input line. A line is either a
+    JSON string or an object with "text" or "url" and an optional "id" that
+    is echoed back in the result.
+    """
+    try:
+        value = json.loads(line)
+    except ValueError:
+        return None, None, "Invalid JSON."
+
+    if isinstance(value, str):
+        return None, value, None
+
+    if isinstance(value, dict):
+        item_id = value.get("id")
+        item = value.get("text", value.get("url"))
+        if isinstance(item, str):
+            return item_id, item, None
+        return item_id, None, "Expected a \"text\" or \"url\" string."
+
+    return None, None, "Expected a JSON string or object."
+
+def _stream_chunk(predictor, chunk, url_extractor):
+    items = [item for _, _, item, error in chunk if error is None]
+    try:
+        scored = iter(_process_items(predictor, items, url_extractor=url_extractor))
+        failure = None
+    except Exception as e:
+        scored = None
+        failure = str(e)
+
+    for index, item_id, item, error in chunk:
+        if error is not None:
+            result = {"error": error, "timestamp": time.strftime("%H:%M:%S")}
+        elif scored is None:
+            result = _error_result(item, "URL" if item.startswith('http') else "Text", failure)
+        else:
+            result = next(scored)
+
+        line = {"index": index}
+        if item_id is not None:
+            line["id"] = item_id
+        line.update(result)
+        yield json.dumps(line) + "\n"
+
+def stream_batch_results(predictor, stream, url_extractor=None,
+                         chunk_size=STREAM_CHUNK_SIZE,
+                         max_line_bytes=STREAM_MAX_LINE_BYTES):
+    """
+    Reads NDJSON items from a binary stream and yields one NDJSON result line
+    per input line, in input order. "index" is the position of the input
+    among the non-blank lines.
+
+    Items are scored in micro-chunks of chunk_size the same way as
+    process_batch_items(), so each chunk costs one vectorized model call
+    while only one chunk is held in memory. A chunk's results are
+    yielded as soon as it is scored, before the next one is read.
+    """
+    chunk = []
+    index = 0
+
+    for line in _read_lines(stream, max_line_bytes):
+        if line is None:
+            chunk.append((index, None, None, f"Line longer than {max_line_bytes} bytes."))
+        else:
+            if not line.strip():
+                continue
+            item_id, item, error = _parse_stream_line(line)
+            chunk.append((index, item_id, item, error))
+        index += 1
+
+        if len(chunk) >= chunk_size:
+            yield from _stream_chunk(predictor, chunk, url_extractor)
+            chunk = []
+
+    if chunk:
+        yield from _stream_chunk(predictor, chunk, url_extractor)
@@ -0,0 +1,69 @@
+import os
+import threading
+import time
+from collections import deque
+
+# Requests slower than this (milliseconds) are kept in the slow request log
+SLOW_REQUEST_MS = float(os.environ.get("SLOW_REQUEST_MS", "1000"))
+SLOW_REQUEST_LOG_SIZE = int(os.environ.get("SLOW_REQUEST_LOG_SIZE", "200"))
+# Inputs are stored truncated to this many characters
+SLOW_REQUEST_INPUT_CHARS = 500
+
+
+class SlowRequestLog:
+    """
+    Bounded in-memory ring buffer of requests that took at least
+    threshold_ms, with their stage timings and whatever details the
+    endpoint attached (input, decision path, errors). Oldest entries are
+    dropped first. Each process keeps its own log.
+    """
+
+    def __init__(self, capacity=SLOW_REQUEST_LOG_SIZE, threshold_ms=SLOW_REQUEST_MS):
+        self.threshold_ms = threshold_ms
+        self._entries = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+    def record(self, endpoint, status, total_ms, timings, details=None):
+        """
+        Keeps the request if it was slow; returns True when it was kept.
+        """
+        if total_ms < self.threshold_ms:
+            return False
+
+        entry = {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "pid": os.getpid(),
+            "endpoint": endpoint,
+            "status": status,
+            "total_ms": round(total_ms, 2),
+            "timings": round_timings(timings or {})
+        }
+        entry.update(details or {})
+
+        with self._lock:
+            self._entries.append(entry)
+            self.recorded += 1
+        return True
+
+    def entries(self, limit=None):
+        """
+        Newest first.
+        """
+        with self._lock:
+            entries = list(reversed(self._entries))
+        return entries[:limit] if limit else entries
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def round_timings(timings):
+    return {name: round(ms, 2) for name, ms in timings.items()}
+
+
+def truncate_input(text):
+    if len(text) > SLOW_REQUEST_INPUT_CHARS:
+        return text[:SLOW_REQUEST_INPUT_CHARS] + "..."
+    return text
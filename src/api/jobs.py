@@ -0,0 +1,397 @@
+import atexit
+import json
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+
+JOB_STORE_PATH = os.environ.get(
+    "JOB_STORE_PATH",
+    os.path.join(BASE_DIR, "artifacts", "jobs", "jobs.sqlite")
+)
+# Worker processes started by the app server (gunicorn's master, or
+# `python app.py`); 0 leaves jobs to `python -m src.api.jobs`
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "1"))
+JOB_MAX_ITEMS = int(os.environ.get("JOB_MAX_ITEMS", "100000"))
+# Items per process_batch_items call; progress is saved after each chunk
+JOB_CHUNK_SIZE = int(os.environ.get("JOB_CHUNK_SIZE", "100"))
+JOB_POLL_INTERVAL = float(os.environ.get("JOB_POLL_INTERVAL", "1.0"))
+# A running job whose worker hasn't reported for this long is queued again
+JOB_STALE_AFTER = float(os.environ.get("JOB_STALE_AFTER", "300"))
+# Finished jobs (and their results) are deleted after this many seconds
+JOB_RETENTION = float(os.environ.get("JOB_RETENTION", str(7 * 24 * 3600)))
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED = (COMPLETED, FAILED, CANCELLED)
+
+
+class JobStore:
+    """
+    Batch jobs, their input items and per-item results in one SQLite file
+    shared by every process that opens it (gunicorn workers and job
+    workers).
+
+    A worker claims a job atomically and gets a claim token; results are
+    only saved while the job is still running under that token, so a
+    cancelled job or one re-queued after its worker went away is never
+    written to by a stale worker.
+    """
+
+    def __init__(self, path=JOB_STORE_PATH):
+        self.path = path
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._conn()
+        conn.executescript(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY, status TEXT NOT NULL,"
+            " total INTEGER NOT NULL, processed INTEGER NOT NULL DEFAULT 0,"
+            " succeeded INTEGER NOT NULL DEFAULT 0, failed INTEGER NOT NULL DEFAULT 0,"
+            " created REAL NOT NULL, started REAL, finished REAL, heartbeat REAL,"
+            " claim TEXT, worker TEXT, error TEXT);"
+            "CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status, created);"
+            "CREATE TABLE IF NOT EXISTS job_items ("
+            " job_id TEXT NOT NULL, idx INTEGER NOT NULL, item TEXT NOT NULL,"
+            " PRIMARY KEY (job_id, idx));"
+            "CREATE TABLE IF NOT EXISTS job_results ("
+            " job_id TEXT NOT NULL, idx INTEGER NOT NULL, result TEXT NOT NULL,"
+            " PRIMARY KEY (job_id, idx));"
+        )
+        conn.commit()
+
+    def _conn(self):
+        # one connection per (thread, pid), as in SQLiteCache
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _write(self):
+        """
+        Context manager for a write transaction. BEGIN IMMEDIATE takes the
+        database write lock up front, so read-then-update sequences (claims)
+        are atomic across processes.
+        """
+        return _Transaction(self._conn())
+
+    # ---------------- API SIDE ----------------
+    def create(self, items):
+        job_id = uuid.uuid4().hex
+        with self._write() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, status, total, created) VALUES (?, ?, ?, ?)",
+                (job_id, QUEUED, len(items), time.time())
+            )
+            conn.executemany(
+                "INSERT INTO job_items (job_id, idx, item) VALUES (?, ?, ?)",
+                ((job_id, i, item) for i, item in enumerate(items))
+            )
+        return job_id
+
+    def get(self, job_id):
+        row = self._conn().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        return {
+            "job_id": row["id"],
+            "status": row["status"],
+            "total_items": row["total"],
+            "processed": row["processed"],
+            "succeeded": row["succeeded"],
+            "failed": row["failed"],
+            "progress": round(row["processed"] / row["total"], 4) if row["total"] else 1.0,
+            "created_at": row["created"],
+            "started_at": row["started"],
+            "finished_at": row["finished"],
+            "error": row["error"]
+        }
+
+    def results(self, job_id, offset=0, limit=100):
+        rows = self._conn().execute(
+            "SELECT idx, result FROM job_results WHERE job_id = ? AND idx >= ? "
+            "ORDER BY idx LIMIT ?",
+            (job_id, offset, limit)
+        ).fetchall()
+
+        page = []
+        for row in rows:
+            result = {"index": row["idx"]}
+            result.update(json.loads(row["result"]))
+            page.append(result)
+        return page
+
+    def cancel(self, job_id):
+        """
+        Cancels a queued or running job. Returns False when the job had
+        already finished. Results saved so far are kept.
+        """
+        with self._write() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET status = ?, finished = ?, claim = NULL "
+                "WHERE id = ? AND status IN (?, ?)",
+                (CANCELLED, time.time(), job_id, QUEUED, RUNNING)
+            )
+            return cur.rowcount == 1
+
+    # ---------------- WORKER SIDE ----------------
+    def claim(self, worker, stale_after=JOB_STALE_AFTER):
+        """
+        Takes the oldest queued job for this worker. Running jobs whose
+        worker is gone are queued again first and resume after the last
+        saved chunk: right away when the worker was a process on this host
+        that no longer exists (server restart), otherwise once it hasn't
+        reported for stale_after seconds. Returns (job_id, claim_token) or
+        None.
+        """
+        now = time.time()
+        with self._write() as conn:
+            running = conn.execute(
+                "SELECT id, worker, heartbeat FROM jobs WHERE status = ?", (RUNNING,)
+            ).fetchall()
+            for row in running:
+                if row["heartbeat"] < now - stale_after or _is_dead_local_worker(row["worker"]):
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, claim = NULL WHERE id = ?",
+                        (QUEUED, row["id"])
+                    )
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status = ? ORDER BY created LIMIT 1", (QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            token = uuid.uuid4().hex
+            conn.execute(
+                "UPDATE jobs SET status = ?, claim = ?, worker = ?, heartbeat = ?, "
+                "started = COALESCE(started, ?) WHERE id = ?",
+                (RUNNING, token, worker, now, now, row["id"])
+            )
+            return row["id"], token
+
+    def pending_items(self, job_id, limit):
+        """
+        Next items without results. Chunks are saved in order, so these
+        start at the processed counter.
+        """
+        rows = self._conn().execute(
+            "SELECT i.idx, i.item FROM job_items i JOIN jobs j ON j.id = i.job_id "
+            "WHERE i.job_id = ? AND i.idx >= j.processed ORDER BY i.idx LIMIT ?",
+            (job_id, limit)
+        ).fetchall()
+        return [(row["idx"], row["item"]) for row in rows]
+
+    def save_results(self, job_id, token, results):
+        """
+        Stores [(idx, result), ...] and advances the progress counters in
+        one transaction. Returns False (and stores nothing) once the job is
+        no longer running under this claim.
+        """
+        results = list(results)
+        failed = sum(1 for _, r in results if "error" in r)
+
+        with self._write() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET processed = processed + ?, succeeded = succeeded + ?, "
+                "failed = failed + ?, heartbeat = ? WHERE id = ? AND status = ? AND claim = ?",
+                (len(results), len(results) - failed, failed, time.time(), job_id, RUNNING, token)
+            )
+            if cur.rowcount != 1:
+                return False
+            conn.executemany(
+                "INSERT OR REPLACE INTO job_results (job_id, idx, result) VALUES (?, ?, ?)",
+                ((job_id, idx, json.dumps(result)) for idx, result in results)
+            )
+            return True
+
+    def finish(self, job_id, token, status=COMPLETED, error=None):
+        with self._write() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished = ?, claim = NULL "
+                "WHERE id = ? AND status = ? AND claim = ?",
+                (status, error, time.time(), job_id, RUNNING, token)
+            )
+
+    def purge(self, older_than=JOB_RETENTION):
+        """
+        Deletes finished jobs (items and results included) older than
+        older_than seconds.
+        """
+        cutoff = time.time() - older_than
+        with self._write() as conn:
+            ids = [
+                row["id"] for row in conn.execute(
+                    "SELECT id FROM jobs WHERE status IN (?, ?, ?) AND finished < ?",
+                    FINISHED + (cutoff,)
+                )
+            ]
+            for job_id in ids:
+                conn.execute("DELETE FROM job_items WHERE job_id = ?", (job_id,))
+                conn.execute("DELETE FROM job_results WHERE job_id = ?", (job_id,))
+                conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        return len(ids)
+
+
+def _worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _is_dead_local_worker(worker):
+    host, _, pid = (worker or "").rpartition(":")
+    if host != socket.gethostname() or not pid.isdigit():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass
+    return False
+
+
+class _Transaction:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
+        return False
+
+
+# ---------------- WORKERS ----------------
+def run_job(store, job_id, token, predictor, url_extractor=None,
+            chunk_size=JOB_CHUNK_SIZE, keep_going=None):
+    """
+    Scores a claimed job chunk by chunk through process_batch_items(),
+    saving results and progress after every chunk. Stops early when the job
+    is cancelled or taken over by another worker, or when keep_going()
+    turns false (the job then stays running until it is reclaimed).
+    """
+    from src.api.batch import process_batch_items
+
+    while keep_going is None or keep_going():
+        pending = store.pending_items(job_id, chunk_size)
+        if not pending:
+            store.finish(job_id, token)
+            return
+
+        indexes = [idx for idx, _ in pending]
+        try:
+            batch = process_batch_items(
+                predictor, None, [item for _, item in pending], url_extractor=url_extractor
+            )
+        except Exception as e:
+            store.finish(job_id, token, status=FAILED, error=str(e))
+            return
+
+        if not store.save_results(job_id, token, zip(indexes, batch["results"])):
+            return
+
+
+def worker_loop(store_path=JOB_STORE_PATH, poll_interval=JOB_POLL_INTERVAL,
+                chunk_size=JOB_CHUNK_SIZE, parent_pid=None):
+    """
+    Claims and runs jobs until stopped. With parent_pid set the loop exits
+    once that process is gone, so pool workers don't outlive the app.
+    """
+    from src.inference.predictor import FakeNewsPredictor
+    from src.api.url_extractor import URLExtractor
+
+    store = JobStore(store_path)
+    predictor = FakeNewsPredictor()
+    url_extractor = URLExtractor()
+    worker = _worker_name()
+    last_purge = 0.0
+
+    def parent_alive():
+        return parent_pid is None or os.getppid() == parent_pid
+
+    while parent_alive():
+        claimed = store.claim(worker)
+        if claimed is None:
+            if time.time() - last_purge > 3600:
+                store.purge()
+                last_purge = time.time()
+            time.sleep(poll_interval)
+            continue
+
+        job_id, token = claimed
+        run_job(store, job_id, token, predictor, url_extractor,
+                chunk_size=chunk_size, keep_going=parent_alive)
+
+
+class JobRunner:
+    """
+    Pool of worker processes running worker_loop(). Every process loads its
+    own FakeNewsPredictor; claims go through the shared JobStore, so any
+    number of runners (one per server, started by gunicorn's master or
+    `python app.py`, or standalone) can serve the same store.
+    """
+
+    def __init__(self, store_path=JOB_STORE_PATH, workers=JOB_WORKERS):
+        self.store_path = store_path
+        self.workers = workers
+        self._processes = []
+
+    def start(self):
+        # fresh interpreters rather than multiprocessing: forking would copy
+        # the parent's threads and sockets, and spawn re-runs the parent's
+        # main script (app.py, benchmarks) in every child
+        env = dict(os.environ, JOB_STORE_PATH=self.store_path)
+        for _ in range(self.workers):
+            self._processes.append(subprocess.Popen(
+                [sys.executable, "-m", "src.api.jobs", "worker", str(os.getpid())],
+                cwd=BASE_DIR, env=env
+            ))
+        if self._processes:
+            atexit.register(self.stop)
+        return self
+
+    def join(self):
+        for process in self._processes:
+            process.wait()
+
+    def stop(self):
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.wait()
+        self._processes = []
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "worker":
+        # one worker: python -m src.api.jobs worker [parent_pid]
+        worker_loop(parent_pid=int(sys.argv[2]) if len(sys.argv) > 2 else None)
+    else:
+        # standalone pool: python -m src.api.jobs [n_workers]
+        n_workers = int(sys.argv[1]) if len(sys.argv) > 1 else max(JOB_WORKERS, 1)
+        runner = JobRunner(workers=n_workers).start()
+        try:
+            runner.join()
+        except KeyboardInterrupt:
+            runner.stop()
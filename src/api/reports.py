@@ -0,0 +1,322 @@
+import base64
+import functools
+import os
+import tempfile
+import time
+from collections import Counter
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import cm
+from reportlab.platypus import (
+    BaseDocTemplate, Flowable, Frame, Image, LongTable, PageTemplate, Paragraph, Spacer, Table, TableStyle
+)
+
+# Reports larger than this are spooled to a temporary file instead of memory
+REPORT_SPOOL_BYTES = int(os.environ.get("REPORT_SPOOL_BYTES", str(8 * 1024 * 1024)))
+# Upper bound on results in one batch report
+REPORT_MAX_ITEMS = int(os.environ.get("REPORT_MAX_ITEMS", "10000"))
+# Rows per table in batch reports; small tables split across pages cheaply
+REPORT_TABLE_ROWS = 200
+
+PAGE_WIDTH, PAGE_HEIGHT = A4
+MARGIN = 2 * cm
+FRAME_WIDTH = PAGE_WIDTH - 2 * MARGIN
+FRAME_HEIGHT = PAGE_HEIGHT - 2 * MARGIN
+
+LABEL_COLORS = {"Real": colors.HexColor("#10b981"), "Fake": colors.HexColor("#ef4444")}
+
+BATCH_COLUMNS = ["#", "Item", "Type", "Prediction", "Confidence", "Mode", "Risk", "Note"]
+BATCH_COLUMN_WIDTHS = [w * cm for w in (1.0, 5.0, 1.1, 1.7, 1.7, 2.0, 1.3, 3.2)]
+
+
+# ---------------- SHARED LAYOUT (built once) ----------------
+@functools.lru_cache(maxsize=None)
+def report_styles():
+    """
+    Sample stylesheet plus the report's own styles. Built on first use and
+    shared by every report; styles are only read during layout.
+    """
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle("ReportTitle", parent=styles["Title"], spaceAfter=12))
+    styles.add(ParagraphStyle("Section", parent=styles["Heading2"], spaceBefore=12, spaceAfter=6))
+    return styles
+
+
+@functools.lru_cache(maxsize=None)
+def field_table_style():
+    return TableStyle([
+        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+        ("FONTNAME", (1, 0), (1, -1), "Helvetica"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ])
+
+
+@functools.lru_cache(maxsize=None)
+def batch_table_style():
+    return TableStyle([
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+        ("FONTSIZE", (0, 0), (-1, -1), 7),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#e0e7ff")),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f8fafc")]),
+        ("LINEBELOW", (0, 0), (-1, 0), 0.5, colors.HexColor("#6366f1")),
+        ("TOPPADDING", (0, 0), (-1, -1), 2),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+    ])
+
+
+def _draw_page(canvas, doc):
+    canvas.saveState()
+    canvas.setFont("Helvetica", 8)
+    canvas.setFillColor(colors.grey)
+    canvas.drawString(MARGIN, MARGIN / 2, doc.title)
+    canvas.drawRightString(PAGE_WIDTH - MARGIN, MARGIN / 2, f"Page {doc.page}  |  {doc.generated_at}")
+    canvas.restoreState()
+
+
+class ReportDocTemplate(BaseDocTemplate):
+    """
+    A4 document with one frame and a footer. The page geometry, styles and
+    table styles are computed once; only the Frame (which holds layout
+    state while a document is built) is created per report.
+    """
+
+    def __init__(self, output, title):
+        super().__init__(
+            output, pagesize=A4, title=title,
+            leftMargin=MARGIN, rightMargin=MARGIN, topMargin=MARGIN, bottomMargin=MARGIN
+        )
+        self.generated_at = time.strftime("%Y-%m-%d %H:%M")
+        frame = Frame(MARGIN, MARGIN, FRAME_WIDTH, FRAME_HEIGHT, id="body")
+        self.addPageTemplates([PageTemplate(id="report", frames=[frame], onPage=_draw_page)])
+
+
+# ---------------- HELPERS ----------------
+def _clip(value, length):
+    text = "" if value is None else str(value)
+    return text if len(text) <= length else text[:length - 3] + "..."
+
+
+def _percent(confidence):
+    if not isinstance(confidence, (int, float)):
+        confidence = 0
+    return f"{round(confidence * 100)} %"
+
+
+def _position(result, i):
+    # job results carry their item index; batch results are in order. A
+    # posted result's index comes from the client, so only an int is used.
+    index = result.get("index")
+    if isinstance(index, int) and not isinstance(index, bool):
+        return index + 1
+    return i + 1
+
+
+def _field_table(rows):
+    table = Table([[label, _clip(value, 90)] for label, value in rows],
+                  colWidths=[4 * cm, FRAME_WIDTH - 4 * cm], hAlign="LEFT")
+    table.setStyle(field_table_style())
+    return table
+
+
+def _decode_chart(chart_base64):
+    chart_bytes = base64.b64decode(chart_base64.split(",")[1])
+    return Image(BytesIO(chart_bytes), width=400, height=300)
+
+
+class HorizontalBars(Flowable):
+    """
+    Labelled horizontal bars with their values, drawn with a handful of
+    canvas calls. Used instead of reportlab.graphics charts, whose widgets
+    re-validate every attribute on each render and cost several ms per
+    report.
+    """
+
+    BAR_HEIGHT = 14
+    GAP = 6
+    LABEL_WIDTH = 2.5 * cm
+    VALUE_WIDTH = 2 * cm
+
+    def __init__(self, bars, max_value=None, value_format="{}"):
+        super().__init__()
+        # [(label, value, color), ...]
+        self.bars = bars
+        self.max_value = max_value or max([value for _, value, _ in bars] + [1])
+        self.value_format = value_format
+
+    def wrap(self, available_width, available_height):
+        self.width = available_width
+        self.height = len(self.bars) * (self.BAR_HEIGHT + self.GAP)
+        return self.width, self.height
+
+    def draw(self):
+        canvas = self.canv
+        track = self.width - self.LABEL_WIDTH - self.VALUE_WIDTH
+        canvas.setFont("Helvetica", 9)
+
+        for i, (label, value, color) in enumerate(self.bars):
+            y = self.height - (i + 1) * (self.BAR_HEIGHT + self.GAP) + self.GAP / 2
+            text_y = y + self.BAR_HEIGHT / 2 - 3
+
+            canvas.setFillColor(colors.black)
+            canvas.drawString(0, text_y, str(label))
+
+            canvas.setFillColor(colors.HexColor("#f1f5f9"))
+            canvas.rect(self.LABEL_WIDTH, y, track, self.BAR_HEIGHT, stroke=0, fill=1)
+            canvas.setFillColor(color)
+            canvas.rect(self.LABEL_WIDTH, y, track * min(value / self.max_value, 1), self.BAR_HEIGHT, stroke=0, fill=1)
+
+            canvas.setFillColor(colors.black)
+            canvas.drawString(self.LABEL_WIDTH + track + 6, text_y, self.value_format.format(value))
+
+
+def probability_chart(prediction, confidence):
+    """
+    Server-side chart of the class probabilities of one result.
+    """
+    percent = round((confidence or 0) * 100)
+    real = percent if prediction == "Real" else 100 - percent
+    return HorizontalBars(
+        [("Real", real, LABEL_COLORS["Real"]), ("Fake", 100 - real, LABEL_COLORS["Fake"])],
+        max_value=100, value_format="{} %"
+    )
+
+
+def summary_chart(counts):
+    """
+    Result counts per label for a batch report.
+    """
+    return HorizontalBars([
+        (label, count, LABEL_COLORS.get(label, colors.grey)) for label, count in counts.items()
+    ])
+
+
+# ---------------- SINGLE REPORT ----------------
+def build_report(data, output):
+    """
+    Writes the one-result report for a /predict response (as posted to
+    /download-pdf) to output. data["chart"] may be a base64 data URL
+    rendered by the client, or "server" to draw the chart here.
+    """
+    styles = report_styles()
+    doc = ReportDocTemplate(output, title="Fake News Detection Report")
+
+    sentiment = data.get("sentiment") or {}
+    stats = data.get("stats") or {}
+
+    content = [
+        Paragraph("Fake News Detection Report", styles["ReportTitle"]),
+        _field_table([
+            ("Prediction:", data.get("prediction")),
+            ("Confidence:", _percent(data.get("confidence"))),
+            ("Risk Level:", data.get("risk_level", "N/A")),
+            ("Sentiment:", f"{sentiment.get('label', 'N/A')} (Score: {sentiment.get('score', 0)})"),
+            ("Word Count:", stats.get("word_count", 0)),
+            ("Mode:", data.get("mode")),
+            ("Reason:", data.get("reason")),
+        ])
+    ]
+
+    explanation = data.get("explanation") or []
+    if explanation:
+        content.append(Paragraph("Decision path", styles["Section"]))
+        content.extend(Paragraph(escape(str(step)), styles["Normal"]) for step in explanation)
+
+    chart = data.get("chart")
+    if chart == "server":
+        content.append(Spacer(1, 12))
+        content.append(probability_chart(data.get("prediction"), data.get("confidence")))
+    elif chart:
+        content.append(_decode_chart(chart))
+
+    doc.build(content)
+
+
+# ---------------- BATCH REPORT ----------------
+def _batch_row(position, result):
+    # every cell as text: reportlab takes list cells for flowables
+    if "error" in result:
+        return [
+            position, _clip(result.get("item"), 40), _clip(result.get("type"), 20),
+            "Error", "", "", "", _clip(result["error"], 30)
+        ]
+    return [
+        position, _clip(result.get("item"), 40), _clip(result.get("type"), 20),
+        _clip(result.get("prediction"), 20), _percent(result.get("confidence")),
+        _clip(result.get("mode"), 20), _clip(result.get("risk_level"), 20), _clip(result.get("reason"), 30)
+    ]
+
+
+def build_batch_report(results, output, title="Batch Analysis Report"):
+    """
+    Writes one multi-page PDF for a list of batch/job results (the items of
+    a /batch-predict "results" list or of /jobs/<id>/results): a summary
+    with counts and a chart, then one table row per result.
+    """
+    styles = report_styles()
+    doc = ReportDocTemplate(output, title=title)
+
+    # as text, since posted results may hold anything (lists aren't hashable)
+    labels = Counter("Error" if "error" in r else str(r.get("prediction")) for r in results)
+    modes = Counter(str(r.get("mode")) for r in results if "error" not in r)
+
+    content = [
+        Paragraph(escape(title), styles["ReportTitle"]),
+        _field_table(
+            [("Items:", len(results))]
+            + [(f"{label}:", count) for label, count in sorted(labels.items(), key=lambda x: str(x[0]))]
+            + [(f"{mode}:", count) for mode, count in sorted(modes.items(), key=lambda x: str(x[0]))]
+        )
+    ]
+    if results:
+        content.append(Spacer(1, 12))
+        content.append(summary_chart(dict(sorted(labels.items(), key=lambda x: str(x[0])))))
+
+    content.append(Paragraph("Results", styles["Section"]))
+
+    rows = [_batch_row(_position(result, i), result) for i, result in enumerate(results)]
+    for start in range(0, len(rows), REPORT_TABLE_ROWS):
+        table = LongTable(
+            [BATCH_COLUMNS] + rows[start:start + REPORT_TABLE_ROWS],
+            colWidths=BATCH_COLUMN_WIDTHS, repeatRows=1, hAlign="LEFT"
+        )
+        table.setStyle(batch_table_style())
+        content.append(table)
+
+    doc.build(content)
+
+
+# ---------------- OUTPUT ----------------
+def spooled_pdf(build, *args, **kwargs):
+    """
+    Runs build(*args, output, **kwargs) into a spooled temporary file
+    (memory up to REPORT_SPOOL_BYTES, then disk) and returns
+    (chunk_iterator, size). The iterator closes the file when exhausted.
+    """
+    output = tempfile.SpooledTemporaryFile(max_size=REPORT_SPOOL_BYTES)
+    try:
+        build(*args, output, **kwargs)
+    except Exception:
+        output.close()
+        raise
+
+    size = output.tell()
+    output.seek(0)
+
+    def chunks():
+        try:
+            while True:
+                chunk = output.read(64 * 1024)
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            output.close()
+
+    return chunks(), size
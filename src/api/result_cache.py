@@ -0,0 +1,105 @@
+import glob
+import os
+import threading
+import time
+
+from src.api.url_extractor import canonicalize_url
+from src.utils.cache import build_cache, content_hash
+from src.utils.common import artifact_version
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+
+RESULT_CACHE_PATH = os.environ.get(
+    "RESULT_CACHE_PATH",
+    os.path.join(BASE_DIR, "artifacts", "cache", "predictions.sqlite")
+)
+RESULT_CACHE_TTL = int(os.environ.get("RESULT_CACHE_TTL", "3600"))
+RESULT_CACHE_MEMORY_ENTRIES = int(os.environ.get("RESULT_CACHE_MEMORY_ENTRIES", "5000"))
+RESULT_CACHE_DISK_ENTRIES = int(os.environ.get("RESULT_CACHE_DISK_ENTRIES", "100000"))
+# How often (seconds) the model artifacts are re-checked for changes
+RESULT_CACHE_VERSION_CHECK = float(os.environ.get("RESULT_CACHE_VERSION_CHECK", "1.0"))
+
+
+class PredictionCache:
+    """
+    Cache of full /predict responses, keyed by normalized text (or canonical
+    URL), target language and the model artifact version. When any
+    artifacts/models/*.pkl file changes the version changes with it, so old
+    entries are never served again.
+
+    loaded_version is the version of the model held in memory; while the
+    files on disk differ from it (new artifacts, worker not restarted yet)
+    nothing is stored, so results of the old model can't be filed under the
+    new version.
+    """
+
+    def __init__(self, model_dir, loaded_version=None, cache=None,
+                 check_interval=RESULT_CACHE_VERSION_CHECK):
+        self.model_dir = model_dir
+        self.loaded_version = loaded_version
+        self.check_interval = check_interval
+
+        if cache is None:
+            cache = build_cache(
+                "predictions",
+                path=RESULT_CACHE_PATH,
+                ttl=RESULT_CACHE_TTL,
+                memory_entries=RESULT_CACHE_MEMORY_ENTRIES,
+                disk_entries=RESULT_CACHE_DISK_ENTRIES
+            )
+        self.cache = cache
+
+        self._lock = threading.Lock()
+        self._fingerprint = None
+        self._version = None
+        self._checked_at = 0.0
+
+    # ---------------- VERSIONING ----------------
+    def _stat_fingerprint(self):
+        fingerprint = []
+        for path in sorted(glob.glob(os.path.join(self.model_dir, "*.pkl"))):
+            st = os.stat(path)
+            fingerprint.append((path, st.st_size, st.st_mtime_ns))
+        return tuple(fingerprint)
+
+    @property
+    def version(self):
+        """
+        Current artifact version. Files are stat()ed at most once per
+        check_interval and only re-hashed when size or mtime changed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._version is None or now - self._checked_at >= self.check_interval:
+                self._checked_at = now
+                fingerprint = self._stat_fingerprint()
+                if fingerprint != self._fingerprint:
+                    version = artifact_version(self.model_dir)
+                    if self._version is not None and version != self._version:
+                        # entries of the old model can't be hit any more
+                        self.cache.memory.clear()
+                    self._fingerprint = fingerprint
+                    self._version = version
+            return self._version
+
+    # ---------------- LOOKUP ----------------
+    def key(self, text, is_url, target_lang):
+        if is_url:
+            normalized = canonicalize_url(text)
+        else:
+            normalized = " ".join(text.split())
+        return content_hash(self.version, "url" if is_url else "text", target_lang, normalized)
+
+    def get(self, key):
+        return self.cache.get(key)
+
+    def set(self, key, response):
+        # degraded answers are not worth repeating
+        if response.get("translation_status") == "fallback":
+            return
+        if self.loaded_version is not None and self.loaded_version != self.version:
+            return
+        self.cache.set(key, response)
+
+    def stats(self):
+        return self.cache.stats()
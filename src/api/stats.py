@@ -0,0 +1,61 @@
+import hashlib
+import json
+import os
+
+from src.models.stats_snapshot import load_snapshot
+
+# Browsers and proxies may reuse /model-stats and /eda-stats responses for
+# this many seconds before revalidating (answered with 304 while the ETag
+# still matches)
+STATS_MAX_AGE = int(os.environ.get("STATS_MAX_AGE", "60"))
+
+
+class StatsUnavailable(Exception):
+    """
+    No usable snapshot for the model being served; message says why.
+    """
+
+
+class ServedStats:
+    """
+    The stats snapshot of the model held by the predictor, read once at
+    startup. A snapshot is only used when it was sealed for exactly
+    model_version, so the dashboard never shows numbers of another model.
+    The ETag is derived from the snapshot content and the model version,
+    so it is identical across worker processes.
+    """
+
+    def __init__(self, model_dir, model_version):
+        self.model_version = model_version
+        self.etag = None
+        self._sections = {}
+        self.error = None
+
+        try:
+            snapshot = load_snapshot(model_dir)
+        except (OSError, ValueError) as e:
+            self.error = f"Stats snapshot could not be read: {e}"
+            return
+
+        if snapshot is None:
+            self.error = "No stats snapshot for the served model; promote an evaluated model (python -m src.models.promote)"
+        elif snapshot.get("model_version") != model_version:
+            self.error = (
+                f"Stats snapshot was made for model version {snapshot.get('model_version')}, "
+                f"serving {model_version}; promote an evaluated model (python -m src.models.promote)"
+            )
+        else:
+            self._sections = snapshot.get("sections", {})
+            body = json.dumps(self._sections, sort_keys=True)
+            self.etag = hashlib.sha256(f"{model_version}:{body}".encode("utf-8")).hexdigest()[:32]
+
+    def section(self, name):
+        """
+        The section's {"stats": ..., "generated_at": ...}. Raises
+        StatsUnavailable.
+        """
+        if self.error:
+            raise StatsUnavailable(self.error)
+        if name not in self._sections:
+            raise StatsUnavailable(f"Stats snapshot has no '{name}' section")
+        return self._sections[name]
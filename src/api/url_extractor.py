@@ -0,0 +1,260 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode, unquote_plus
+
+import requests
+from requests.adapters import HTTPAdapter
+from newspaper import Article
+from bs4 import BeautifulSoup
+
+from src.utils.cache import build_cache, content_hash
+from src.utils.metrics import stage
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+
+URL_CACHE_PATH = os.environ.get(
+    "URL_CACHE_PATH",
+    os.path.join(BASE_DIR, "artifacts", "cache", "url_content.sqlite")
+)
+# Entries younger than this are served without touching the network; older
+# ones are revalidated with If-None-Match / If-Modified-Since.
+URL_CACHE_TTL = int(os.environ.get("URL_CACHE_TTL", "3600"))
+# How long an entry is kept around for revalidation
+URL_CACHE_MAX_AGE = int(os.environ.get("URL_CACHE_MAX_AGE", str(7 * 24 * 3600)))
+URL_FETCH_TIMEOUT = float(os.environ.get("URL_FETCH_TIMEOUT", "10"))
+URL_POOL_SIZE = int(os.environ.get("URL_POOL_SIZE", "32"))
+# Batch fetching: total concurrent downloads, and how many may hit one host
+URL_BATCH_WORKERS = int(os.environ.get("URL_BATCH_WORKERS", "32"))
+URL_PER_HOST_LIMIT = int(os.environ.get("URL_PER_HOST_LIMIT", "4"))
+URL_BATCH_TIMEOUT = float(os.environ.get("URL_BATCH_TIMEOUT", "120"))
+
+MIN_TEXT_LENGTH = 200
+
+# Query parameters that never change the article content: these names
+# exactly, and any name starting with a tracking prefix
+TRACKING_PARAMS = frozenset({"fbclid", "gclid", "ref", "ref_src"})
+TRACKING_PREFIXES = ("utm_",)
+
+
+def _is_tracking_param(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url):
+    """
+    Lowercases scheme/host and drops fragments and tracking parameters, so
+    shared copies of the same article map to one cache entry. Only a cache
+    key: the query is re-encoded, so fetch strip_tracking_params(url).
+    """
+    parts = urlparse(url.strip())
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(k)
+    ]
+    return urlunparse((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path or "/",
+        parts.params,
+        urlencode(query),
+        ""
+    ))
+
+
+def strip_tracking_params(url):
+    """
+    url with its tracking parameters removed and everything else (other
+    parameters, their order and encoding) left exactly as given: the URL
+    to fetch.
+    """
+    parts = urlparse(url.strip())
+    if not parts.query:
+        return url.strip()
+    query = "&".join(
+        pair for pair in parts.query.split("&")
+        if not _is_tracking_param(unquote_plus(pair.split("=", 1)[0]))
+    )
+    return urlunparse(parts._replace(query=query))
+
+
+class URLExtractor:
+    """
+    Fetches an article once through a pooled requests.Session, runs
+    newspaper3k and the BeautifulSoup fallback on the same HTML, and caches
+    the extracted text with its ETag / Last-Modified validators.
+    """
+
+    def __init__(self, cache=None, session=None, timeout=URL_FETCH_TIMEOUT, ttl=URL_CACHE_TTL):
+        if cache is None:
+            cache = build_cache(
+                "url_content",
+                path=URL_CACHE_PATH,
+                ttl=URL_CACHE_MAX_AGE,
+                memory_entries=2000,
+                disk_entries=50000
+            )
+        self.cache = cache
+        self.timeout = timeout
+        self.ttl = ttl
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=URL_POOL_SIZE, pool_maxsize=URL_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"User-Agent": "Mozilla/5.0"})
+        self.session = session
+
+        self._host_limits = {}
+        self._host_lock = threading.Lock()
+
+    # ---------------- FETCH ----------------
+    @stage("url_download")
+    def _fetch(self, url, entry=None, timeout=None):
+        """
+        GET with conditional headers when we have a cached entry.
+        Returns the response (status 200 or 304).
+        """
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        resp = self.session.get(url, headers=headers, timeout=timeout or self.timeout)
+        if resp.status_code != 304:
+            resp.raise_for_status()
+        return resp
+
+    # ---------------- EXTRACT ----------------
+    @stage("article_parse")
+    def extract_from_html(self, url, html):
+        # 1️⃣ Try newspaper3k
+        try:
+            article = Article(url)
+            article.download(input_html=html)
+            article.parse()
+            text = article.text.strip()
+            if len(text) > MIN_TEXT_LENGTH:
+                return text
+        except Exception as e:
+            print("Newspaper failed:", e)
+
+        # 2️⃣ Fallback: BeautifulSoup on the same HTML
+        try:
+            soup = BeautifulSoup(html, "html.parser")
+
+            paragraphs = [p.get_text(" ", strip=True) for p in soup.find_all("p")]
+            text = " ".join(paragraphs).strip()
+
+            if len(text) > MIN_TEXT_LENGTH:
+                return text
+        except Exception as e:
+            print("BeautifulSoup failed:", e)
+
+        return ""
+
+    def extract(self, url, timeout=None):
+        """
+        Returns the readable text of url, or "" if none could be extracted.
+        """
+        return self.extract_with_error(url, timeout)[0]
+
+    def extract_with_error(self, url, timeout=None):
+        """
+        Returns (text, error); error is None when text was extracted.
+        timeout overrides the fetch timeout (seconds) for this call.
+        """
+        canonical = canonicalize_url(url)
+        url = strip_tracking_params(url)
+        key = content_hash(canonical)
+        entry = self.cache.get(key)
+
+        if entry and time.time() - entry["fetched_at"] < self.ttl:
+            return entry["text"], None
+
+        try:
+            with self._host_slot(canonical):
+                resp = self._fetch(url, entry, timeout)
+        except Exception as e:
+            print("Fetch failed:", e)
+            # stale text beats no text
+            if entry:
+                return entry["text"], None
+            return "", f"Fetch failed: {e}"
+
+        if resp.status_code == 304 and entry:
+            self.cache.set(key, dict(entry, fetched_at=time.time()))
+            return entry["text"], None
+
+        text = self.extract_from_html(url, resp.text)
+        if not text:
+            return "", "Unable to extract readable content from this URL."
+
+        if "no-store" not in resp.headers.get("Cache-Control", ""):
+            self.cache.set(key, {
+                "text": text,
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "fetched_at": time.time()
+            })
+
+        return text, None
+
+    # ---------------- BATCH ----------------
+    def _host_slot(self, url):
+        host = urlparse(url).netloc
+        with self._host_lock:
+            slot = self._host_limits.get(host)
+            if slot is None:
+                slot = self._host_limits[host] = threading.BoundedSemaphore(URL_PER_HOST_LIMIT)
+        return slot
+
+    def extract_many(self, urls, max_workers=URL_BATCH_WORKERS, batch_timeout=URL_BATCH_TIMEOUT):
+        """
+        Extracts many URLs concurrently. Returns a list of (text, error)
+        aligned with urls. Each URL is bounded by the fetch timeout and no
+        host gets more than URL_PER_HOST_LIMIT downloads at once; URLs still
+        running after batch_timeout come back as errors.
+        """
+        canonical = [canonicalize_url(u) for u in urls]
+        # one download per cache key, of the first URL given for it
+        first_url = {}
+        for key, url in zip(canonical, urls):
+            first_url.setdefault(key, url)
+
+        # Round-robin over hosts so workers don't queue up behind one site
+        by_host = OrderedDict()
+        for url in first_url:
+            by_host.setdefault(urlparse(url).netloc, []).append(url)
+        ordered = []
+        while by_host:
+            for host in list(by_host):
+                ordered.append(by_host[host].pop(0))
+                if not by_host[host]:
+                    del by_host[host]
+
+        results = {}
+        if ordered:
+            executor = ThreadPoolExecutor(max_workers=min(max_workers, len(ordered)))
+            futures = {executor.submit(self.extract_with_error, first_url[url]): url for url in ordered}
+            done, not_done = wait(futures, timeout=batch_timeout)
+
+            for future in done:
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    results[futures[future]] = ("", f"Fetch failed: {e}")
+            for future in not_done:
+                future.cancel()
+                results[futures[future]] = ("", "Timed out.")
+
+            # don't block the caller on stragglers
+            executor.shutdown(wait=False)
+
+        return [results[url] for url in canonical]
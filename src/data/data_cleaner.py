@@ -1,26 +1,20 @@
-import re
-import string
 import nltk
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
+
+from src.preprocessing.text_normalizer import TextNormalizer, clean_texts
 
 nltk.download("stopwords")
 nltk.download("wordnet")
 
 class DataCleaner:
+    # keeps @mentions and #hashtags, unlike 02_data_cleaning.py
+    STRIP_MENTIONS = False
+
     def __init__(self):
-        self.stop_words = set(stopwords.words("english"))
-        self.lemmatizer = WordNetLemmatizer()
+        self.normalizer = TextNormalizer(strip_mentions=self.STRIP_MENTIONS)
 
     def clean_text(self, text):
-        text = str(text).lower()
-        text = re.sub(r"http\S+", "", text)
-        text = re.sub(r"\d+", "", text)
-        text = text.translate(str.maketrans("", "", string.punctuation))
-        tokens = text.split()
-        tokens = [self.lemmatizer.lemmatize(word) for word in tokens if word not in self.stop_words]
-        return " ".join(tokens)
+        return self.normalizer.clean(text)
 
     def apply_cleaning(self, df, column="text"):
-        df["clean_text"] = df[column].apply(self.clean_text)
+        df["clean_text"] = clean_texts(df[column], strip_mentions=self.STRIP_MENTIONS)
         return df
@@ -1,6 +1,12 @@
 import pandas as pd
+import numpy as np
 import os
 
+# Also write a .csv copy next to each Parquet file the pipeline saves
+EXPORT_CSV = os.environ.get("EXPORT_CSV", "0") == "1"
+# Largest row group; groups never span two values of the group column
+ROW_GROUP_ROWS = int(os.environ.get("PARQUET_ROW_GROUP_ROWS", "100000"))
+
 class DataLoader:
     def load_csv(self, path, encoding=None):
         if encoding:
@@ -12,3 +18,78 @@ class DataLoader:
 
     def load_pickle(self, path):
         return pd.read_pickle(path)
+
+    def load_parquet(self, path, columns=None, filters=None):
+        """
+        Reads only the given columns. filters (pyarrow form, e.g.
+        [("source", "in", ["IFND"])]) are checked against the row-group
+        statistics first, so groups of other sources are never read.
+        """
+        return pd.read_parquet(path, engine="pyarrow", columns=columns, filters=filters)
+
+    def parquet_row_groups(self, path):
+        """
+        Row count of each row group.
+        """
+        import pyarrow.parquet as pq
+
+        metadata = pq.ParquetFile(path).metadata
+        return [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+
+    def parquet_row_group_values(self, path, column):
+        """
+        For each row group, the one value of column in it (from the
+        column statistics), or None when the group holds several values or
+        has no statistics.
+        """
+        import pyarrow.parquet as pq
+
+        metadata = pq.ParquetFile(path).metadata
+        position = metadata.schema.to_arrow_schema().get_field_index(column)
+        values = []
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(position).statistics if position >= 0 else None
+            single = stats is not None and stats.has_min_max and stats.min == stats.max and not stats.null_count
+            values.append(stats.min if single else None)
+        return values
+
+    def iter_parquet(self, path, columns=None, batch_size=65536, row_groups=None):
+        """
+        Yields DataFrames of at most batch_size rows (of the given row
+        groups only), so a table can be read without holding it in memory.
+        """
+        import pyarrow.parquet as pq
+
+        with pq.ParquetFile(path) as parquet_file:
+            for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns, row_groups=row_groups):
+                yield batch.to_pandas()
+
+    def save_parquet(self, df, path, group_by="source", csv=EXPORT_CSV):
+        """
+        Writes df with its column types, one or more row groups per value
+        of group_by (rows of a value are gathered in order of first
+        appearance, so an already grouped frame keeps its order). Written
+        atomically; csv=True also writes <path without .parquet>.csv.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        df = df.reset_index(drop=True)
+        bounds = [0, len(df)]
+        if group_by in df.columns and len(df):
+            codes, _ = pd.factorize(df[group_by], use_na_sentinel=False)
+            order = np.argsort(codes, kind="stable")
+            df = df.iloc[order].reset_index(drop=True)
+            codes = codes[order]
+            bounds = [0] + (np.flatnonzero(np.diff(codes)) + 1).tolist() + [len(df)]
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        tmp_path = f"{path}.tmp"
+        with pq.ParquetWriter(tmp_path, table.schema, compression="zstd") as writer:
+            for start, stop in zip(bounds, bounds[1:]):
+                writer.write_table(table.slice(start, stop - start), row_group_size=ROW_GROUP_ROWS)
+        os.replace(tmp_path, path)
+
+        if csv:
+            df.to_csv(os.path.splitext(path)[0] + ".csv", index=False)
+        return path
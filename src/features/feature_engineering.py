@@ -1,4 +1,6 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.pipeline import make_pipeline
 
 class FeatureEngineer:
     def __init__(self, max_features=5000, ngram_range=(1,2)):
@@ -13,3 +15,54 @@ class FeatureEngineer:
 
     def transform(self, texts):
         return self.vectorizer.transform(texts)
+
+
+class HashingFeatureEngineer(FeatureEngineer):
+    """
+    FeatureEngineer for corpora read in chunks: terms are hashed into
+    n_features columns, so there is no vocabulary to hold in memory. With
+    use_idf, partial_fit() counts document frequencies chunk by chunk and
+    finalize() turns them into sklearn's smoothed idf. The resulting
+    vectorizer is a plain sklearn object (HashingVectorizer, or a pipeline
+    of it and a TfidfTransformer) that pickles like the TF-IDF one.
+    """
+
+    def __init__(self, n_features=2 ** 20, ngram_range=(1,2), use_idf=True):
+        self.hasher = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=ngram_range,
+            stop_words="english",
+            alternate_sign=False,
+            norm=None if use_idf else "l2"
+        )
+        self.use_idf = use_idf
+        self.n_documents = 0
+        self.document_frequency = np.zeros(n_features, dtype=np.int64) if use_idf else None
+        # set by finalize(); the hasher alone needs no fitting
+        self.vectorizer = None if use_idf else self.hasher
+
+    def partial_fit(self, texts):
+        if self.use_idf:
+            X = self.hasher.transform(texts)
+            self.n_documents += X.shape[0]
+            # a hashed row holds each column at most once
+            self.document_frequency += np.bincount(X.indices, minlength=X.shape[1])
+        return self
+
+    def finalize(self):
+        if self.use_idf:
+            idf = np.log((1 + self.n_documents) / (1 + self.document_frequency)) + 1
+            transformer = TfidfTransformer(norm="l2", use_idf=True, smooth_idf=True)
+            transformer.idf_ = idf
+            self.vectorizer = make_pipeline(self.hasher, transformer)
+        return self.vectorizer
+
+    def fit_transform(self, texts):
+        self.partial_fit(texts)
+        self.finalize()
+        return self.transform(texts)
+
+    def transform(self, texts):
+        if self.vectorizer is None:
+            raise ValueError("finalize() must run before transform()")
+        return self.vectorizer.transform(texts)
@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+import shutil
+import uuid
+
+import numpy as np
+import scipy.sparse as sp
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+
+FEATURE_STORE_DIR = os.environ.get(
+    "FEATURE_STORE_DIR",
+    os.path.join(BASE_DIR, "data", "processed", "features")
+)
+# Vectorized corpora kept in the cache; older ones are removed
+FEATURE_CACHE_ENTRIES = int(os.environ.get("FEATURE_CACHE_ENTRIES", "4"))
+
+CACHE_DIR_NAME = "cache"
+ARRAYS = ("data", "indices", "indptr")
+META_FILE = "meta.json"
+
+
+def _vectorizer_fingerprint(vectorizer, h):
+    # pipelines (e.g. hashing + idf) are fingerprinted step by step
+    if hasattr(vectorizer, "steps"):
+        for name, step in vectorizer.steps:
+            h.update(f"step:{name}\n".encode("utf-8"))
+            _vectorizer_fingerprint(step, h)
+        return
+
+    params = vectorizer.get_params(deep=False)
+    h.update(type(vectorizer).__name__.encode("utf-8"))
+    h.update(repr(sorted((k, repr(v)) for k, v in params.items())).encode("utf-8"))
+
+    # fitted state, so a vectorizer refitted on other data gets another key
+    vocabulary = getattr(vectorizer, "vocabulary_", None)
+    if vocabulary is not None:
+        h.update(repr(sorted(vocabulary.items())).encode("utf-8"))
+    idf = getattr(vectorizer, "idf_", None)
+    if idf is not None:
+        h.update(np.ascontiguousarray(idf, dtype=np.float64).tobytes())
+
+
+def feature_key(texts, vectorizer):
+    """
+    sha256 over the text column and the (fitted) vectorizer: its class,
+    parameters, vocabulary and idf.
+    """
+    h = hashlib.sha256()
+    for text in texts:
+        encoded = str(text).encode("utf-8")
+        h.update(len(encoded).to_bytes(8, "little"))
+        h.update(encoded)
+    h.update(b"\0vectorizer\0")
+    _vectorizer_fingerprint(vectorizer, h)
+    return h.hexdigest()
+
+
+class FeatureStore:
+    """
+    Sparse feature matrices on disk as CSR arrays (data.npy, indices.npy,
+    indptr.npy) plus meta.json, written last so its presence marks a
+    complete entry. load() maps the arrays read-only, so every step and
+    process reading a matrix shares the same page-cache pages instead of
+    unpickling its own copy.
+
+    Named entries (e.g. the X_train / X_test splits) live in
+    <root>/<name>; vectorized corpora are cached under
+    <root>/cache/<feature_key>.
+    """
+
+    def __init__(self, root=FEATURE_STORE_DIR, cache_entries=FEATURE_CACHE_ENTRIES):
+        self.root = root
+        self.cache_entries = cache_entries
+
+    def _dir(self, name):
+        return os.path.join(self.root, name)
+
+    # ---------------- NAMED ENTRIES ----------------
+    def save(self, name, X, **meta):
+        X = sp.csr_matrix(X)
+        X.sort_indices()
+        arrays = {
+            "data": np.ascontiguousarray(X.data),
+            "indices": np.ascontiguousarray(X.indices),
+            "indptr": np.ascontiguousarray(X.indptr)
+        }
+
+        h = hashlib.sha256()
+        for array_name in ARRAYS:
+            h.update(arrays[array_name].tobytes())
+        meta.update({"shape": list(X.shape), "nnz": int(X.nnz), "sha256": h.hexdigest()})
+
+        # written aside and swapped in, so readers never see a partial entry
+        target = self._dir(name)
+        tmp_dir = f"{target}.tmp-{uuid.uuid4().hex[:8]}"
+        os.makedirs(tmp_dir)
+        for array_name in ARRAYS:
+            np.save(os.path.join(tmp_dir, f"{array_name}.npy"), arrays[array_name])
+        with open(os.path.join(tmp_dir, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2, sort_keys=True)
+
+        if os.path.isdir(target):
+            old_dir = f"{target}.old-{uuid.uuid4().hex[:8]}"
+            os.replace(target, old_dir)
+            os.replace(tmp_dir, target)
+            shutil.rmtree(old_dir, ignore_errors=True)
+        else:
+            os.replace(tmp_dir, target)
+        return meta
+
+    def meta(self, name):
+        try:
+            with open(os.path.join(self._dir(name), META_FILE), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def load(self, name, mmap=True):
+        """
+        The stored matrix, or None when there is no complete entry.
+        """
+        meta = self.meta(name)
+        if meta is None:
+            return None
+
+        mode = "r" if mmap else None
+        data, indices, indptr = (
+            np.load(os.path.join(self._dir(name), f"{array_name}.npy"), mmap_mode=mode)
+            for array_name in ARRAYS
+        )
+        return sp.csr_matrix((data, indices, indptr), shape=tuple(meta["shape"]), copy=False)
+
+    # ---------------- VECTORIZED CORPORA ----------------
+    def transform(self, texts, vectorizer, fit=False):
+        """
+        vectorizer.transform(texts) (fit_transform with fit=True), served
+        from the cache when the same texts were vectorized with the same
+        fitted vectorizer before. A fitting call always fits, since the
+        vectorizer itself is needed afterwards; its result is cached for
+        the steps that only transform.
+        """
+        texts = list(texts)
+        if fit:
+            X = vectorizer.fit_transform(texts)
+            key = feature_key(texts, vectorizer)
+        else:
+            key = feature_key(texts, vectorizer)
+            X = self.load(os.path.join(CACHE_DIR_NAME, key))
+            if X is not None:
+                print("Reusing cached features:", key[:16])
+                return X
+            X = vectorizer.transform(texts)
+
+        self.save(os.path.join(CACHE_DIR_NAME, key), X, key=key)
+        self._prune_cache(keep=key)
+        return X
+
+    def _prune_cache(self, keep):
+        cache_dir = self._dir(CACHE_DIR_NAME)
+        entries = []
+        for name in os.listdir(cache_dir):
+            path = os.path.join(cache_dir, name)
+            if name != keep and os.path.exists(os.path.join(path, META_FILE)):
+                entries.append((os.path.getmtime(os.path.join(path, META_FILE)), path))
+
+        entries.sort(reverse=True)
+        for _, path in entries[max(0, self.cache_entries - 1):]:
+            shutil.rmtree(path, ignore_errors=True)
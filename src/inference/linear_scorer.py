@@ -0,0 +1,456 @@
+import json
+import os
+import pickle
+import re
+import sys
+import unicodedata
+from itertools import compress, repeat
+
+import numpy as np
+
+# Files of the compiled (memory-mappable) model format
+COMPILED_DIR_NAME = "compiled"
+TERMS_FILE = "terms.npy"
+WEIGHTS_FILE = "weights.npy"
+IDF_FILE = "idf.npy"
+META_FILE = "meta.json"
+
+
+# sklearn's default token_pattern: tokens never contain spaces
+DEFAULT_TOKEN_PATTERN = r"(?u)\b\w\w+\b"
+
+
+# ---------------- ANALYZER ----------------
+def _strip_accents_unicode(s):
+    normalized = unicodedata.normalize("NFKD", s)
+    return "".join(c for c in normalized if not unicodedata.combining(c))
+
+
+def _strip_accents_ascii(s):
+    normalized = unicodedata.normalize("NFKD", s)
+    return normalized.encode("ASCII", "ignore").decode("ASCII")
+
+
+def build_word_analyzer(lowercase=True, strip_accents=None, token_pattern=r"(?u)\b\w\w+\b",
+                        ngram_range=(1, 1), stop_words=None):
+    """
+    Same output as TfidfVectorizer(analyzer="word").build_analyzer() for the
+    given settings, without importing sklearn. stop_words is the resolved
+    list (vectorizer.get_stop_words()).
+    """
+    accent_function = {
+        None: None,
+        "unicode": _strip_accents_unicode,
+        "ascii": _strip_accents_ascii
+    }[strip_accents]
+    token_re = re.compile(token_pattern)
+    stop_words = frozenset(stop_words) if stop_words else None
+    min_n, max_n = ngram_range
+
+    def analyze(doc):
+        if lowercase:
+            doc = doc.lower()
+        if accent_function is not None:
+            doc = accent_function(doc)
+
+        tokens = token_re.findall(doc)
+        if stop_words is not None:
+            tokens = [w for w in tokens if w not in stop_words]
+
+        if max_n == 1:
+            return tokens
+
+        original_tokens = tokens
+        if min_n == 1:
+            tokens = list(original_tokens)
+            start_n = 2
+        else:
+            tokens = []
+            start_n = min_n
+
+        n_original = len(original_tokens)
+        for n in range(start_n, min(max_n + 1, n_original + 1)):
+            # n-grams in position order, as sklearn emits them
+            tokens.extend(map(" ".join, zip(*(original_tokens[k:] for k in range(n)))))
+        return tokens
+
+    return analyze
+
+
+# ---------------- VOCABULARIES ----------------
+class DictVocabulary:
+    """
+    term -> column index via a Python dict (fitted vectorizer in memory).
+    """
+
+    def __init__(self, mapping):
+        self.mapping = mapping
+
+    def index(self, terms):
+        """
+        Column of each term, -1 for terms outside the vocabulary.
+        """
+        mapping = self.mapping
+        return np.fromiter(map(mapping.get, terms, repeat(-1)), dtype=np.int64, count=len(terms))
+
+    def terms(self):
+        terms = [None] * len(self.mapping)
+        for term, idx in self.mapping.items():
+            terms[idx] = term
+        return terms
+
+    def __len__(self):
+        return len(self.mapping)
+
+
+class SortedVocabulary:
+    """
+    term -> column index by binary search over a sorted, fixed-width unicode
+    array. The array can be memory-mapped, so every worker process shares the
+    same pages instead of building its own dict.
+    """
+
+    def __init__(self, sorted_terms):
+        self.sorted_terms = sorted_terms
+
+    def index(self, terms):
+        """
+        Column of each term, -1 for terms outside the vocabulary.
+        """
+        if not terms:
+            return np.empty(0, dtype=np.int64)
+        # natural width, so long tokens aren't truncated into false matches
+        query = np.array(terms)
+        pos = np.searchsorted(self.sorted_terms, query)
+        pos[pos >= len(self.sorted_terms)] = 0
+        found = self.sorted_terms[pos] == query
+        return np.where(found, pos, -1).astype(np.int64)
+
+    def terms(self):
+        return self.sorted_terms.tolist()
+
+    def __len__(self):
+        return len(self.sorted_terms)
+
+
+class LinearScorer:
+    """
+    TF-IDF + binary LogisticRegression folded into one term -> weight table.
+
+    For every vocabulary term the table holds idf * coef (the contribution of
+    one occurrence to the decision value) and idf (needed for the l2 norm), so
+    the label and probability come out of a single sparse dot product without
+    going through sklearn's per-call input validation.
+    """
+
+    def __init__(self, vocabulary, weights, idf, intercept, classes, analyzer_params,
+                 norm="l2", sublinear_tf=False):
+        self.vocabulary = vocabulary
+        self.weights = weights
+        self.idf = idf
+        self.intercept = float(intercept)
+        self.classes = list(classes)
+        self.analyzer_params = analyzer_params
+        self.norm = norm
+        self.sublinear_tf = sublinear_tf
+
+        self._analyzer = build_word_analyzer(**analyzer_params)
+        # With default tokens, n-grams are built by _tokens(), skipping those
+        # whose words can't make up a vocabulary term; the n-grams left are
+        # the same. {n: [words allowed at position k]}, built on first use.
+        self._prune_ngrams = (
+            analyzer_params["ngram_range"][1] > 1
+            and analyzer_params.get("token_pattern") == DEFAULT_TOKEN_PATTERN
+        )
+        self._ngram_words = None
+        if self._prune_ngrams:
+            self._word_analyzer = build_word_analyzer(**dict(analyzer_params, ngram_range=(1, 1)))
+
+    def _build_ngram_words(self):
+        ngram_words = {}
+        for term in self.vocabulary.terms():
+            words = term.split(" ")
+            if len(words) > 1:
+                positions = ngram_words.setdefault(len(words), [set() for _ in words])
+                for position, word in zip(positions, words):
+                    position.add(word)
+        return ngram_words
+
+    def _tokens(self, text):
+        """
+        The analyzer's terms for text, minus n-grams that can't be in the
+        vocabulary.
+        """
+        if not self._prune_ngrams:
+            return self._analyzer(text)
+        if self._ngram_words is None:
+            self._ngram_words = self._build_ngram_words()
+
+        words = self._word_analyzer(text)
+        min_n, max_n = self.analyzer_params["ngram_range"]
+        tokens = list(words) if min_n == 1 else []
+        for n in range(max(min_n, 2), min(max_n, len(words)) + 1):
+            positions = self._ngram_words.get(n)
+            if not positions:
+                continue
+            # allowed[k][i]: words[i + k] may stand at position k
+            allowed = [[word in position for word in words[k:]] for k, position in enumerate(positions)]
+            ngrams = zip(*(words[k:] for k in range(n)))
+            tokens.extend(map(" ".join, compress(ngrams, map(all, zip(*allowed)))))
+        return tokens
+
+    # ---------------- BUILD FROM SKLEARN ----------------
+    @classmethod
+    def from_sklearn(cls, vectorizer, model):
+        """
+        Folds a fitted TfidfVectorizer and binary linear model into a scorer.
+        Raises ValueError for setups the folded form can't reproduce exactly.
+        """
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        if not isinstance(vectorizer, TfidfVectorizer):
+            raise ValueError("Only TfidfVectorizer can be compiled")
+        if vectorizer.analyzer != "word" or vectorizer.tokenizer or vectorizer.preprocessor:
+            raise ValueError("Custom analyzers can't be compiled")
+        if vectorizer.strip_accents not in (None, "unicode", "ascii"):
+            raise ValueError("Custom accent stripping can't be compiled")
+        if vectorizer.binary or vectorizer.norm not in ("l2", "l1", None):
+            raise ValueError("Unsupported TF-IDF options")
+        if len(model.classes_) != 2 or model.coef_.shape[0] != 1:
+            raise ValueError("Only binary linear models can be compiled")
+
+        n_features = len(vectorizer.vocabulary_)
+        idf = vectorizer.idf_ if vectorizer.use_idf else np.ones(n_features)
+        coef = np.asarray(model.coef_[0], dtype=np.float64)
+
+        stop_words = vectorizer.get_stop_words()
+        analyzer_params = {
+            "lowercase": vectorizer.lowercase,
+            "strip_accents": vectorizer.strip_accents,
+            "token_pattern": vectorizer.token_pattern,
+            "ngram_range": tuple(vectorizer.ngram_range),
+            "stop_words": sorted(stop_words) if stop_words else None
+        }
+
+        vocabulary = DictVocabulary(
+            {term: int(idx) for term, idx in vectorizer.vocabulary_.items()}
+        )
+
+        return cls(
+            vocabulary=vocabulary,
+            weights=np.asarray(idf * coef, dtype=np.float64),
+            idf=np.asarray(idf, dtype=np.float64),
+            intercept=model.intercept_[0],
+            classes=[c.item() if hasattr(c, "item") else c for c in model.classes_],
+            analyzer_params=analyzer_params,
+            norm=vectorizer.norm,
+            sublinear_tf=vectorizer.sublinear_tf
+        )
+
+    # ---------------- SCORING ----------------
+    def decision_function(self, texts):
+        """
+        Decision values of a batch. The batch is tokenized into one set of
+        (row, column, tf) arrays, so the vocabulary lookup, idf weighting,
+        row norms and the dot product with the weights each run once over
+        the whole batch.
+        """
+        n_texts = len(texts)
+        tokens = []
+        lengths = np.empty(n_texts, dtype=np.int64)
+        for i, text in enumerate(texts):
+            analyzed = self._tokens(text)
+            tokens.extend(analyzed)
+            lengths[i] = len(analyzed)
+
+        # each distinct token is looked up once per batch
+        distinct = list(dict.fromkeys(tokens))
+        column_of = dict(zip(distinct, self.vocabulary.index(distinct).tolist()))
+        columns = np.fromiter(map(column_of.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+        rows = np.repeat(np.arange(n_texts, dtype=np.int64), lengths)
+        known = columns >= 0
+
+        # one key per (row, column): unique() gives the term counts in
+        # row-major CSR order
+        n_columns = len(self.weights)
+        keys, tf = np.unique(rows[known] * n_columns + columns[known], return_counts=True)
+        rows, columns = np.divmod(keys, n_columns)
+
+        tf = tf.astype(np.float64)
+        if self.sublinear_tf:
+            tf = np.log(tf) + 1.0
+
+        dots = np.bincount(rows, weights=tf * self.weights[columns], minlength=n_texts).astype(np.float64)
+
+        if self.norm in ("l2", "l1"):
+            tfidf = tf * self.idf[columns]
+            if self.norm == "l2":
+                norms = np.sqrt(np.bincount(rows, weights=tfidf ** 2, minlength=n_texts))
+            else:
+                norms = np.bincount(rows, weights=np.abs(tfidf), minlength=n_texts)
+            # texts without known terms have dot 0 and keep the intercept
+            np.divide(dots, norms, out=dots, where=norms > 0)
+
+        return self.intercept + dots
+
+    def predict_proba(self, texts):
+        """
+        Probability of classes[1] for each text.
+        """
+        z = self.decision_function(texts)
+        # numerically stable logistic
+        probs = np.empty_like(z)
+        positive = z >= 0
+        probs[positive] = 1.0 / (1.0 + np.exp(-z[positive]))
+        ez = np.exp(z[~positive])
+        probs[~positive] = ez / (1.0 + ez)
+        return probs
+
+    def predict_proba_one(self, text):
+        """
+        Probability of classes[1] for a single text.
+        """
+        return float(self.predict_proba([text])[0])
+
+    def score(self, texts):
+        """
+        Returns a list of (label, probability_of_label) tuples.
+        """
+        return [
+            (self.classes[1], p1) if p1 > 0.5 else (self.classes[0], 1.0 - p1)
+            for p1 in self.predict_proba(texts).tolist()
+        ]
+
+    # ---------------- VERIFICATION ----------------
+    def max_deviation(self, vectorizer, model, texts):
+        """
+        Largest absolute difference in P(classes[1]) between this scorer and
+        the sklearn path, plus the number of label disagreements.
+        """
+        X = vectorizer.transform(texts)
+        probs = model.predict_proba(X)[:, 1]
+        labels = model.predict(X)
+
+        ours = self.predict_proba(texts)
+        deviation = float(np.max(np.abs(ours - probs))) if len(texts) else 0.0
+        mismatches = sum(
+            1 for (label, _), ref in zip(self.score(texts), labels) if label != ref
+        )
+        return deviation, mismatches
+
+    # ---------------- SAVE / LOAD (COMPILED FORMAT) ----------------
+    def save(self, directory, source_version=None):
+        """
+        Writes the compiled format: terms.npy (sorted fixed-width unicode),
+        weights.npy and idf.npy in the same order, and meta.json.
+        """
+        terms = np.array(self.vocabulary.terms())
+        order = np.argsort(terms)
+
+        meta = {
+            "intercept": self.intercept,
+            "classes": self.classes,
+            "analyzer_params": self.analyzer_params,
+            "norm": self.norm,
+            "sublinear_tf": self.sublinear_tf,
+            "source_version": source_version
+        }
+
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, TERMS_FILE), terms[order])
+        np.save(os.path.join(directory, WEIGHTS_FILE), np.ascontiguousarray(self.weights[order]))
+        np.save(os.path.join(directory, IDF_FILE), np.ascontiguousarray(self.idf[order]))
+        # meta last: its presence marks a complete export
+        with open(os.path.join(directory, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+
+    @staticmethod
+    def read_meta(directory):
+        with open(os.path.join(directory, META_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        meta = cls.read_meta(directory)
+        mode = "r" if mmap else None
+
+        terms = np.load(os.path.join(directory, TERMS_FILE), mmap_mode=mode)
+        weights = np.load(os.path.join(directory, WEIGHTS_FILE), mmap_mode=mode)
+        idf = np.load(os.path.join(directory, IDF_FILE), mmap_mode=mode)
+
+        params = meta["analyzer_params"]
+        params["ngram_range"] = tuple(params["ngram_range"])
+
+        return cls(
+            vocabulary=SortedVocabulary(terms),
+            weights=weights,
+            idf=idf,
+            intercept=meta["intercept"],
+            classes=meta["classes"],
+            analyzer_params=params,
+            norm=meta["norm"],
+            sublinear_tf=meta["sublinear_tf"]
+        )
+
+
+# ---------------- EXPORT ----------------
+def export_scorer(model_dir, output_dir=None, check_texts=None, tolerance=1e-9):
+    """
+    Compiles the pickled model + vectorizer in model_dir, checks it against
+    sklearn and writes the memory-mappable format to output_dir
+    (default: model_dir/compiled).
+    """
+    from src.utils.common import artifact_version
+
+    with open(os.path.join(model_dir, "logistic_model.pkl"), "rb") as f:
+        model = pickle.load(f)
+    with open(os.path.join(model_dir, "tfidf_vectorizer.pkl"), "rb") as f:
+        vectorizer = pickle.load(f)
+
+    scorer = LinearScorer.from_sklearn(vectorizer, model)
+
+    if check_texts is None:
+        check_texts = _default_check_texts(vectorizer)
+
+    deviation, mismatches = scorer.max_deviation(vectorizer, model, check_texts)
+    print(f"Checked {len(check_texts)} texts: max |dP| = {deviation:.3e}, label mismatches = {mismatches}")
+    if deviation > tolerance or mismatches:
+        raise ValueError("Compiled scorer does not match the sklearn path")
+
+    output_dir = output_dir or os.path.join(model_dir, COMPILED_DIR_NAME)
+    scorer.save(output_dir, source_version=artifact_version(model_dir))
+
+    # the written files must score exactly like the in-memory scorer
+    deviation, mismatches = LinearScorer.load(output_dir).max_deviation(vectorizer, model, check_texts)
+    if deviation > tolerance or mismatches:
+        raise ValueError("Compiled artifacts do not match the sklearn path")
+
+    print("Saved compiled scorer to:", output_dir)
+    return scorer
+
+
+def _default_check_texts(vectorizer, n_texts=500, seed=42):
+    """
+    Random texts built from the model's own vocabulary, so every feature
+    (including bigrams) gets exercised, plus a few plain sentences.
+    """
+    rng = np.random.default_rng(seed)
+    terms = np.array(sorted(vectorizer.vocabulary_))
+
+    texts = [
+        "",
+        "Social media post claims: free ration for everyone",
+        "The government announced a new education policy for schools across the state",
+        "Scientists confirm the vaccine trial results were published in a peer reviewed journal",
+        "Café naïve résumé: accents and Ünïcödé tokens plus a verylongtokenthatisnotinthevocabulary"
+    ]
+    for _ in range(n_texts):
+        picked = rng.choice(terms, size=rng.integers(1, 60))
+        texts.append(" ".join(picked))
+    return texts
+
+
+if __name__ == "__main__":
+    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+    model_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(base_dir, "artifacts", "models")
+    export_scorer(model_dir)
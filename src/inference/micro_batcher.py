@@ -0,0 +1,129 @@
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+from src.utils.metrics import record_micro_batch
+
+# How long (ms) the first text of a micro-batch waits for others; 0 (the
+# default) turns micro-batching off. Only threaded workers have concurrent
+# predict() calls to batch; with one request per process it only adds a
+# thread hand-off.
+MICRO_BATCH_WINDOW_MS = float(os.environ.get("MICRO_BATCH_WINDOW_MS", "0"))
+MICRO_BATCH_MAX_ITEMS = int(os.environ.get("MICRO_BATCH_MAX_ITEMS", "32"))
+
+
+class _Reservation:
+    """
+    Returned by MicroBatcher.reserve(). A reservation left without scoring
+    (e.g. on an exception) is withdrawn, so the dispatcher stops waiting
+    for it.
+    """
+
+    __slots__ = ("batcher", "used")
+
+    def __init__(self, batcher):
+        self.batcher = batcher
+        self.used = False
+
+    def __enter__(self):
+        with self.batcher._cond:
+            self.batcher._expected += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.used:
+            with self.batcher._cond:
+                self.batcher._expected -= 1
+                self.batcher._cond.notify()
+        return False
+
+    def score(self, text):
+        self.used = True
+        return self.batcher._submit(text)
+
+
+class MicroBatcher:
+    """
+    Scores texts from concurrent threads in shared vectorized calls.
+
+    A caller announces itself with reserve() when it enters the ML path
+    and hands over its prepared text with score() on the reservation; a
+    dispatcher thread collects queued texts until max_items are queued,
+    window_ms has passed since the first one, or every announced caller
+    has arrived, then runs score_texts once and gives each caller its own
+    result. A caller that is alone is therefore never delayed.
+
+        with batcher.reserve() as slot:
+            text = prepare(...)
+            prediction, confidence = slot.score(text)
+    """
+
+    def __init__(self, score_texts, window_ms=MICRO_BATCH_WINDOW_MS, max_items=MICRO_BATCH_MAX_ITEMS):
+        self.score_texts = score_texts
+        self.window = window_ms / 1000
+        self.max_items = max_items
+
+        self._cond = threading.Condition()
+        # [(text, future, queued_at)]
+        self._queue = []
+        # callers that reserved but have not submitted yet
+        self._expected = 0
+        self._thread = None
+        self._pid = None
+
+    def reserve(self):
+        return _Reservation(self)
+
+    def score(self, text):
+        with self.reserve() as slot:
+            return slot.score(text)
+
+    def _submit(self, text):
+        future = Future()
+        with self._cond:
+            self._ensure_dispatcher()
+            self._expected -= 1
+            self._queue.append((text, future, time.perf_counter()))
+            self._cond.notify()
+        return future.result()
+
+    def _ensure_dispatcher(self):
+        # started lazily, and again in a forked child (threads don't survive fork)
+        if self._thread is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._dispatch_loop, name="micro-batcher", daemon=True)
+            self._thread.start()
+
+    def _next_batch(self):
+        with self._cond:
+            while not self._queue:
+                self._cond.wait()
+
+            deadline = self._queue[0][2] + self.window
+            while len(self._queue) < self.max_items and self._expected > 0:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch = self._queue[:self.max_items]
+            del self._queue[:self.max_items]
+            return batch
+
+    def _dispatch_loop(self):
+        while True:
+            batch = self._next_batch()
+            now = time.perf_counter()
+            record_micro_batch(len(batch), max(now - queued_at for _, _, queued_at in batch))
+
+            try:
+                results = self.score_texts([text for text, _, _ in batch])
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future, _), result in zip(batch, results):
+                future.set_result(result)
+
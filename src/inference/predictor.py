@@ -2,70 +2,104 @@ import os
 import pickle
 
 from src.preprocessing.language_detector import LanguageDetector
-from src.preprocessing.translator import Translator
+from src.preprocessing.translator import (
+    Translator, TranslationTimeout, TranslationUnavailable,
+    TRANSLATION_DONE, TRANSLATION_SKIPPED, TRANSLATION_FALLBACK
+)
 from src.preprocessing.context_expander import ContextExpander
+from src.preprocessing.pattern_matcher import PatternMatcher
+from src.preprocessing.analysis_document import AnalysisDocument
+from src.inference.linear_scorer import LinearScorer, COMPILED_DIR_NAME, META_FILE
+from src.inference.micro_batcher import MicroBatcher, MICRO_BATCH_WINDOW_MS
+from src.utils.common import artifact_version
+from src.utils.metrics import stage, record_prediction
 
 
 class FakeNewsPredictor:
     def __init__(self):
         BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
 
-        model_path = os.path.join(BASE_DIR, "artifacts", "models", "logistic_model.pkl")
-        vectorizer_path = os.path.join(BASE_DIR, "artifacts", "models", "tfidf_vectorizer.pkl")
+        self.model_dir = os.path.join(BASE_DIR, "artifacts", "models")
+        self._model = None
+        self._vectorizer = None
 
-        with open(model_path, "rb") as f:
-            self.model = pickle.load(f)
-
-        with open(vectorizer_path, "rb") as f:
-            self.vectorizer = pickle.load(f)
+        self.artifact_version = artifact_version(self.model_dir)
+        self.scorer = self._load_scorer()
+        # concurrent predict() calls share vectorized scoring calls
+        self.batcher = MicroBatcher(self._vector_score) if MICRO_BATCH_WINDOW_MS > 0 else None
 
         self.lang_detector = LanguageDetector()
         self.translator = Translator()
         self.expander = ContextExpander()
 
-        # ---------------- EXISTING KEYWORDS (UNCHANGED) ----------------
-        self.short_real_keywords = [
-            "rain", "flood", "earthquake", "power", "train", "bus",
-            "government", "school", "college", "exam", "hospital",
-            "vaccine", "weather", "traffic", "price", "petrol",
-            "diesel", "ration", "salary", "jobs", "scheme", "policy",
-            "minister", "cm", "pm", "budget", "education"
-        ]
-
-        self.identity_patterns = [
-            "i am the cm",
-            "i am the pm",
-            "i am the president",
-            "i control the government",
-            "i own the country"
-        ]
-
-        self.fake_patterns = [
-            "aliens",
-            "ufo",
-            "everyone will get",
-            "free gold",
-            "free money",
-            "earth swallowed",
-            "sun stopped",
-            "entire city destroyed",
-            "miracle cure",
-            "secret formula",
-            "100% guaranteed",
-            "magic"
-        ]
-
-    # ---------------- EXISTING RULE CHECK (UNCHANGED) ----------------
-    def rule_based_fake_check(self, text):
-        text_lower = text.lower()
-
-        for p in self.identity_patterns:
-            if p in text_lower:
-                return True, "Identity claim detected"
-
-        for p in self.fake_patterns:
-            if p in text_lower:
-                return True, "Impossible or sensational claim detected"
+        # ---------------- KEYWORDS / PATTERNS ----------------
+        # Pattern sets live in config/patterns.json (override with
+        # PATTERNS_CONFIG_PATH) and are compiled into one automaton, so a
+        # text is scanned once no matter how many patterns there are.
+        patterns_path = os.environ.get(
+            "PATTERNS_CONFIG_PATH",
+            os.path.join(BASE_DIR, "config", "patterns.json")
+        )
+        self.matcher = PatternMatcher.from_config(patterns_path)
+
+        for name in ("short_real_keywords", "identity_patterns", "fake_patterns"):
+            if name not in self.matcher.pattern_sets:
+                raise ValueError(f"Pattern set '{name}' missing from {patterns_path}")
+
+        self.short_real_keywords = self.matcher.pattern_sets["short_real_keywords"]
+        self.identity_patterns = self.matcher.pattern_sets["identity_patterns"]
+        self.fake_patterns = self.matcher.pattern_sets["fake_patterns"]
+
+    # ---------------- MODEL LOADING ----------------
+    def _load_scorer(self):
+        """
+        Prefers the memory-mapped compiled artifacts (fast startup, pages
+        shared between workers) when they were exported from the current
+        pickles; otherwise folds the unpickled model. MODEL_FORMAT=pickle
+        forces the unpickling path.
+        """
+        compiled_dir = os.path.join(self.model_dir, COMPILED_DIR_NAME)
+        model_format = os.environ.get("MODEL_FORMAT", "auto")
+
+        if model_format != "pickle" and os.path.exists(os.path.join(compiled_dir, META_FILE)):
+            meta = LinearScorer.read_meta(compiled_dir)
+            if meta.get("source_version") == self.artifact_version:
+                return LinearScorer.load(compiled_dir, mmap=True)
+            print("Compiled model artifacts are stale, loading pickles")
+
+        # Folded TF-IDF + LR weights; scores without sklearn's per-call
+        # overhead. Falls back to the sklearn path if the model can't be folded.
+        try:
+            return LinearScorer.from_sklearn(self.vectorizer, self.model)
+        except ValueError as e:
+            print(f"Linear scorer unavailable, using sklearn path: {e}")
+            return None
+
+    @property
+    def model(self):
+        # unpickled on first use only when the compiled scorer is in use
+        if self._model is None:
+            with open(os.path.join(self.model_dir, "logistic_model.pkl"), "rb") as f:
+                self._model = pickle.load(f)
+        return self._model
+
+    @property
+    def vectorizer(self):
+        if self._vectorizer is None:
+            with open(os.path.join(self.model_dir, "tfidf_vectorizer.pkl"), "rb") as f:
+                self._vectorizer = pickle.load(f)
+        return self._vectorizer
+
+    # ---------------- RULE CHECK ----------------
+    def rule_based_fake_check(self, text, matches=None):
+        if matches is None:
+            matches = self.matcher.scan(text)
+
+        if matches["identity_patterns"]:
+            return True, "Identity claim detected"
+
+        if matches["fake_patterns"]:
+            return True, "Impossible or sensational claim detected"
 
         return False, None
 
@@ -85,24 +119,31 @@ class FakeNewsPredictor:
                 return "Low"
         return "Low"
 
-    def _extract_keywords(self, text):
-        text_lower = text.lower()
+    def _extract_keywords(self, text, matches=None):
+        if matches is None:
+            matches = self.matcher.scan(text)
 
         return {
-            "fake": [w for w in self.fake_patterns if w in text_lower],
-            "real": [w for w in self.short_real_keywords if w in text_lower]
+            "fake": list(matches["fake_patterns"]),
+            "real": list(matches["short_real_keywords"])
         }
 
-    # ---------------- MAIN PREDICT METHOD ----------------
-    def predict(self, text):
-        text_lower = text.lower()
-        word_count = len(text.split())
+    # ---------------- PIPELINE STAGES ----------------
+    @stage("pattern_checks")
+    def _pre_ml_checks(self, doc):
+        """
+        Runs the rule-based and short-message checks on an AnalysisDocument.
+        Returns (result, explanation, keywords); result is None when the
+        text has to go through the ML pipeline.
+        """
+        word_count = doc.word_count
+        matches = self.matcher.scan_lower(doc.lower)
 
         explanation = []
-        keywords = self._extract_keywords(text)
+        keywords = self._extract_keywords(doc.text, matches)
 
         # 1️⃣ RULE-BASED OVERRIDE (UNCHANGED BEHAVIOR)
-        is_fake, rule_reason = self.rule_based_fake_check(text)
+        is_fake, rule_reason = self.rule_based_fake_check(doc.text, matches)
         if is_fake:
             explanation.extend([
                 "Rule-based validation triggered",
@@ -117,13 +158,13 @@ class FakeNewsPredictor:
                 "risk_level": "High",
                 "explanation": explanation,
                 "keywords": keywords
-            }
+            }, explanation, keywords
 
         explanation.append("Rule-based validation passed")
 
         # 2️⃣ SHORT MESSAGE LOGIC (UNCHANGED BEHAVIOR)
         if word_count <= 5:
-            plausible = any(word in text_lower for word in self.short_real_keywords)
+            plausible = bool(matches["short_real_keywords"])
             if not plausible:
                 explanation.append("Short suspicious message detected")
 
@@ -135,28 +176,83 @@ class FakeNewsPredictor:
                     "risk_level": "Medium",
                     "explanation": explanation,
                     "keywords": keywords
-                }
+                }, explanation, keywords
 
             explanation.append("Short message plausibility check passed")
 
-        # 3️⃣ ML PIPELINE (UNCHANGED CORE ML)
-        lang = self.lang_detector.detect_language(text)
-        explanation.append(f"Detected language: {lang}")
+        return None, explanation, keywords
 
-        translated_text = self.translator.translate_to_english(text, lang)
-        explanation.append("Text translated to English")
+    def _prepare_ml_text(self, doc, explanation, deadline=None):
+        """
+        Language detection, translation and context expansion for the ML path.
+        Returns (expanded_text, translation_status). With a Deadline,
+        translation is skipped once the budget runs low and the backend
+        wait is capped by what is left.
+        """
+        if doc.lang is None:
+            with stage("language_detection"):
+                doc.lang = self.lang_detector.detect_language(doc.text)
+        lang = doc.lang
+        explanation.append(f"Detected language: {lang}")
 
-        expanded_text = self.expander.expand(translated_text)
+        if (deadline is not None and self.translator.needs_english_translation(doc.text, lang)
+                and not deadline.allows("translation")):
+            translated_text, translation_status = doc.text, TRANSLATION_FALLBACK
+            explanation.append("Translation skipped (latency budget), scored untranslated text")
+        else:
+            timeout = deadline.timeout(self.translator.timeout) if deadline else None
+            try:
+                with stage("translation"):
+                    translated_text, translation_status = self.translator.translate_to_english_with_status(
+                        doc.text, lang, timeout=timeout, fallback=False
+                    )
+            except TranslationUnavailable as e:
+                print(f"Translation to English failed: {e}")
+                translated_text, translation_status = doc.text, TRANSLATION_FALLBACK
+                explanation.append("Translation unavailable, scored untranslated text")
+                # only a wait the budget cut short degrades the response;
+                # backend errors and an open breaker are plain fallbacks
+                if deadline is not None and isinstance(e, TranslationTimeout) and e.budget_cut:
+                    deadline.skipped("translation")
+            else:
+                if translation_status == TRANSLATION_DONE:
+                    explanation.append("Text translated to English")
+                else:
+                    explanation.append("Translation not needed")
+
+        # untranslated text can reuse the document's tokens
+        with stage("context_expansion"):
+            expanded_text = self.expander.expand(doc if translated_text is doc.text else translated_text)
         explanation.append("Context expansion applied")
 
-        X = self.vectorizer.transform([expanded_text])
+        return expanded_text, translation_status
 
-        pred = self.model.predict(X)[0]
-        probs = self.model.predict_proba(X)[0]
+    @stage("model_scoring")
+    def _score_texts(self, texts):
+        return self._vector_score(texts)
 
-        confidence = round(float(max(probs)), 4)
-        prediction = "Real" if pred == 1 else "Fake"
+    def _vector_score(self, texts):
+        """
+        Scores already prepared texts with the compiled scorer, or with one
+        transform and one predict_proba call. Returns a list of
+        (prediction, confidence) tuples.
+        """
+        if self.scorer is not None:
+            return [
+                ("Real" if pred == 1 else "Fake", round(prob, 4))
+                for pred, prob in self.scorer.score(texts)
+            ]
+
+        X = self.vectorizer.transform(texts)
+        probs = self.model.predict_proba(X)
+        preds = self.model.classes_[probs.argmax(axis=1)]
+
+        return [
+            ("Real" if pred == 1 else "Fake", round(float(row.max()), 4))
+            for pred, row in zip(preds, probs)
+        ]
 
+    def _build_ml_result(self, prediction, confidence, explanation, keywords, translation_status):
         explanation.extend([
             "TF-IDF vectorization applied",
             "Logistic Regression model applied"
@@ -171,5 +267,75 @@ class FakeNewsPredictor:
             "reason": "Pattern-based ML decision",
             "risk_level": risk_level,
             "explanation": explanation,
-            "keywords": keywords
+            "keywords": keywords,
+            "translation_status": translation_status
         }
+
+    # ---------------- MAIN PREDICT METHOD ----------------
+    def predict(self, text, deadline=None):
+        """
+        text may be a string or an AnalysisDocument shared with the caller.
+        deadline (src.utils.deadline.Deadline) lets optional stages be
+        dropped when the request's latency budget runs low; skipped stages
+        are added to deadline.degraded.
+        """
+        doc = AnalysisDocument.of(text)
+
+        result, explanation, keywords = self._pre_ml_checks(doc)
+        if result is None and self.batcher is None:
+            # 3️⃣ ML PIPELINE (UNCHANGED CORE ML)
+            expanded_text, translation_status = self._prepare_ml_text(doc, explanation, deadline)
+            prediction, confidence = self._score_texts([expanded_text])[0]
+            result = self._build_ml_result(prediction, confidence, explanation, keywords, translation_status)
+        elif result is None:
+            # announced before the (slow) text preparation, so the batcher
+            # knows who is still coming
+            with self.batcher.reserve() as slot:
+                expanded_text, translation_status = self._prepare_ml_text(doc, explanation, deadline)
+                # includes the wait for the micro-batch
+                with stage("model_scoring"):
+                    prediction, confidence = slot.score(expanded_text)
+            result = self._build_ml_result(prediction, confidence, explanation, keywords, translation_status)
+
+        record_prediction(result)
+        return result
+
+    # ---------------- BATCH PREDICT METHOD ----------------
+    def predict_batch(self, texts):
+        """
+        Same decisions as predict(), but every text that reaches the ML
+        pipeline is scored in a single vectorized call.
+        """
+        results = [None] * len(texts)
+        ml_items = []
+
+        for i, text in enumerate(texts):
+            doc = AnalysisDocument.of(text)
+            result, explanation, keywords = self._pre_ml_checks(doc)
+            if result is not None:
+                results[i] = result
+                continue
+            ml_items.append((i, doc, explanation, keywords))
+
+        undetected = [item[1] for item in ml_items if item[1].lang is None]
+        if undetected:
+            with stage("language_detection"):
+                langs = self.lang_detector.detect_languages([d.text for d in undetected])
+            for doc, lang in zip(undetected, langs):
+                doc.lang = lang
+
+        pending = []
+        for i, doc, explanation, keywords in ml_items:
+            expanded_text, translation_status = self._prepare_ml_text(doc, explanation)
+            pending.append((i, expanded_text, explanation, keywords, translation_status))
+
+        if pending:
+            scores = self._score_texts([p[1] for p in pending])
+            for (i, _, explanation, keywords, translation_status), (prediction, confidence) in zip(pending, scores):
+                results[i] = self._build_ml_result(
+                    prediction, confidence, explanation, keywords, translation_status
+                )
+
+        for result in results:
+            record_prediction(result)
+        return results
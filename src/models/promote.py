@@ -0,0 +1,79 @@
+"""
+    python -m src.models.promote [--source DIR] [--target DIR] [--no-compile]
+
+Deploys the model the training pipeline evaluated (models/) as the served
+model (artifacts/models/): the model and vectorizer are re-saved under
+the names FakeNewsPredictor loads, the stats snapshot is sealed for the
+served artifacts, and the compiled scorer is re-exported.
+"""
+import argparse
+import os
+import pickle
+import sys
+
+import joblib
+
+from src.models.stats_snapshot import load_snapshot, promote_snapshot
+from src.utils.common import artifact_version
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+
+TRAINED_DIR = os.path.join(BASE_DIR, "models")
+SERVED_DIR = os.path.join(BASE_DIR, "artifacts", "models")
+
+# training output -> file the predictor loads
+ARTIFACT_NAMES = {
+    "logistic_regression_model.pkl": "logistic_model.pkl",
+    "tfidf_vectorizer.pkl": "tfidf_vectorizer.pkl"
+}
+
+
+def promote(source_dir=TRAINED_DIR, target_dir=SERVED_DIR, compile_scorer=True):
+    """
+    Raises ValueError when source_dir's stats snapshot wasn't sealed for
+    the model now in source_dir (07_model_evaluation.py has to run first),
+    so the served stats always describe the served model.
+    """
+    snapshot = load_snapshot(source_dir)
+    if snapshot is None or snapshot.get("model_version") != artifact_version(source_dir):
+        raise ValueError(f"No stats snapshot sealed for the model in {source_dir}; run 07_model_evaluation.py first")
+
+    os.makedirs(target_dir, exist_ok=True)
+    for source_name, target_name in ARTIFACT_NAMES.items():
+        # training saves with joblib; the predictor unpickles
+        obj = joblib.load(os.path.join(source_dir, source_name))
+        path = os.path.join(target_dir, target_name)
+        with open(f"{path}.tmp", "wb") as f:
+            pickle.dump(obj, f)
+        os.replace(f"{path}.tmp", path)
+
+    snapshot = promote_snapshot(snapshot, target_dir)
+    print("Promoted model version:", snapshot["model_version"])
+
+    if compile_scorer:
+        from src.inference.linear_scorer import export_scorer
+        try:
+            export_scorer(target_dir)
+        except ValueError as e:
+            # the predictor notices the stale compiled files and unpickles
+            print(f"Compiled scorer not exported: {e}")
+    return snapshot
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the evaluated model")
+    parser.add_argument("--source", default=TRAINED_DIR)
+    parser.add_argument("--target", default=SERVED_DIR)
+    parser.add_argument("--no-compile", action="store_true", help="skip exporting the compiled scorer")
+    args = parser.parse_args(argv)
+
+    try:
+        promote(args.source, args.target, compile_scorer=not args.no_compile)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
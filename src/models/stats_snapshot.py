@@ -0,0 +1,169 @@
+import json
+import os
+import time
+
+import numpy as np
+from sklearn.metrics import accuracy_score, confusion_matrix, f1_score, precision_score, recall_score
+
+from src.utils.common import artifact_version
+
+# Written next to the model artifacts and served by /model-stats and /eda-stats
+STATS_SNAPSHOT_NAME = "stats_snapshot.json"
+# Dataset stats of 04_eda.py, added to the snapshot when 07 seals it
+EDA_STATS_NAME = "eda_stats.json"
+STATS_SCHEMA = 1
+
+# Label encoding used by training and the predictor (1 = Real, 0 = Fake)
+LABEL_NAMES = {0: "Fake", 1: "Real"}
+# Sentiment is averaged over a fixed random sample, TextBlob is slow
+EDA_SENTIMENT_SAMPLE = 2000
+EDA_TOP_KEYWORDS = 20
+
+
+# ---------------- STATS ----------------
+def evaluation_stats(y_true, y_pred):
+    """
+    Test-set metrics of one model, for "Real" (1) as the positive class.
+    """
+    tn, fp, fn, tp = confusion_matrix(y_true, y_pred, labels=[0, 1]).ravel()
+    return {
+        "accuracy": round(float(accuracy_score(y_true, y_pred)), 4),
+        "precision": round(float(precision_score(y_true, y_pred, zero_division=0)), 4),
+        "recall": round(float(recall_score(y_true, y_pred, zero_division=0)), 4),
+        "f1": round(float(f1_score(y_true, y_pred, zero_division=0)), 4),
+        "sample_size": int(len(y_true)),
+        "confusion_matrix": {"tp": int(tp), "fp": int(fp), "fn": int(fn), "tn": int(tn)}
+    }
+
+
+def eda_stats(df, text_column="clean_text", label_column="label",
+              top_n=EDA_TOP_KEYWORDS, sentiment_sample=EDA_SENTIMENT_SAMPLE):
+    """
+    Dataset summary shown on the dashboard: label counts, most frequent
+    keywords (document frequency, English stop words removed), average
+    sentiment polarity of a sample and average word count.
+    """
+    from sklearn.feature_extraction.text import CountVectorizer
+    from textblob import TextBlob
+
+    texts = df[text_column].fillna("").astype(str)
+    labels = df[label_column].value_counts()
+
+    counts = CountVectorizer(stop_words="english", binary=True, max_features=top_n)
+    matrix = counts.fit_transform(texts)
+    frequencies = np.asarray(matrix.sum(axis=0)).ravel()
+    keywords = sorted(zip(counts.get_feature_names_out(), frequencies), key=lambda kv: -kv[1])
+
+    sample = texts.sample(min(sentiment_sample, len(texts)), random_state=42) if len(texts) else texts
+    polarity = [TextBlob(text).sentiment.polarity for text in sample]
+
+    return {
+        "label_distribution": {
+            LABEL_NAMES.get(int(label), str(label)): int(count) for label, count in labels.items()
+        },
+        "top_keywords": [{"text": word, "value": int(freq)} for word, freq in keywords],
+        "sentiment_avg": round(float(np.mean(polarity)), 4) if polarity else 0.0,
+        "avg_word_count": round(float(texts.str.split().str.len().mean() or 0), 1),
+        "sample_size": int(len(texts))
+    }
+
+
+# ---------------- SNAPSHOT FILE ----------------
+def snapshot_path(model_dir):
+    return os.path.join(model_dir, STATS_SNAPSHOT_NAME)
+
+
+def load_snapshot(model_dir):
+    """
+    The snapshot in model_dir, or None when there is none.
+    """
+    try:
+        with open(snapshot_path(model_dir), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def section_entry(stats):
+    return {
+        "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "stats": stats
+    }
+
+
+def write_section(model_dir, section, stats, seal=False):
+    """
+    Stores stats as one section ("eda", "model") of the
+    snapshot in model_dir.
+
+    seal=True stamps the snapshot with the current artifact_version() of
+    model_dir; pass it from steps that evaluated the model in that
+    directory. Any other write clears the stamp, since the new section was
+    not produced against a known model, and the server refuses to serve
+    the snapshot until an evaluation seals it again.
+    """
+    return write_sections(model_dir, {section: section_entry(stats)}, seal=seal)
+
+
+def write_sections(model_dir, sections, seal=False):
+    """
+    write_section() for several sections ({name: section_entry(...)}) at
+    once.
+    """
+    snapshot = load_snapshot(model_dir) or {}
+    if snapshot.get("schema") != STATS_SCHEMA:
+        snapshot = {"schema": STATS_SCHEMA, "sections": {}}
+
+    snapshot["sections"].update(sections)
+    if seal:
+        snapshot["model_version"] = artifact_version(model_dir)
+        snapshot["sealed_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    else:
+        snapshot["model_version"] = None
+
+    _write_json(snapshot_path(model_dir), snapshot)
+    return snapshot
+
+
+def write_eda_stats(model_dir, stats):
+    """
+    Stores the dataset stats for the next evaluation to add to the
+    snapshot. Kept out of the snapshot itself, so the pipeline step that
+    computes them and the one that seals the snapshot write separate files.
+    """
+    entry = section_entry(stats)
+    _write_json(os.path.join(model_dir, EDA_STATS_NAME), entry)
+    return entry
+
+
+def load_eda_stats(model_dir):
+    """
+    The section stored by write_eda_stats(), or None.
+    """
+    try:
+        with open(os.path.join(model_dir, EDA_STATS_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def promote_snapshot(snapshot, target_dir):
+    """
+    Writes snapshot (sealed for the model being promoted) to target_dir,
+    sealed for the artifacts now in target_dir. Call it after those were
+    copied from the evaluated model.
+    """
+    snapshot = dict(snapshot)
+    snapshot["model_version"] = artifact_version(target_dir)
+    snapshot["sealed_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    _write_json(snapshot_path(target_dir), snapshot)
+    return snapshot
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    # readers never see a half-written file
+    os.replace(tmp_path, path)
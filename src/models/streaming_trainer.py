@@ -0,0 +1,194 @@
+"""
+    python -m src.models.streaming_trainer [--data PATH] [--output DIR]
+        [--chunk-rows N] [--epochs N] [--n-features N] [--no-idf]
+
+Trains the fake news model out of core: the cleaned table is read in
+chunks, featurized by HashingFeatureEngineer and fed to an SGD logistic
+regression through partial_fit. Peak memory is one chunk, one row group
+per source and the n_features-sized weight and idf arrays, whatever the
+corpus size.
+"""
+import argparse
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDClassifier
+
+from src.data.data_loader import DataLoader
+from src.features.feature_engineering import HashingFeatureEngineer
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+
+# Rows per training chunk
+STREAM_TRAIN_CHUNK_ROWS = int(os.environ.get("STREAM_TRAIN_CHUNK_ROWS", "50000"))
+# Rows read from one row group at a time while mixing sources
+READ_BATCH_ROWS = 1024
+# 0 = Fake, 1 = Real, as in the TF-IDF model
+CLASSES = np.array([0, 1])
+
+
+def iter_chunks(path, chunk_rows=STREAM_TRAIN_CHUNK_ROWS, seed=42, loader=None):
+    """
+    Yields (texts, labels) chunks of about chunk_rows non-empty texts,
+    shuffled. The cleaned table keeps each source in its own row groups,
+    and SGD trained on one source after another forgets the earlier
+    ones, so every chunk draws small batches from all sources in
+    proportion to the rows they have left. Each source reads its row
+    groups one after another, so only one row group per source is open
+    at a time, however many groups the table has.
+    """
+    loader = loader or DataLoader()
+    rng = np.random.default_rng(seed)
+
+    # source -> its row groups, in file order (groups mixing sources
+    # share one lane)
+    lanes = {}
+    row_counts = loader.parquet_row_groups(path)
+    sources = loader.parquet_row_group_values(path, "source")
+    for i, (rows, source) in enumerate(zip(row_counts, sources)):
+        if rows:
+            lanes.setdefault(source, []).append(i)
+    remaining = {source: sum(row_counts[i] for i in groups) for source, groups in lanes.items()}
+    readers = {}
+
+    def next_batch(source):
+        while True:
+            if source not in readers:
+                if not lanes[source]:
+                    return None
+                readers[source] = loader.iter_parquet(
+                    path, columns=["clean_text", "label"], batch_size=READ_BATCH_ROWS,
+                    row_groups=[lanes[source].pop(0)]
+                )
+            batch = next(readers[source], None)
+            if batch is not None:
+                return batch
+            # row group done: close it before opening the source's next one
+            readers.pop(source).close()
+
+    parts, rows = [], 0
+    while lanes:
+        names = list(lanes)
+        weights = np.array([max(remaining[s], 1) for s in names], dtype=np.float64)
+        source = names[rng.choice(len(names), p=weights / weights.sum())]
+
+        batch = next_batch(source)
+        if batch is None:
+            del lanes[source]
+            continue
+        remaining[source] -= len(batch)
+        parts.append(batch)
+        rows += len(batch)
+
+        if rows >= chunk_rows:
+            yield _shuffled_chunk(parts, rng)
+            parts, rows = [], 0
+
+    if parts:
+        yield _shuffled_chunk(parts, rng)
+
+
+def _shuffled_chunk(parts, rng):
+    df = pd.concat(parts, ignore_index=True)
+    # same filter as 05/06: empty documents carry no features
+    df = df[df["clean_text"].str.strip() != ""]
+    order = rng.permutation(len(df))
+    texts = df["clean_text"].to_numpy()[order].tolist()
+    labels = df["label"].to_numpy()[order].astype(np.int64)
+    return texts, labels
+
+
+class StreamingTrainer:
+    """
+    Fits features and model chunk by chunk. With idf, a first pass over
+    the data counts document frequencies; then every epoch is one pass of
+    partial_fit calls. Each chunk is scored before the model learns from
+    it, which gives a progressive (test-then-train) accuracy without a
+    held-out split in memory.
+    """
+
+    def __init__(self, features=None, model=None, chunk_rows=STREAM_TRAIN_CHUNK_ROWS, epochs=1,
+                 seed=42, loader=None):
+        self.features = features or HashingFeatureEngineer()
+        self.model = model or SGDClassifier(loss="log_loss", alpha=1e-5, random_state=seed)
+        self.chunk_rows = chunk_rows
+        self.epochs = epochs
+        self.seed = seed
+        self.loader = loader or DataLoader()
+        # progressive accuracy of each epoch
+        self.history = []
+
+    def _chunks(self, path, epoch):
+        return iter_chunks(path, self.chunk_rows, seed=self.seed + epoch, loader=self.loader)
+
+    def fit(self, path):
+        if self.features.use_idf:
+            start = time.time()
+            for texts, _ in self._chunks(path, 0):
+                self.features.partial_fit(texts)
+            print(f"Document frequencies of {self.features.n_documents} texts counted in {time.time() - start:.1f}s")
+        self.features.finalize()
+
+        trained = False
+        for epoch in range(self.epochs):
+            start = time.time()
+            seen = correct = 0
+            for texts, labels in self._chunks(path, epoch):
+                if not len(labels):
+                    continue
+                X = self.features.transform(texts)
+                if trained:
+                    correct += int(np.sum(self.model.predict(X) == labels))
+                    seen += len(labels)
+                self.model.partial_fit(X, labels, classes=CLASSES)
+                trained = True
+
+            accuracy = correct / seen if seen else None
+            self.history.append(accuracy)
+            shown = f"{accuracy:.4f}" if accuracy is not None else "n/a"
+            print(f"Epoch {epoch + 1}/{self.epochs}: progressive accuracy {shown} ({time.time() - start:.1f}s)")
+
+        if not trained:
+            raise ValueError(f"No training rows in {path}")
+        return self
+
+    def save(self, output_dir):
+        """
+        Writes logistic_model.pkl and tfidf_vectorizer.pkl, the files
+        FakeNewsPredictor loads. The compiled scorer can't fold hashed
+        features, so the predictor serves these through the sklearn path.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        for name, obj in (("tfidf_vectorizer.pkl", self.features.vectorizer), ("logistic_model.pkl", self.model)):
+            path = os.path.join(output_dir, name)
+            with open(f"{path}.tmp", "wb") as f:
+                pickle.dump(obj, f)
+            os.replace(f"{path}.tmp", path)
+        print("Saved streaming model and vectorizer to:", output_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the model out of core")
+    parser.add_argument("--data", default=os.path.join(BASE_DIR, "data", "processed", "cleaned_data.parquet"))
+    parser.add_argument("--output", default=os.path.join(BASE_DIR, "models", "streaming"),
+                        help="model directory (artifacts/models replaces the served model)")
+    parser.add_argument("--chunk-rows", type=int, default=STREAM_TRAIN_CHUNK_ROWS)
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--n-features", type=int, default=2 ** 20, help="hashed feature columns")
+    parser.add_argument("--no-idf", action="store_true", help="skip the document frequency pass")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    features = HashingFeatureEngineer(n_features=args.n_features, use_idf=not args.no_idf)
+    trainer = StreamingTrainer(features, chunk_rows=args.chunk_rows, epochs=args.epochs, seed=args.seed)
+    trainer.fit(args.data)
+    trainer.save(args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
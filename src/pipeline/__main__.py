@@ -0,0 +1,28 @@
+"""
+    python -m src.pipeline [--force] [--dry-run] [--workers N] [step ...]
+
+Runs the training pipeline, skipping steps that are up to date. Naming
+steps (e.g. "07 Model Evaluation") runs only them and what they need.
+"""
+import argparse
+import sys
+
+from src.pipeline.runner import PipelineRunner, PIPELINE_WORKERS, FAILED, BLOCKED
+from src.pipeline.steps import PIPELINE_STEPS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the training pipeline")
+    parser.add_argument("steps", nargs="*", help="run only these steps (and what they need)")
+    parser.add_argument("--force", action="store_true", help="re-run steps even if up to date")
+    parser.add_argument("--dry-run", action="store_true", help="only show what would run")
+    parser.add_argument("--workers", type=int, default=PIPELINE_WORKERS, help="steps run in parallel")
+    args = parser.parse_args(argv)
+
+    runner = PipelineRunner(PIPELINE_STEPS, workers=args.workers)
+    outcomes = runner.run(force=args.force, only=args.steps or None, dry_run=args.dry_run)
+    return 1 if any(o in (FAILED, BLOCKED) for o in outcomes.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+
+PIPELINE_STATE_DIR = os.environ.get(
+    "PIPELINE_STATE_DIR",
+    os.path.join(BASE_DIR, "artifacts", "pipeline")
+)
+PIPELINE_WORKERS = int(os.environ.get("PIPELINE_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Step outcomes
+RAN = "ran"
+SKIPPED = "skipped"          # inputs, code and outputs unchanged
+FAILED = "failed"
+BLOCKED = "blocked"          # an upstream step failed
+
+
+class Step:
+    """
+    One script of the pipeline. inputs and outputs are paths relative to
+    the project root; code lists source files besides the script whose
+    changes should re-run the step. after names steps that must run first
+    although no file connects them (their re-run also re-runs this step).
+    """
+
+    def __init__(self, name, script, inputs=(), outputs=(), code=(), after=()):
+        self.name = name
+        self.script = script
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.code = [script] + list(code)
+        self.after = list(after)
+
+
+class FileHasher:
+    """
+    sha256 of files, re-hashed only when size or mtime changed since the
+    last run (the fingerprints are kept in the pipeline state).
+    """
+
+    def __init__(self, known=None):
+        # path -> [size, mtime_ns, sha256]
+        self.known = dict(known or {})
+
+    def digest(self, path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        entry = self.known.get(path)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = h.hexdigest()
+
+        self.known[path] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+
+class PipelineRunner:
+    """
+    Runs Steps as subprocesses in dependency order, independent steps in
+    parallel. A step depends on the steps that produce its inputs and on
+    the steps named in its after list. A step is skipped when the content
+    hashes of its inputs and code match its last successful run and its
+    outputs are still the files it wrote; otherwise it runs, and its new
+    outputs decide whether the steps downstream run.
+
+    Each step's output goes to <state_dir>/logs/<step>.log.
+    """
+
+    def __init__(self, steps, root=BASE_DIR, state_dir=PIPELINE_STATE_DIR, workers=PIPELINE_WORKERS):
+        self.steps = {step.name: step for step in steps}
+        self.root = root
+        self.state_dir = state_dir
+        self.state_path = os.path.join(state_dir, "state.json")
+        self.log_dir = os.path.join(state_dir, "logs")
+        self.workers = max(1, workers)
+
+        producers = {}
+        for step in steps:
+            for output in step.outputs:
+                if output in producers:
+                    raise ValueError(f"{output} is written by both {producers[output]} and {step.name}")
+                producers[output] = step.name
+
+        self.dependencies = {}
+        for step in steps:
+            deps = {producers[i] for i in step.inputs if i in producers} | set(step.after)
+            unknown = deps - set(self.steps)
+            if unknown:
+                raise ValueError(f"{step.name} runs after unknown steps {sorted(unknown)}")
+            self.dependencies[step.name] = deps
+        self._check_acyclic()
+
+    def _check_acyclic(self):
+        visiting, done = set(), set()
+
+        def visit(name, path):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Pipeline has a cycle: {' -> '.join(path + [name])}")
+            visiting.add(name)
+            for dep in self.dependencies[name]:
+                visit(dep, path + [name])
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.steps:
+            visit(name, [])
+
+    # ---------------- STATE ----------------
+    def _load_state(self):
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {"files": {}, "steps": {}}
+
+    def _save_state(self, state):
+        os.makedirs(self.state_dir, exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    def _path(self, relative):
+        return os.path.join(self.root, relative)
+
+    def _input_key(self, step, hasher):
+        """
+        Hash over the step's code and input contents; None when an input
+        is missing.
+        """
+        h = hashlib.sha256()
+        for relative in step.code + step.inputs:
+            digest = hasher.digest(self._path(relative))
+            if digest is None:
+                return None
+            h.update(f"{relative}:{digest}\n".encode("utf-8"))
+        return h.hexdigest()
+
+    def _outputs_intact(self, step, record, hasher):
+        recorded = record.get("outputs", {})
+        return all(
+            recorded.get(output) is not None and hasher.digest(self._path(output)) == recorded[output]
+            for output in step.outputs
+        )
+
+    # ---------------- RUN ----------------
+    def _execute(self, step):
+        os.makedirs(self.log_dir, exist_ok=True)
+        log_path = os.path.join(self.log_dir, f"{step.name.replace(' ', '_')}.log")
+        # plots are saved or dropped, never shown: steps run unattended
+        env = dict(os.environ, MPLBACKEND=os.environ.get("MPLBACKEND", "Agg"))
+
+        start = time.time()
+        with open(log_path, "w", encoding="utf-8") as log:
+            code = subprocess.call(
+                [sys.executable, self._path(step.script)],
+                cwd=self.root, stdout=log, stderr=subprocess.STDOUT, env=env
+            )
+        return code, time.time() - start, log_path
+
+    def run(self, force=False, only=None, dry_run=False):
+        """
+        Runs the pipeline (or only the named steps and what they need).
+        force re-runs every selected step. Returns {step: outcome}.
+        """
+        state = self._load_state()
+        hasher = FileHasher(state.get("files"))
+        records = state.setdefault("steps", {})
+
+        selected = set(self.steps) if not only else self._with_dependencies(only)
+        outcomes = {}
+        pending = {name for name in self.steps if name in selected}
+        running = {}
+
+        def ready(name):
+            return all(dep in outcomes or dep not in selected for dep in self.dependencies[name])
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while pending or running:
+                for name in sorted(n for n in pending if ready(n)):
+                    pending.discard(name)
+                    step = self.steps[name]
+
+                    if any(outcomes.get(dep) in (FAILED, BLOCKED) for dep in self.dependencies[name]):
+                        outcomes[name] = BLOCKED
+                        print(f"[BLOCKED] {name}: an upstream step failed")
+                        continue
+
+                    key = self._input_key(step, hasher)
+                    if key is None:
+                        missing = [p for p in step.code + step.inputs if not os.path.exists(self._path(p))]
+                        outcomes[name] = FAILED
+                        print(f"[ERROR] {name}: missing inputs {missing}")
+                        continue
+
+                    record = records.get(name, {})
+                    # a dry run can't know the new outputs, so it assumes they changed
+                    upstream = self.dependencies[name] if dry_run else step.after
+                    upstream_ran = any(outcomes.get(dep) == RAN for dep in upstream)
+                    if (not force and not upstream_ran and record.get("key") == key
+                            and self._outputs_intact(step, record, hasher)):
+                        outcomes[name] = SKIPPED
+                        print(f"[SKIP] {name}: up to date")
+                        continue
+
+                    if dry_run:
+                        outcomes[name] = RAN
+                        print(f"[WOULD RUN] {name}")
+                        continue
+
+                    print(f"RUNNING: {name}")
+                    running[pool.submit(self._execute, step)] = (name, key)
+
+                if not running:
+                    if pending and not any(ready(n) for n in pending):
+                        raise RuntimeError(f"Steps can't be scheduled: {sorted(pending)}")
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, key = running.pop(future)
+                    step = self.steps[name]
+                    code, duration, log_path = future.result()
+
+                    if code != 0:
+                        outcomes[name] = FAILED
+                        records.pop(name, None)
+                        print(f"[ERROR] {name} failed (exit {code}), see {log_path}")
+                        continue
+
+                    outcomes[name] = RAN
+                    records[name] = {
+                        "key": key,
+                        "outputs": {o: hasher.digest(self._path(o)) for o in step.outputs},
+                        "duration": round(duration, 2),
+                        "finished_at": time.strftime("%Y-%m-%d %H:%M:%S")
+                    }
+                    print(f"[OK] {name} completed in {duration:.2f}s")
+
+                # progress survives an interrupted run
+                if not dry_run:
+                    state["files"] = hasher.known
+                    self._save_state(state)
+
+        if not dry_run:
+            state["files"] = hasher.known
+            self._save_state(state)
+        return outcomes
+
+    def _with_dependencies(self, names):
+        unknown = set(names) - set(self.steps)
+        if unknown:
+            raise ValueError(f"Unknown steps {sorted(unknown)}")
+
+        selected = set()
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name not in selected:
+                selected.add(name)
+                stack.extend(self.dependencies[name])
+        return selected
@@ -0,0 +1,74 @@
+from src.pipeline.runner import Step
+
+RAW = "data/raw"
+PROCESSED = "data/processed"
+MODELS = "models"
+REPORTS = "artifacts/reports"
+TRAINING_COMPARISON = f"{REPORTS}/training_comparison.csv"
+
+COMBINED = f"{PROCESSED}/combined_raw_data.parquet"
+CLEANED = f"{PROCESSED}/cleaned_data.parquet"
+VECTORIZER = f"{MODELS}/tfidf_vectorizer.pkl"
+MODEL = f"{MODELS}/logistic_regression_model.pkl"
+EDA_STATS = f"{MODELS}/eda_stats.json"
+STATS_SNAPSHOT = f"{MODELS}/stats_snapshot.json"
+SNAPSHOT_CODE = "src/models/stats_snapshot.py"
+LOADER = "src/data/data_loader.py"
+FEATURES = f"{PROCESSED}/features"
+STORE = "src/features/feature_store.py"
+# feature matrices are feature store entries (meta.json is written last and
+# holds the arrays' sha256), labels stay pickled
+SPLITS = [f"{FEATURES}/{name}/meta.json" for name in ("X_train", "X_test")] + \
+    [f"{PROCESSED}/{name}.pkl" for name in ("y_train", "y_test")]
+
+# The training pipeline of extracted_scripts/, as main.py runs it
+PIPELINE_STEPS = [
+    Step(
+        "01 Data Collection", "extracted_scripts/01_data_collection.py",
+        inputs=[f"{RAW}/IFND.csv", f"{RAW}/bharatfakenewskosh_raw.csv", f"{RAW}/news_dataset.csv"],
+        outputs=[COMBINED], code=[LOADER]
+    ),
+    Step(
+        "02 Data Cleaning", "extracted_scripts/02_data_cleaning.py",
+        inputs=[COMBINED], outputs=[CLEANED],
+        code=[LOADER, "src/preprocessing/text_normalizer.py"]
+    ),
+    Step(
+        "03 Data Quality Report", "extracted_scripts/03_data_quality_report.py",
+        inputs=[COMBINED], outputs=[f"{REPORTS}/data_quality_report.txt"], code=[LOADER]
+    ),
+    # the dataset stats 07 adds to the stats snapshot
+    Step(
+        "04 EDA", "extracted_scripts/04_eda.py",
+        inputs=[CLEANED], outputs=[EDA_STATS], code=[LOADER, SNAPSHOT_CODE]
+    ),
+    Step(
+        "05 Feature Engineering", "extracted_scripts/05_feature_engineering.py",
+        inputs=[CLEANED], outputs=[VECTORIZER], code=[LOADER, STORE]
+    ),
+    Step(
+        "06 Model Training", "extracted_scripts/06_model_training.py",
+        inputs=[CLEANED, VECTORIZER], outputs=SPLITS + [MODEL], code=[LOADER, STORE]
+    ),
+    # writes the stats snapshot (test metrics plus 04's dataset stats),
+    # sealed for the model's artifact version
+    Step(
+        "07 Model Evaluation", "extracted_scripts/07_model_evaluation.py",
+        inputs=[MODEL, VECTORIZER, SPLITS[1], SPLITS[3], EDA_STATS], outputs=[STATS_SNAPSHOT],
+        code=[STORE, SNAPSHOT_CODE, "src/utils/common.py"]
+    ),
+    # report over 09's results; trains nothing itself
+    Step(
+        "08 Model Comparison", "extracted_scripts/08_model_comparison.py",
+        inputs=[TRAINING_COMPARISON], outputs=[f"{REPORTS}/model_comparison_report.md"],
+        code=["src/models/model_comparison.py"]
+    ),
+    Step(
+        "09 Training Comparison", "extracted_scripts/09_model_training_comparison.py",
+        inputs=SPLITS, outputs=[TRAINING_COMPARISON], code=[STORE]
+    ),
+    Step(
+        "10 EDA Dashboard", "extracted_scripts/10_eda_dashboard.py",
+        inputs=[CLEANED], outputs=[f"{REPORTS}/eda_dashboard.pdf"], code=[LOADER]
+    ),
+]
@@ -0,0 +1,53 @@
+from functools import cached_property
+
+from textblob import TextBlob
+
+
+class AnalysisDocument:
+    """
+    One input text plus everything derived from it, computed at most once.
+
+    The predictor, ContextExpander and the analytics helpers all accept
+    either a plain string or an AnalysisDocument; passing the document lets
+    them share the lowercased text, tokens and counts instead of re-splitting
+    the same text for every stage.
+    """
+
+    def __init__(self, text, lang=None):
+        self.text = text
+        # filled in by the predictor once detected
+        self.lang = lang
+
+    @classmethod
+    def of(cls, text_or_doc):
+        if isinstance(text_or_doc, cls):
+            return text_or_doc
+        return cls(text_or_doc)
+
+    @cached_property
+    def lower(self):
+        return self.text.lower()
+
+    @cached_property
+    def tokens(self):
+        return self.text.split()
+
+    @cached_property
+    def word_count(self):
+        return len(self.tokens)
+
+    @cached_property
+    def char_count(self):
+        return sum(len(t) for t in self.tokens)
+
+    @cached_property
+    def avg_word_length(self):
+        return self.char_count / self.word_count if self.word_count > 0 else 0
+
+    @cached_property
+    def blob(self):
+        # TextBlob tokenizes lazily on first use; keep the one instance
+        return TextBlob(self.text)
+
+    def __str__(self):
+        return self.text
@@ -1,9 +1,12 @@
+from src.preprocessing.analysis_document import AnalysisDocument
+
+
 class ContextExpander:
     def expand(self, text):
-        words = text.lower().split()
+        doc = AnalysisDocument.of(text)
 
         # For very short messages, expand slightly like social media style
-        if len(words) <= 5:
-            return f"Social media post claims: {text}"
+        if doc.word_count <= 5:
+            return f"Social media post claims: {doc.text}"
 
-        return text
+        return doc.text
@@ -1,8 +1,87 @@
-from langdetect import detect
+import re
+
+from langdetect import DetectorFactory, detect
+from langdetect.detector_factory import init_factory
+
+# langdetect is random unless seeded
+DetectorFactory.seed = 0
+
+# Only this much of the text is looked at; a news article's language is
+# settled well before that.
+PREFIX_CHARS = 2000
+
+# Unicode blocks -> language code. Scripts used by several languages map to
+# the one this app serves (Devanagari -> Hindi); every non-native language is
+# translated with source='auto' anyway, so routing is the same.
+SCRIPTS = {
+    "devanagari": (re.compile(r"[\u0900-\u097F]"), "hi"),
+    "telugu": (re.compile(r"[\u0C00-\u0C7F]"), "te"),
+    "tamil": (re.compile(r"[\u0B80-\u0BFF]"), "ta"),
+    "kannada": (re.compile(r"[\u0C80-\u0CFF]"), "kn"),
+    "malayalam": (re.compile(r"[\u0D00-\u0D7F]"), "ml"),
+    "bengali": (re.compile(r"[\u0980-\u09FF]"), "bn"),
+    "gujarati": (re.compile(r"[\u0A80-\u0AFF]"), "gu"),
+    "gurmukhi": (re.compile(r"[\u0A00-\u0A7F]"), "pa"),
+    "oriya": (re.compile(r"[\u0B00-\u0B7F]"), "or"),
+    "latin": (re.compile(r"[A-Za-z\u00C0-\u024F]"), None),
+}
+
+# Share of the script letters a block needs before we trust it
+SCRIPT_THRESHOLD = 0.6
+LATIN_THRESHOLD = 0.9
+
+# Latin text counts as English when enough of its words are these
+ENGLISH_FUNCTION_WORDS = frozenset("""
+a an the and or but of to in on at for with from by as is are was were be been
+has have had it its this that these those he she they we you i not will would
+can could said says after over about into than more
+""".split())
+ENGLISH_WORD_RATIO = 0.2
+_WORD_RE = re.compile(r"[A-Za-z']+")
+
 
 class LanguageDetector:
+    def __init__(self):
+        # Load langdetect's profiles now instead of on the first request
+        init_factory()
+
+    def _script_guess(self, prefix):
+        """
+        Returns a language code when the Unicode blocks settle it, else None.
+        """
+        counts = {name: len(pattern.findall(prefix)) for name, (pattern, _) in SCRIPTS.items()}
+        total = sum(counts.values())
+        if not total:
+            return None
+
+        script = max(counts, key=counts.get)
+        share = counts[script] / total
+
+        if script != "latin":
+            return SCRIPTS[script][1] if share >= SCRIPT_THRESHOLD else None
+
+        if share < LATIN_THRESHOLD:
+            return None
+
+        words = _WORD_RE.findall(prefix.lower())
+        if words and sum(w in ENGLISH_FUNCTION_WORDS for w in words) / len(words) >= ENGLISH_WORD_RATIO:
+            return "en"
+        return None
+
     def detect_language(self, text):
+        prefix = text[:PREFIX_CHARS]
+
+        lang = self._script_guess(prefix)
+        if lang is not None:
+            return lang
+
         try:
-            return detect(text)
+            return detect(prefix)
         except:
             return "unknown"
+
+    def detect_languages(self, texts):
+        """
+        Batch form of detect_language().
+        """
+        return [self.detect_language(text) for text in texts]
@@ -0,0 +1,98 @@
+import json
+from collections import deque
+
+
+class PatternMatcher:
+    """
+    Aho-Corasick automaton over several named pattern sets.
+
+    All patterns are matched as lowercase substrings in one linear pass over
+    the text, so the cost of a scan does not grow with the number of patterns.
+    """
+
+    def __init__(self, pattern_sets):
+        self.pattern_sets = {
+            name: [p.lower() for p in patterns]
+            for name, patterns in pattern_sets.items()
+        }
+
+        # state 0 is the root
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+
+        for name, patterns in self.pattern_sets.items():
+            for idx, pattern in enumerate(patterns):
+                if pattern:
+                    self._add(pattern, (name, idx))
+
+        self._build_failure_links()
+
+    @classmethod
+    def from_config(cls, path):
+        """
+        Loads pattern sets from a JSON file: {"set_name": ["pattern", ...], ...}
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _add(self, pattern, label):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (label,)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+
+                # inherit matches that end at the failure state
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def scan(self, text):
+        """
+        Returns {set_name: [matched patterns]} for every configured set.
+        Matches keep the order of the pattern list, like a loop of
+        `pattern in text.lower()` checks would.
+        """
+        return self.scan_lower(text.lower())
+
+    def scan_lower(self, text_lower):
+        """
+        scan() for text that is already lowercased.
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+
+        hits = set()
+        state = 0
+
+        for ch in text_lower:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                hits.update(out[state])
+
+        matches = {name: [] for name in self.pattern_sets}
+        for name, idx in sorted(hits, key=lambda h: (h[0], h[1])):
+            matches[name].append(self.pattern_sets[name][idx])
+
+        return matches
@@ -1,35 +1,184 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
 from deep_translator import GoogleTranslator
 
+from src.utils.cache import build_cache, content_hash
+from src.utils.circuit_breaker import CircuitBreaker
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+
+# Shared on-disk store for all gunicorn workers; set TRANSLATION_CACHE_PATH=""
+# to keep the cache in-process only.
+TRANSLATION_CACHE_PATH = os.environ.get(
+    "TRANSLATION_CACHE_PATH",
+    os.path.join(BASE_DIR, "artifacts", "cache", "translations.sqlite")
+)
+TRANSLATION_CACHE_TTL = int(os.environ.get("TRANSLATION_CACHE_TTL", str(7 * 24 * 3600)))
+TRANSLATION_CACHE_MEMORY_ENTRIES = int(os.environ.get("TRANSLATION_CACHE_MEMORY_ENTRIES", "10000"))
+TRANSLATION_CACHE_DISK_ENTRIES = int(os.environ.get("TRANSLATION_CACHE_DISK_ENTRIES", "200000"))
+
+# Languages the model scores without translation (comma separated codes)
+NATIVE_LANGUAGES = {
+    lang.strip() for lang in os.environ.get("TRANSLATION_NATIVE_LANGS", "en").split(",") if lang.strip()
+}
+# Seconds a request waits for the translation backend before scoring untranslated
+TRANSLATION_TIMEOUT = float(os.environ.get("TRANSLATION_TIMEOUT", "3.0"))
+TRANSLATION_WORKERS = int(os.environ.get("TRANSLATION_WORKERS", "8"))
+TRANSLATION_BREAKER_FAILURES = int(os.environ.get("TRANSLATION_BREAKER_FAILURES", "5"))
+TRANSLATION_BREAKER_RESET = float(os.environ.get("TRANSLATION_BREAKER_RESET", "30"))
+
+# Outcome of translate_to_english_with_status()
+TRANSLATION_SKIPPED = "skipped"        # language handled natively
+TRANSLATION_DONE = "translated"        # translated (or served from cache)
+TRANSLATION_FALLBACK = "fallback"      # backend slow/down, original text used
+
+
+class TranslationUnavailable(Exception):
+    pass
+
+
+class TranslationTimeout(TranslationUnavailable):
+    """
+    The backend didn't answer in time. budget_cut is True when the wait
+    was shorter than the translator's own timeout (capped by a request's
+    latency budget), so the budget rather than the backend cut it short.
+    """
+
+    def __init__(self, message, budget_cut=False):
+        super().__init__(message)
+        self.budget_cut = budget_cut
+
+
 class Translator:
-    def __init__(self):
-        # We will use GoogleTranslator from deep-translator
-        self.en_translator = GoogleTranslator(source='auto', target='en')
+    def __init__(self, cache=None, timeout=TRANSLATION_TIMEOUT, native_languages=NATIVE_LANGUAGES):
+        # We will use GoogleTranslator from deep-translator.
+        # GoogleTranslator keeps request params on the instance, so instances
+        # are reused per target language but not shared between threads.
+        self._local = threading.local()
 
-    def translate_to_english(self, text, lang=None):
+        if cache is None:
+            cache = build_cache(
+                "translations",
+                path=TRANSLATION_CACHE_PATH,
+                ttl=TRANSLATION_CACHE_TTL,
+                memory_entries=TRANSLATION_CACHE_MEMORY_ENTRIES,
+                disk_entries=TRANSLATION_CACHE_DISK_ENTRIES
+            )
+        self.cache = cache
+
+        self.timeout = timeout
+        self.native_languages = set(native_languages)
+        self.breaker = CircuitBreaker(
+            failure_threshold=TRANSLATION_BREAKER_FAILURES,
+            reset_timeout=TRANSLATION_BREAKER_RESET
+        )
+        # Backend calls run here so a request can stop waiting on them
+        self._executor = ThreadPoolExecutor(
+            max_workers=TRANSLATION_WORKERS, thread_name_prefix="translator"
+        )
+
+    @property
+    def en_translator(self):
+        return self._get_translator("en")
+
+    def _get_translator(self, target_lang):
+        translators = getattr(self._local, "translators", None)
+        if translators is None:
+            translators = self._local.translators = {}
+
+        translator = translators.get(target_lang)
+        if translator is None:
+            translator = translators[target_lang] = GoogleTranslator(source='auto', target=target_lang)
+        return translator
+
+    def _backend_translate(self, text, target_lang, key):
+        translated = self._get_translator(target_lang).translate(text)
+        if translated:
+            # cached even if the caller already gave up waiting
+            self.cache.set(key, translated)
+        return translated
+
+    def _cached_translate(self, text, target_lang, source="auto", timeout=None):
+        """
+        Cache lookup, then a backend call bounded by timeout (default
+        self.timeout) and guarded by the circuit breaker. Raises
+        TranslationUnavailable when the backend is skipped, slow or failing
+        (TranslationTimeout when it was slow).
+        """
+        timeout = self.timeout if timeout is None else timeout
+        key = content_hash(text, source, target_lang)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        if not self.breaker.allow():
+            raise TranslationUnavailable("translation circuit open")
+
+        future = self._executor.submit(self._backend_translate, text, target_lang, key)
+        try:
+            translated = future.result(timeout=timeout)
+        except FutureTimeout:
+            # a wait cut short by a request's latency budget says nothing
+            # about the backend's health
+            budget_cut = timeout < self.timeout
+            if budget_cut:
+                self.breaker.release_trial()
+            else:
+                self.breaker.record_failure()
+            raise TranslationTimeout(f"no response within {timeout:.2f}s", budget_cut=budget_cut)
+        except Exception as e:
+            self.breaker.record_failure()
+            raise TranslationUnavailable(str(e))
+
+        self.breaker.record_success()
+        return translated
+
+    def needs_english_translation(self, text, lang=None):
+        return lang not in self.native_languages and bool(text) and len(text.strip()) >= 5
+
+    def translate_to_english_with_status(self, text, lang=None, timeout=None, fallback=True):
         """
         Translates input text to English for AI analysis.
+        Returns (text, status) where status is one of TRANSLATION_SKIPPED,
+        TRANSLATION_DONE or TRANSLATION_FALLBACK. With fallback=False,
+        TranslationUnavailable is raised instead of falling back, for
+        callers that need to know why translation failed.
         """
-        if not text or len(text.strip()) < 5:
-            return text
-        
+        if not self.needs_english_translation(text, lang):
+            return text, TRANSLATION_SKIPPED
+
         try:
-            # If lang is provided and is not 'en', force translation
             # 'auto' usually works well for deep-translator
-            return self.en_translator.translate(text)
-        except Exception as e:
+            return self._cached_translate(text, "en", timeout=timeout), TRANSLATION_DONE
+        except TranslationUnavailable as e:
+            if not fallback:
+                raise
             print(f"Translation to English failed: {e}")
-            return text
+            return text, TRANSLATION_FALLBACK
+
+    def translate_to_english(self, text, lang=None):
+        """
+        Translates input text to English for AI analysis.
+        """
+        return self.translate_to_english_with_status(text, lang)[0]
+
+    def needs_target_translation(self, text, target_lang):
+        return bool(text) and target_lang != 'en' and len(text.strip()) >= 5
 
-    def translate_to_target(self, text, target_lang):
+    def translate_to_target(self, text, target_lang, timeout=None):
         """
         Translates text to a specific target language (e.g., 'hi', 'te').
         """
-        if not text or target_lang == 'en' or len(text.strip()) < 5:
+        if not self.needs_target_translation(text, target_lang):
             return text
 
         try:
-            translator = GoogleTranslator(source='auto', target=target_lang)
-            return translator.translate(text)
-        except Exception as e:
+            return self._cached_translate(text, target_lang, timeout=timeout)
+        except TranslationUnavailable as e:
             print(f"Translation to {target_lang} failed: {e}")
             return text
+
+    def cache_stats(self):
+        return self.cache.stats()
@@ -9,6 +9,7 @@ from sklearn.model_selection import train_test_split
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.data.data_loader import DataLoader
+from src.features.feature_store import FeatureStore
 from src.models.model_trainer import ModelTrainer
 from src.models.model_calibration import ModelCalibrator
 from src.models.threshold_optimizer import ThresholdOptimizer
@@ -21,16 +22,20 @@ def main():
     data_loader = DataLoader() # Assuming data is in 'data/processed' relative to root or we pass full paths
     base_path = r"c:\project\fake_news_detection_media_integrity\data\processed"
     
-    # Use pickle loading as per our update
+    # Feature matrices are memory-mapped from the feature store, labels unpickled
     print("Loading data...")
+    store = FeatureStore(os.path.join(base_path, "features"))
     try:
-        X_train = data_loader.load_pickle(os.path.join(base_path, "X_train.pkl"))
+        X_train = store.load("X_train")
         y_train = data_loader.load_pickle(os.path.join(base_path, "y_train.pkl"))
-        X_test = data_loader.load_pickle(os.path.join(base_path, "X_test.pkl"))
+        X_test = store.load("X_test")
         y_test = data_loader.load_pickle(os.path.join(base_path, "y_test.pkl"))
     except Exception as e:
         print(f"Error loading data: {e}")
         return
+    if X_train is None or X_test is None:
+        print("Error loading data: no feature matrices in", store.root)
+        return
 
     # 2. Prepare Data Splits
     # Split Train -> Train (for tuning) / Val (for calibration & thresholding)
@@ -0,0 +1,257 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from src.utils.metrics import record_cache_lookup
+
+
+def content_hash(*parts):
+    """
+    Stable sha256 key for any number of string parts.
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(str(part).encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU with a per-entry TTL.
+    """
+
+    def __init__(self, max_entries=10000, ttl=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > time.time():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        expires = time.time() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SQLiteCache:
+    """
+    On-disk key/value store shared by every process that opens the same file
+    (e.g. all gunicorn workers). Values are stored as JSON; entries expire
+    after ttl seconds and the least recently used ones are evicted once the
+    table grows past max_entries.
+
+    Hits are read-only: an entry's access time is only refreshed once it
+    is more than TOUCH_AFTER seconds old, so hot keys don't turn every
+    read into a write transaction. Eviction order is exact to that many
+    seconds.
+    """
+
+    # Evict in batches so we don't run a DELETE on every insert
+    EVICT_EVERY = 100
+    # Seconds before a hit refreshes the entry's access time
+    TOUCH_AFTER = 60
+
+    def __init__(self, path, ttl=None, max_entries=100000, table="cache"):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.table = table
+        self.hits = 0
+        self.misses = 0
+
+        self._local = threading.local()
+        self._writes = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._conn()
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires REAL, accessed REAL NOT NULL)"
+        )
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {self.table}_accessed ON {self.table}(accessed)"
+        )
+        conn.commit()
+
+    def _conn(self):
+        # sqlite connections can't cross threads or forks, so keep one per
+        # (thread, pid)
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key, default=None):
+        now = time.time()
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                f"SELECT value, expires, accessed FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and (row[1] is None or row[1] > now):
+                if now - row[2] > self.TOUCH_AFTER:
+                    # other processes may have refreshed it meanwhile
+                    conn.execute(
+                        f"UPDATE {self.table} SET accessed = ? WHERE key = ? AND accessed < ?",
+                        (now, key, now - self.TOUCH_AFTER)
+                    )
+                    conn.commit()
+                self.hits += 1
+                return json.loads(row[0])
+        except sqlite3.Error as e:
+            print(f"Cache read failed ({self.path}): {e}")
+        self.misses += 1
+        return default
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        expires = now + ttl if ttl else None
+        try:
+            conn = self._conn()
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires, now)
+            )
+            conn.commit()
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self.evict()
+        except sqlite3.Error as e:
+            print(f"Cache write failed ({self.path}): {e}")
+
+    def delete(self, key):
+        conn = self._conn()
+        conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+        conn.commit()
+
+    def evict(self):
+        """
+        Drops expired entries, then the least recently used ones above
+        max_entries.
+        """
+        conn = self._conn()
+        conn.execute(
+            f"DELETE FROM {self.table} WHERE expires IS NOT NULL AND expires <= ?",
+            (time.time(),)
+        )
+        conn.execute(
+            f"DELETE FROM {self.table} WHERE key IN ("
+            f"SELECT key FROM {self.table} ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        conn.commit()
+
+    def clear(self):
+        conn = self._conn()
+        conn.execute(f"DELETE FROM {self.table}")
+        conn.commit()
+
+    def __len__(self):
+        return self._conn().execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+
+class TieredCache:
+    """
+    In-process LRU in front of an optional shared SQLiteCache. Disk hits are
+    promoted into memory.
+    """
+
+    def __init__(self, memory, disk=None, name=None):
+        self.memory = memory
+        self.disk = disk
+        self.name = name
+
+    def get(self, key, default=None):
+        value = self.memory.get(key)
+        if value is not None:
+            self._record("memory_hit")
+            return value
+
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+                self._record("disk_hit")
+                return value
+
+        self._record("miss")
+        return default
+
+    def _record(self, result):
+        if self.name:
+            record_cache_lookup(self.name, result)
+
+    def set(self, key, value, ttl=None):
+        self.memory.set(key, value, ttl)
+        if self.disk is not None:
+            self.disk.set(key, value, ttl)
+
+    def delete(self, key):
+        self.memory.delete(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def stats(self):
+        memory_hits = self.memory.hits
+        disk_hits = self.disk.hits if self.disk is not None else 0
+        lookups = self.memory.hits + self.memory.misses
+        misses = lookups - memory_hits - disk_hits
+
+        return {
+            "memory_hits": memory_hits,
+            "disk_hits": disk_hits,
+            "misses": misses,
+            "hit_ratio": round((memory_hits + disk_hits) / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self.memory)
+        }
+
+
+def build_cache(name, path=None, ttl=None, memory_entries=10000, disk_entries=100000):
+    """
+    TieredCache with an optional SQLite layer; path=None (or "") keeps the
+    cache in-process only.
+    """
+    memory = LRUCache(max_entries=memory_entries, ttl=ttl)
+    disk = SQLiteCache(path, ttl=ttl, max_entries=disk_entries, table=name) if path else None
+    return TieredCache(memory, disk, name=name)
@@ -1,3 +1,5 @@
+import glob
+import hashlib
 import pickle
 import os
 
@@ -9,3 +11,15 @@ def save_pickle(obj, filepath):
 def load_pickle(filepath):
     with open(filepath, "rb") as f:
         return pickle.load(f)
+
+def artifact_version(model_dir, pattern="*.pkl"):
+    """
+    Short sha256 over the names and contents of the model artifacts.
+    """
+    h = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(model_dir, pattern))):
+        h.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+    return h.hexdigest()[:16]
@@ -0,0 +1,68 @@
+import os
+import time
+
+# Default latency budget (ms) for /predict; 0 = no budget
+PREDICT_BUDGET_MS = float(os.environ.get("PREDICT_BUDGET_MS", "0"))
+# Smallest wait (seconds) handed to a backend call, so a nearly spent
+# budget still gives a cache-warm backend a chance
+MIN_STAGE_TIMEOUT = 0.05
+
+# Optional stages and the share of the budget that must still be left for
+# them to run. The larger the share, the earlier the stage is given up:
+# display translation first, then sentiment, then English translation.
+DEGRADABLE_STAGES = {
+    "display_translation": 0.5,
+    "sentiment": 0.3,
+    "translation": 0.15
+}
+
+
+class Deadline:
+    """
+    Latency budget of one request, started when the request arrived.
+    Optional stages ask allows(stage) before running; stages refused are
+    collected in degraded, in the order they were skipped. Required
+    stages that wait on a backend bound their wait with timeout().
+    """
+
+    def __init__(self, budget_ms, start=None):
+        self.budget_ms = float(budget_ms)
+        self.start = time.perf_counter() if start is None else start
+        self.degraded = []
+
+    @classmethod
+    def from_request(cls, budget_ms=None, start=None):
+        """
+        Deadline for budget_ms (or PREDICT_BUDGET_MS), None when there is
+        no budget.
+        """
+        budget_ms = PREDICT_BUDGET_MS if budget_ms is None else float(budget_ms)
+        if budget_ms <= 0:
+            return None
+        return cls(budget_ms, start)
+
+    def remaining_ms(self):
+        return self.budget_ms - (time.perf_counter() - self.start) * 1000
+
+    def allows(self, stage):
+        """
+        True when enough budget is left for the optional stage; otherwise
+        records it as degraded and returns False.
+        """
+        if self.remaining_ms() >= self.budget_ms * DEGRADABLE_STAGES[stage]:
+            return True
+        self.skipped(stage)
+        return False
+
+    def skipped(self, stage):
+        """
+        Records a stage that ran out of budget while it was running.
+        """
+        if stage not in self.degraded:
+            self.degraded.append(stage)
+
+    def timeout(self, default):
+        """
+        default (seconds) capped by what is left of the budget.
+        """
+        return max(min(default, self.remaining_ms() / 1000), MIN_STAGE_TIMEOUT)
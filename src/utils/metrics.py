@@ -0,0 +1,149 @@
+import functools
+import os
+import time
+from contextvars import ContextVar
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram,
+    generate_latest, multiprocess
+)
+
+# Set this (to an empty, writable directory) when running several worker
+# processes, e.g. under gunicorn; every process then writes its samples
+# there and /metrics aggregates them.
+MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+# 100us .. 30s: pattern scans and model scoring sit at the low end,
+# translation and URL downloads at the high end
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+STAGE_SECONDS = Histogram(
+    "fakenews_stage_seconds",
+    "Time spent in one stage of the analysis pipeline",
+    ["stage"],
+    buckets=LATENCY_BUCKETS
+)
+REQUEST_SECONDS = Histogram(
+    "fakenews_http_request_seconds",
+    "HTTP request latency until the response (or its first chunk) is ready",
+    ["endpoint", "method", "status"],
+    buckets=LATENCY_BUCKETS
+)
+PREDICTIONS = Counter(
+    "fakenews_predictions_total",
+    "Predictions by decision mode and label",
+    ["mode", "prediction"]
+)
+CACHE_LOOKUPS = Counter(
+    "fakenews_cache_lookups_total",
+    "Cache lookups by cache and outcome (memory_hit, disk_hit, miss)",
+    ["cache", "result"]
+)
+
+MICRO_BATCH_SIZE = Histogram(
+    "fakenews_micro_batch_size",
+    "Texts scored together by the /predict micro-batcher",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
+MICRO_BATCH_WAIT = Histogram(
+    "fakenews_micro_batch_wait_seconds",
+    "Longest time a text of a micro-batch waited before scoring started",
+    buckets=LATENCY_BUCKETS
+)
+
+
+# Stage durations (ms) of the request being handled, see track_timings()
+_request_timings = ContextVar("request_timings", default=None)
+
+
+class stage:
+    """
+    Times a pipeline stage into fakenews_stage_seconds{stage=name}, and into
+    the current request's timings when track_timings() was called. Works as
+    a context manager or a decorator:
+
+        with stage("translation"):
+            ...
+
+        @stage("sentiment")
+        def get_sentiment(text): ...
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._histogram = STAGE_SECONDS.labels(stage=name)
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._start
+        self._histogram.observe(elapsed)
+
+        timings = _request_timings.get()
+        if timings is not None:
+            timings[self.name] = timings.get(self.name, 0.0) + elapsed * 1000
+        return False
+
+    def __call__(self, func):
+        # a fresh timer per call, so decorated functions are thread-safe
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(self.name):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def track_timings():
+    """
+    Starts collecting stage durations for the current request (thread /
+    context) and returns the dict they are added to, {stage: milliseconds}.
+    A stage that runs several times is summed; nested stages (url_download
+    inside url_extraction) are listed separately.
+    """
+    timings = {}
+    _request_timings.set(timings)
+    return timings
+
+
+def record_prediction(result):
+    PREDICTIONS.labels(mode=result.get("mode"), prediction=result.get("prediction")).inc()
+
+
+def record_micro_batch(size, wait_seconds):
+    MICRO_BATCH_SIZE.observe(size)
+    MICRO_BATCH_WAIT.observe(wait_seconds)
+
+
+def record_cache_lookup(cache, result):
+    CACHE_LOOKUPS.labels(cache=cache, result=result).inc()
+
+
+def record_request(endpoint, method, status, seconds):
+    REQUEST_SECONDS.labels(endpoint=endpoint or "unknown", method=method, status=str(status)).observe(seconds)
+
+
+def render_metrics():
+    """
+    Returns (body, content_type) in the Prometheus text format, aggregated
+    over all worker processes in multiprocess mode.
+    """
+    if MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid):
+    """
+    Call from gunicorn's child_exit hook so a dead worker's live samples
+    are dropped (counters and histograms are kept).
+    """
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,29 @@
+"""
+Batch PDF reports built from client-posted results.
+
+    python -m pytest tests/test_batch_report.py
+"""
+import io
+import unittest
+
+from src.api.reports import _position, build_batch_report
+
+
+class BatchReportTest(unittest.TestCase):
+    def test_only_int_index_is_used(self):
+        results = [{"index": "3"}, {"index": None}, {"index": True}, {"index": 7}, {}]
+        self.assertEqual([_position(r, i) for i, r in enumerate(results)], [1, 2, 3, 8, 5])
+
+    def test_malformed_results_still_build(self):
+        results = [
+            {"index": "3", "prediction": "Real", "confidence": "0.9"},
+            {"index": None, "prediction": ["Fake"], "mode": {"ml": 1}, "type": [1, 2]},
+            {"index": 2, "error": "Empty input"}
+        ]
+        output = io.BytesIO()
+        build_batch_report(results, output)
+        self.assertTrue(output.getvalue().startswith(b"%PDF"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Which translation fallbacks count as budget degradation.
+
+    python -m pytest tests/test_translation_budget.py
+"""
+import threading
+import unittest
+
+from src.inference.predictor import FakeNewsPredictor
+from src.preprocessing.analysis_document import AnalysisDocument
+from src.preprocessing.translator import TRANSLATION_FALLBACK, Translator
+from src.utils.cache import build_cache
+from src.utils.deadline import Deadline
+
+HINDI_TEXT = "सरकार ने देश भर में नवीकरणीय ऊर्जा परियोजनाओं के लिए नई नीति की घोषणा की"
+
+
+class FailingBackend:
+    def translate(self, text):
+        raise ConnectionError("Name or service not known")
+
+
+class SlowBackend:
+    def __init__(self):
+        self.release = threading.Event()
+
+    def translate(self, text):
+        self.release.wait(5)
+        return "translated"
+
+
+class StandInLanguageDetector:
+    def detect_language(self, text):
+        return "hi"
+
+
+class StandInExpander:
+    def expand(self, text_or_doc):
+        return getattr(text_or_doc, "text", text_or_doc)
+
+
+def translator_with(backend, timeout=3.0):
+    translator = Translator(cache=build_cache("translations", path=""), timeout=timeout)
+    translator._get_translator = lambda target_lang: backend
+    return translator
+
+
+def predictor_with(translator):
+    # only what _prepare_ml_text uses, no model artifacts
+    predictor = FakeNewsPredictor.__new__(FakeNewsPredictor)
+    predictor.lang_detector = StandInLanguageDetector()
+    predictor.translator = translator
+    predictor.expander = StandInExpander()
+    return predictor
+
+
+class TranslationBudgetTest(unittest.TestCase):
+    def prepare(self, translator, budget_ms):
+        deadline = Deadline(budget_ms)
+        explanation = []
+        _, status = predictor_with(translator)._prepare_ml_text(
+            AnalysisDocument(HINDI_TEXT), explanation, deadline
+        )
+        return status, deadline.degraded
+
+    def test_backend_error_is_not_budget_degradation(self):
+        status, degraded = self.prepare(translator_with(FailingBackend()), budget_ms=300)
+        self.assertEqual(status, TRANSLATION_FALLBACK)
+        self.assertEqual(degraded, [])
+
+    def test_open_breaker_is_not_budget_degradation(self):
+        translator = translator_with(FailingBackend())
+        translator.breaker.allow = lambda: False
+        status, degraded = self.prepare(translator, budget_ms=300)
+        self.assertEqual(status, TRANSLATION_FALLBACK)
+        self.assertEqual(degraded, [])
+
+    def test_wait_cut_short_by_budget_is_degradation(self):
+        backend = SlowBackend()
+        try:
+            status, degraded = self.prepare(translator_with(backend), budget_ms=300)
+        finally:
+            backend.release.set()
+        self.assertEqual(status, TRANSLATION_FALLBACK)
+        self.assertEqual(degraded, ["translation"])
+
+
+if __name__ == "__main__":
+    unittest.main()